@@ -24,4 +24,12 @@ class JobApplicationAdmin(TimestampedAdmin):
 class TPCNotificationAdmin(TimestampedAdmin):
     list_display = ('title', 'created_at')
     ordering = ['-created_at']
-    search_fields = ['title']
\ No newline at end of file
+    search_fields = ['title']
+
+@admin.register(NotificationRecipient)
+class NotificationRecipientAdmin(TimestampedAdmin):
+    list_display = ('user', 'notification', 'is_read', 'created_at')
+    list_filter = ['is_read']
+    list_select_related = ['user', 'notification']
+    ordering = ['-created_at']
+    raw_id_fields = ['user', 'notification']
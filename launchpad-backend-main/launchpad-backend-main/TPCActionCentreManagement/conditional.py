@@ -0,0 +1,92 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from launchpad.fastread import aserialize_list, serialize_list
+from studentKeyFeatureManagement.downloads import not_modified
+
+
+def _validators_from_stats(request, stats):
+    last_modified = stats['last_modified']
+    fingerprint = f"{stats['total']}:{last_modified.isoformat() if last_modified else ''}:{request.GET.urlencode()}"
+    etag = quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+    return etag, last_modified, stats['total']
+
+
+def list_validators(request, queryset):
+    """
+    Cheap validators for a list: one aggregate query for the newest updated_at and the row count
+    The count catches deletions, which never move Max(updated_at)
+    """
+    return _validators_from_stats(request, queryset.aggregate(last_modified=Max('updated_at'), total=Count('id')))
+
+
+async def alist_validators(request, queryset):
+    return _validators_from_stats(request, await queryset.aaggregate(last_modified=Max('updated_at'), total=Count('id')))
+
+
+def _set_validators(response, etag, last_modified, total):
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    response['X-Total-Count'] = str(total)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def _parse_since(request):
+    """Returns (since, error_response); since is None when the param is absent"""
+    since = request.query_params.get('since')
+    if not since:
+        return None, None
+    try:
+        since = parse_datetime(since)
+    except ValueError:  # well formed but impossible, e.g. month 13
+        since = None
+    if since is None:
+        return None, Response(
+            {"error": "since must be an ISO 8601 timestamp, e.g. 2025-07-01T09:00:00Z"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since, None
+
+
+def conditional_list_response(request, queryset, serializer_class):
+    """
+    Serialize a list only when the client's copy is stale
+    Answers If-None-Match/If-Modified-Since with 304 before any serialization;
+    ?since=<ISO timestamp> returns only rows updated after it
+    """
+    since, error = _parse_since(request)
+    if error:
+        return error
+
+    etag, last_modified, total = list_validators(request, queryset)
+    if not_modified(request, etag, last_modified.timestamp() if last_modified else 0):
+        return _set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified, total)
+
+    if since:
+        queryset = queryset.filter(updated_at__gt=since)
+    return _set_validators(Response(serialize_list(serializer_class, queryset)), etag, last_modified, total)
+
+
+async def aconditional_list_response(request, queryset, serializer_class):
+    """Async ORM twin of conditional_list_response"""
+    since, error = _parse_since(request)
+    if error:
+        return error
+
+    etag, last_modified, total = await alist_validators(request, queryset)
+    if not_modified(request, etag, last_modified.timestamp() if last_modified else 0):
+        return _set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified, total)
+
+    if since:
+        queryset = queryset.filter(updated_at__gt=since)
+    return _set_validators(Response(await aserialize_list(serializer_class, queryset)), etag, last_modified, total)
@@ -0,0 +1,158 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+NOTIFICATION_CREATED = 'notification.created'
+JOB_POST_CREATED = 'job_post.created'
+
+# Tells EventSource how long to wait before reconnecting (milliseconds)
+RETRY_MS = 3000
+HEARTBEAT_FRAME = b': heartbeat\n\n'
+# Put on a subscriber queue that fell behind; the stream ends and the client resumes via Last-Event-ID
+OVERFLOW = None
+
+
+class Event:
+    __slots__ = ('id', 'type', 'target_branch', 'target_batch', 'frame')
+
+    def __init__(self, event_id, event_type, data):
+        self.id = event_id
+        self.type = event_type
+        self.target_branch = data.get('target_branch') or ''
+        self.target_batch = data.get('target_batch') or ''
+        # Rendered once at publish time and shared by every subscriber
+        payload = json.dumps(data, cls=JSONEncoder, separators=(',', ':'))
+        self.frame = f'id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n'.encode()
+
+    def visible_to(self, branch, batch):
+        """None branch/batch means the subscriber sees everything (TPC staff)"""
+        if branch is None:
+            return True
+        return self.target_branch in ('', branch) and self.target_batch in ('', batch)
+
+
+class LocalBroker:
+    """
+    In-process pub/sub with a bounded replay history
+    Stand-in for a shared backend: only subscribers in the publishing worker receive events, so
+    deployments running several workers should point EVENT_STREAM_BROKER at a broker that
+    implements publish/subscribe/unsubscribe/replay over a shared channel (e.g. Redis pub/sub)
+    """
+
+    def __init__(self, history_size=1000, queue_size=100):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._latest_id = 0
+        self._history = deque(maxlen=history_size)
+        self._subscribers = {}
+        self._queue_size = queue_size
+
+    def publish(self, event_type, data):
+        """Thread-safe; callable from sync views running outside the event loop"""
+        with self._lock:
+            event = Event(next(self._ids), event_type, data)
+            self._latest_id = event.id
+            self._history.append(event)
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:
+                # Loop already closed; the subscriber is gone
+                self.unsubscribe(queue)
+        return event
+
+    @staticmethod
+    def _offer(queue, event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(OVERFLOW)
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self._queue_size)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue):
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def replay(self, last_event_id):
+        """
+        Events published after last_event_id, or None when the history no longer reaches back that far
+        (or the id came from before a restart)
+        """
+        with self._lock:
+            history = list(self._history)
+            latest_id = self._latest_id
+        if last_event_id > latest_id:
+            return None
+        if last_event_id == latest_id:
+            return []
+        if not history or last_event_id < history[0].id - 1:
+            return None
+        return [event for event in history if event.id > last_event_id]
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    broker_class = import_string(getattr(settings, 'EVENT_STREAM_BROKER', 'TPCActionCentreManagement.events.LocalBroker'))
+    return broker_class(history_size=getattr(settings, 'EVENT_STREAM_HISTORY', 1000))
+
+
+def publish(event_type, data):
+    return get_broker().publish(event_type, data)
+
+
+async def event_stream(last_event_id=None, branch=None, batch=None, heartbeat=None):
+    """
+    Async generator of SSE frames for one connection
+    Idle connections cost one queue and one suspended coroutine; a comment frame is sent
+    every `heartbeat` seconds so proxies keep the connection open
+    """
+    broker = get_broker()
+    heartbeat = heartbeat or getattr(settings, 'EVENT_STREAM_HEARTBEAT', 15)
+    # Subscribe before replaying so nothing published in between is lost; duplicates are skipped by id
+    queue = broker.subscribe()
+    try:
+        yield f'retry: {RETRY_MS}\n\n'.encode()
+        if last_event_id is not None:
+            missed = broker.replay(last_event_id)
+            if missed is None:
+                # Too far behind to replay: the client should refetch the lists
+                yield b'event: reset\ndata: {}\n\n'
+                last_event_id = None
+            else:
+                for event in missed:
+                    last_event_id = event.id
+                    if event.visible_to(branch, batch):
+                        yield event.frame
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_FRAME
+                continue
+            if event is OVERFLOW:
+                return
+            if last_event_id is not None and event.id <= last_event_id:
+                continue
+            if event.visible_to(branch, batch):
+                yield event.frame
+    finally:
+        broker.unsubscribe(queue)
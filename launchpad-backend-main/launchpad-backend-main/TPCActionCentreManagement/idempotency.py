@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+IDEMPOTENCY_TIMEOUT = 60 * 60 * 24
+MAX_KEY_LENGTH = 128
+
+
+def _cache_key(request):
+    key = request.META.get(IDEMPOTENCY_HEADER, '').strip()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        return None
+    return f'idempotency:{request.user.pk}:{request.path}:{key}'
+
+
+def replay_response(request):
+    """
+    Return the stored response for a repeated Idempotency-Key, or None on first use
+    """
+    cache_key = _cache_key(request)
+    if cache_key is None:
+        return None
+    stored = cache.get(cache_key)
+    if stored is None:
+        return None
+    status_code, data = stored
+    response = Response(data, status=status_code)
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def remember_response(request, response):
+    """
+    Store a successful response so retries with the same Idempotency-Key replay it
+    """
+    cache_key = _cache_key(request)
+    if cache_key is not None and response.status_code < 400:
+        cache.set(cache_key, (response.status_code, response.data), IDEMPOTENCY_TIMEOUT)
+    return response
@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from userManagement.models import CustomUser
+from userManagement.filters import filter_students
+from .models import NotificationRecipient
+
+FAN_OUT_BATCH_SIZE = 1000
+# Counts live in the shared 'default' cache, so every worker sees an invalidation; the TTL only
+# bounds how long a count can survive a write that bypassed these helpers (admin, shell)
+UNREAD_CACHE_TIMEOUT = 5 * 60
+
+
+def unread_cache_key(user_id):
+    return f'inbox:unread:{user_id}'
+
+
+def invalidate_unread_counts(user_ids):
+    keys = [unread_cache_key(user_id) for user_id in user_ids]
+    for start in range(0, len(keys), FAN_OUT_BATCH_SIZE):
+        cache.delete_many(keys[start:start + FAN_OUT_BATCH_SIZE])
+
+
+def unread_count(user_id):
+    """Unread notifications for a user, served from cache after the first indexed count"""
+    key = unread_cache_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = NotificationRecipient.objects.filter(user_id=user_id, is_read=False).count()  # type: ignore
+        cache.set(key, count, UNREAD_CACHE_TIMEOUT)
+    return count
+
+
+def recipients_for(notification):
+    students = CustomUser.objects.filter(is_tpcstaff=False, is_active=True)  # type: ignore
+    return filter_students(students, {'branch': notification.target_branch, 'batch': notification.target_batch})
+
+
+@transaction.atomic(savepoint=False)  # Callers creating the notification wrap both; a failure rolls all of it back
+def fan_out(notification):
+    """
+    Write one inbox row per targeted student in batched inserts
+    Returns the number of recipients
+    """
+    user_ids = list(recipients_for(notification).order_by('id').values_list('id', flat=True))
+    for start in range(0, len(user_ids), FAN_OUT_BATCH_SIZE):
+        NotificationRecipient.objects.bulk_create(  # type: ignore
+            [NotificationRecipient(notification=notification, user_id=user_id) for user_id in user_ids[start:start + FAN_OUT_BATCH_SIZE]],
+            ignore_conflicts=True,
+        )
+    # Invalidate after commit so a concurrent read can't cache the pre-fan-out count
+    transaction.on_commit(lambda: invalidate_unread_counts(user_ids))
+    return len(user_ids)
+
+
+def mark_read(user_id, recipient_ids=None):
+    """Mark some (or all, when recipient_ids is None) of a user's inbox rows read; returns rows changed"""
+    queryset = NotificationRecipient.objects.filter(user_id=user_id, is_read=False)  # type: ignore
+    if recipient_ids is not None:
+        queryset = queryset.filter(id__in=recipient_ids)
+    updated = queryset.update(is_read=True, read_at=timezone.now(), updated_at=timezone.now())
+    if updated:
+        transaction.on_commit(lambda: invalidate_unread_counts([user_id]))
+    return updated
+
+
+def forget_notification(notification):
+    """Drop cached unread counts of everyone who received a notification that is being deleted"""
+    user_ids = list(notification.recipients.filter(is_read=False).values_list('user_id', flat=True))
+    transaction.on_commit(lambda: invalidate_unread_counts(user_ids))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+
+from TPCActionCentreManagement.models import JobApplication
+
+
+class Command(BaseCommand):
+    help = "Delete duplicate job applications, keeping the earliest per (job post, student). Run before applying the unique constraint migration."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Report duplicates without deleting them")
+
+    def handle(self, *args, **options):
+        duplicates = JobApplication.objects.values('job_post', 'student') \
+            .annotate(total=Count('id'), keep=Min('id')).filter(total__gt=1)  # type: ignore
+        deleted = 0
+        with transaction.atomic():
+            for row in list(duplicates):
+                extra = JobApplication.objects.filter(job_post=row['job_post'], student=row['student']).exclude(id=row['keep'])  # type: ignore
+                if options['dry_run']:
+                    deleted += extra.count()
+                else:
+                    deleted += extra.delete()[1].get(JobApplication._meta.label, 0)
+        action = "Would delete" if options['dry_run'] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(f"{action} {deleted} duplicate job applications"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from TPCActionCentreManagement.search import fts_supported, reindex_job_posts
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for job posts"
+
+    def handle(self, *args, **options):
+        if not fts_supported():
+            self.stdout.write(self.style.WARNING("Database has no FTS5 support; job post search uses the LIKE fallback"))
+            return
+        total = reindex_job_posts()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} job posts"))
@@ -1,6 +1,6 @@
 from django.db import models
 from userManagement.models import CustomUser
-from studentKeyFeatureManagement.models import StudentResume
+from studentKeyFeatureManagement.models import StudentResume, Skill
 
 # Create your models here.
 
@@ -22,9 +22,15 @@ class JobPost(BaseModel):
     job_type = models.CharField(max_length=255)
     eligibility = models.CharField(max_length=255)
     skills_required = models.CharField(max_length=255)
+    skills = models.ManyToManyField(Skill, related_name='job_posts', blank=True)
     is_active = models.BooleanField(default=True) # type: ignore
     created_by = models.ForeignKey(CustomUser, on_delete=models.SET_NULL, related_name='created_job_posts', null=True, blank=True, limit_choices_to={'is_tpcstaff': True})
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='jobpost_updated_at_idx'),
+        ]
+
     def __str__(self):
         return f"{self.comapany_name} - {self.offered_position}"
 
@@ -34,6 +40,11 @@ class JobApplication(BaseModel):
     student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='job_applications')
     resume = models.ForeignKey(StudentResume, on_delete=models.SET_NULL, related_name='job_applications', null=True, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job_post', 'student'], name='unique_job_application'),
+        ]
+
     def __str__(self):
         return f"{self.student} - {self.job_post}"
 
@@ -41,7 +52,44 @@ class JobApplication(BaseModel):
 class TPCNotification(BaseModel):
     title = models.CharField(max_length=255)
     message = models.TextField()
+    # Empty targets mean every student
+    target_branch = models.CharField(max_length=100, blank=True, default='')
+    target_batch = models.CharField(max_length=100, blank=True, default='')
     created_by = models.ForeignKey(CustomUser, on_delete=models.SET_NULL, related_name='created_notifications', null=True, blank=True, limit_choices_to={'is_tpcstaff': True})
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='notification_updated_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title}"
+
+
+# Per-student copy of a notification carrying the read state, written in bulk when a notification is posted
+class NotificationRecipient(BaseModel):
+    notification = models.ForeignKey(TPCNotification, on_delete=models.CASCADE, related_name='recipients')
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='notification_inbox')
+    is_read = models.BooleanField(default=False) # type: ignore
+    read_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'notification'], name='unique_notification_recipient'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'is_read'], name='inbox_user_unread_idx'),
+            models.Index(fields=['user', '-id'], name='inbox_user_recent_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.notification}"
+
+
+# Named counters that must never go backwards, kept in the database because cache entries can be evicted
+class DataVersion(BaseModel):
+    name = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=1)  # type: ignore
+
     def __str__(self):
-        return f"{self.title}"
\ No newline at end of file
+        return f"{self.name}: {self.version}"
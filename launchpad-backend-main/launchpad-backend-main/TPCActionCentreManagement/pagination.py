@@ -0,0 +1,9 @@
+from rest_framework.pagination import CursorPagination
+
+
+# Newest first, keyed on the primary key so pages come from the (user, -id) index
+class InboxCursorPagination(CursorPagination):
+    ordering = '-id'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
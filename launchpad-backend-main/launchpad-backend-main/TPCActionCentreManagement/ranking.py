@@ -0,0 +1,189 @@
+import re
+import threading
+
+import numpy as np
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from userManagement.models import CustomUser
+from .models import DataVersion
+from studentKeyFeatureManagement.models import StudentInternship, StudentResume, UserSkill
+
+# Relative weight of each signal in the final score; every component is scaled to [0, 1]
+SKILL_WEIGHT = 0.5
+CPI_WEIGHT = 0.3
+INTERNSHIP_WEIGHT = 0.15
+RESUME_WEIGHT = 0.05
+MAX_CPI = 10.0
+
+SHORTLIST_VERSION_NAME = 'shortlist'
+SHORTLIST_CACHE_TIMEOUT = 60 * 60
+
+MIN_CPI_PATTERN = re.compile(r'(?:cpi|cgpa|gpa)\s*(?:of|>=|≥|>|:|above|at least|min(?:imum)?)?\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+WORD_PATTERN = re.compile(r'[\w+#.]+')
+
+
+class StudentFeatures:
+    """
+    Column-oriented snapshot of every active student, built once per data version
+    Row i of every array describes the student whose id is ids[i]
+    """
+
+    def __init__(self, version):
+        self.version = version
+        students = list(
+            CustomUser.objects.filter(is_tpcstaff=False, is_active=True).order_by('id')  # type: ignore
+            .values_list('id', 'username', 'full_name', 'academic_details__cpi', 'academic_details__branch')
+        )
+        self.ids = np.array([row[0] for row in students], dtype=np.int64)
+        self.usernames = [row[1] for row in students]
+        self.full_names = [row[2] for row in students]
+        self.cpi = np.array([np.nan if row[3] is None else row[3] for row in students], dtype=np.float32)
+        self.branches = np.array([(row[4] or '').lower() for row in students], dtype=object)
+
+        # Student x skill incidence matrix from the UserSkill inverted index
+        pairs = np.array(list(UserSkill.objects.values_list('user_id', 'skill_id')), dtype=np.int64).reshape(-1, 2)  # type: ignore
+        rows, pairs = self._rows_for(pairs[:, 0], pairs)
+        self.skill_ids, skill_columns = np.unique(pairs[:, 1], return_inverse=True)
+        self.skills = np.zeros((len(self.ids), len(self.skill_ids)), dtype=bool)
+        self.skills[rows, skill_columns] = True
+
+        # Student x approved internship domain incidence matrix
+        internships = list(StudentInternship.objects.filter(approval_status='Approved').values_list('student_id', 'domain'))  # type: ignore
+        self.domains = sorted({domain.strip().lower() for _, domain in internships})
+        domain_index = {domain: column for column, domain in enumerate(self.domains)}
+        self.internships = np.zeros((len(self.ids), len(self.domains)), dtype=bool)
+        if internships:
+            student_ids = np.array([student_id for student_id, _ in internships], dtype=np.int64)
+            columns = np.array([domain_index[domain.strip().lower()] for _, domain in internships], dtype=np.int64)
+            rows, columns = self._rows_for(student_ids, columns)
+            self.internships[rows, columns] = True
+
+        resume_owners = np.array(list(StudentResume.objects.values_list('related_user_id', flat=True).distinct()), dtype=np.int64)  # type: ignore
+        self.has_resume = np.isin(self.ids, resume_owners)
+
+    def _rows_for(self, user_ids, values):
+        """Translate user ids to matrix rows, dropping ids of users outside the snapshot"""
+        rows = np.searchsorted(self.ids, user_ids)
+        rows = np.clip(rows, 0, max(len(self.ids) - 1, 0))
+        known = (self.ids[rows] == user_ids) if len(self.ids) else np.zeros(len(user_ids), dtype=bool)
+        return rows[known], values[known]
+
+
+_features = None
+_features_lock = threading.Lock()
+
+
+def shortlist_version():
+    # A DataVersion row, not a cache key: if an evicted key restarted at 1, rankings cached under
+    # the old version 1 would be served again
+    return DataVersion.objects.filter(name=SHORTLIST_VERSION_NAME).values_list('version', flat=True).first() or 1  # type: ignore
+
+
+def _bump_shortlist_version():
+    if DataVersion.objects.filter(name=SHORTLIST_VERSION_NAME).update(version=F('version') + 1):  # type: ignore
+        return
+    try:
+        with transaction.atomic():
+            DataVersion.objects.create(name=SHORTLIST_VERSION_NAME, version=2)  # type: ignore
+    except IntegrityError:
+        # Another worker created the row first
+        DataVersion.objects.filter(name=SHORTLIST_VERSION_NAME).update(version=F('version') + 1)  # type: ignore
+
+
+def invalidate_shortlists():
+    """
+    Called by signal handlers when a record feeding the ranking changes
+    The version moves when the write commits; bumping it earlier would let a concurrent request
+    rebuild the snapshot from the old rows and cache it under the new version.
+    """
+    transaction.on_commit(_bump_shortlist_version)
+
+
+def get_student_features():
+    global _features
+    version = shortlist_version()
+    if _features is None or _features.version != version:
+        with _features_lock:
+            if _features is None or _features.version != version:
+                _features = StudentFeatures(version)
+    return _features
+
+
+def parse_eligibility(eligibility, known_branches):
+    """
+    Pull a minimum CPI and any branch names out of the free-text eligibility field
+    Returns (min_cpi or None, set of lower-cased branches, empty meaning all branches)
+    """
+    text = (eligibility or '').lower()
+    match = MIN_CPI_PATTERN.search(text)
+    min_cpi = float(match.group(1)) if match else None
+    words = set(WORD_PATTERN.findall(text))
+    branches = {branch for branch in known_branches if branch and (branch in words or (' ' in branch and branch in text))}
+    return min_cpi, branches
+
+
+def rank_students(job_post, limit=100):
+    """
+    Score every eligible student against a job post with vectorized matrix operations
+    Returns the ranked result dict; cached per job post until the data version changes
+    """
+    features = get_student_features()
+    updated = job_post.updated_at.timestamp() if job_post.updated_at else 0
+    cache_key = f'shortlist:{features.version}:{job_post.pk}:{updated}:{limit}'
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    job_skill_ids = np.array(list(job_post.skills.values_list('id', flat=True)), dtype=np.int64)
+    job_columns = np.flatnonzero(np.isin(features.skill_ids, job_skill_ids))
+    job_text = ' '.join(filter(None, [job_post.offered_position, job_post.job_description, job_post.skills_required])).lower()
+    domain_columns = [column for column, domain in enumerate(features.domains) if domain and domain in job_text]
+
+    # Eligibility mask
+    min_cpi, branches = parse_eligibility(job_post.eligibility, set(features.branches))
+    eligible = np.ones(len(features.ids), dtype=bool)
+    if min_cpi is not None:
+        eligible &= np.nan_to_num(features.cpi, nan=0.0) >= min_cpi
+    if branches:
+        eligible &= np.isin(features.branches, list(branches))
+
+    # Score components, each in [0, 1]
+    matched = features.skills[:, job_columns]
+    skill_overlap = matched.sum(axis=1)
+    skill_score = skill_overlap / len(job_skill_ids) if len(job_skill_ids) else np.zeros(len(features.ids))
+    cpi_score = np.nan_to_num(features.cpi, nan=0.0) / MAX_CPI
+    internship_match = features.internships[:, domain_columns].any(axis=1) if domain_columns else np.zeros(len(features.ids), dtype=bool)
+    score = SKILL_WEIGHT * skill_score + CPI_WEIGHT * cpi_score + INTERNSHIP_WEIGHT * internship_match + RESUME_WEIGHT * features.has_resume
+
+    candidates = np.flatnonzero(eligible)
+    top = candidates[np.argsort(-score[candidates], kind='stable')[:limit]]
+
+    skill_names = dict(job_post.skills.values_list('id', 'name'))
+    column_names = [skill_names.get(skill_id) for skill_id in features.skill_ids[job_columns]]
+    results = []
+    for row in top:
+        cpi = features.cpi[row]
+        results.append({
+            "student_id": int(features.ids[row]),
+            "username": features.usernames[row],
+            "full_name": features.full_names[row],
+            "score": round(float(score[row]), 4),
+            "skill_overlap": int(skill_overlap[row]),
+            "matched_skills": [column_names[i] for i in np.flatnonzero(matched[row])],
+            "cpi": None if np.isnan(cpi) else round(float(cpi), 2),
+            "internship_match": bool(internship_match[row]),
+            "has_resume": bool(features.has_resume[row]),
+        })
+
+    ranking = {
+        "job_post_id": job_post.pk,
+        "required_skills": sorted(skill_names.values()),
+        "min_cpi": min_cpi,
+        "branches": sorted(branches),
+        "eligible_count": int(len(candidates)),
+        "results": results,
+    }
+    cache.set(cache_key, ranking, SHORTLIST_CACHE_TIMEOUT)
+    return ranking
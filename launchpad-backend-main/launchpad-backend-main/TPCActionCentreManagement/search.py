@@ -0,0 +1,142 @@
+import re
+from functools import reduce
+from operator import and_, or_
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from .models import JobPost
+
+# SQLite FTS5 index over the searchable job post columns; rowid is the JobPost id
+FTS_TABLE = 'tpc_jobpost_fts'
+FTS_COLUMNS = ('comapany_name', 'offered_position', 'job_description', 'skills_required', 'eligibility')
+# bm25() column weights, same order as FTS_COLUMNS: company and position matches outrank description hits
+FTS_WEIGHTS = (10.0, 8.0, 1.0, 5.0, 2.0)
+REINDEX_BATCH_SIZE = 500
+
+TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+_fts_supported = None
+
+
+def fts_supported():
+    """
+    True when the default database is SQLite compiled with FTS5; other backends use the LIKE fallback
+    """
+    global _fts_supported
+    if _fts_supported is None:
+        _fts_supported = False
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA compile_options")
+                _fts_supported = any(row[0] == 'ENABLE_FTS5' for row in cursor.fetchall())
+    return _fts_supported
+
+
+def ensure_fts_table():
+    if not fts_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5({', '.join(FTS_COLUMNS)}, tokenize='porter unicode61')"
+        )
+    return True
+
+
+def index_is_stale():
+    """True when the FTS table is missing or does not hold one row per job post"""
+    if not fts_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        if cursor.fetchone() is None:
+            return True
+        cursor.execute(f"SELECT count(*) FROM {FTS_TABLE}")
+        return cursor.fetchone()[0] != JobPost.objects.count()  # type: ignore
+
+
+def _insert_rows(cursor, rows):
+    placeholders = ', '.join(['%s'] * (len(FTS_COLUMNS) + 1))
+    cursor.executemany(
+        f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_COLUMNS)}) VALUES ({placeholders})",
+        [tuple('' if value is None else value for value in row) for row in rows],
+    )
+
+
+def index_job_post(job_post):
+    if not fts_supported():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job_post.pk])
+        _insert_rows(cursor, [(job_post.pk, *(getattr(job_post, column) for column in FTS_COLUMNS))])
+
+
+def remove_job_post(job_post_id):
+    if not fts_supported():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job_post_id])
+
+
+@transaction.atomic
+def reindex_job_posts():
+    """
+    Rebuild the FTS index from the job post table, returning the number of indexed posts
+    """
+    if not ensure_fts_table():
+        return 0
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        batch = []
+        for row in JobPost.objects.order_by('id').values_list('id', *FTS_COLUMNS).iterator(chunk_size=REINDEX_BATCH_SIZE):  # type: ignore
+            batch.append(row)
+            if len(batch) >= REINDEX_BATCH_SIZE:
+                _insert_rows(cursor, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            _insert_rows(cursor, batch)
+            total += len(batch)
+    return total
+
+
+def search_terms(query):
+    return TERM_PATTERN.findall(query.lower())
+
+
+def _fts_query(terms):
+    # Quote every term so user input can never be parsed as FTS5 syntax; the trailing * allows prefix matches
+    return ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def search_job_posts(query, limit, offset):
+    """
+    Return (total matches, job posts for the requested page) ranked by relevance
+    Every term must match; SQLite uses BM25 ranking, other backends a LIKE scan ordered by recency
+    """
+    terms = search_terms(query)
+    if not terms:
+        return 0, []
+
+    if fts_supported():
+        match = _fts_query(terms)
+        weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+            total = cursor.fetchone()[0]
+            cursor.execute(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                f"ORDER BY bm25({FTS_TABLE}, {weights}) LIMIT %s OFFSET %s",
+                [match, limit, offset],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+        job_posts = JobPost.objects.in_bulk(ids)  # type: ignore
+        return total, [job_posts[job_post_id] for job_post_id in ids if job_post_id in job_posts]
+
+    condition = reduce(and_, (
+        reduce(or_, (Q(**{f'{column}__icontains': term}) for column in FTS_COLUMNS)) for term in terms
+    ))
+    queryset = JobPost.objects.filter(condition).order_by('-created_at', '-id')  # type: ignore
+    return queryset.count(), list(queryset[offset:offset + limit])
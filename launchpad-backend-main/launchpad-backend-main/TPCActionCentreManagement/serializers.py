@@ -5,16 +5,29 @@ from .models import *
 class JobPostSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobPost
-        fields = '__all__'
+        # Canonical skill links are derived from skills_required by the job post signals
+        exclude = ('skills',)
 
 
 class JobApplicationSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobApplication
         fields = '__all__'
+        # Always the authenticated student; duplicates are prevented by the unique constraint
+        read_only_fields = ('student',)
 
 
 class TPCNotificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = TPCNotification
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+class NotificationRecipientSerializer(serializers.ModelSerializer):
+    notification_id = serializers.IntegerField(source='notification.id', read_only=True)
+    title = serializers.CharField(source='notification.title', read_only=True)
+    message = serializers.CharField(source='notification.message', read_only=True)
+    posted_at = serializers.DateTimeField(source='notification.created_at', read_only=True)
+
+    class Meta:
+        model = NotificationRecipient
+        fields = ['id', 'notification_id', 'title', 'message', 'posted_at', 'is_read', 'read_at']
@@ -0,0 +1,78 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import JobApplication, JobPost
+from .search import index_is_stale, index_job_post, reindex_job_posts, remove_job_post
+from .ranking import invalidate_shortlists
+from launchpad.metrics import JOB_APPLICATIONS
+from userManagement.models import CustomUser, AcademicDetail
+from userManagement.signals import students_imported
+from studentKeyFeatureManagement.models import StudentSkill, StudentProject, StudentInternship, StudentResume
+from studentKeyFeatureManagement.skills import link_job_post
+
+
+def create_search_index(sender, **kwargs):
+    """
+    post_migrate hook: make sure the FTS table exists on SQLite databases and holds every job post
+    Posts created before the table existed are only indexed here (or by reindex_job_posts)
+    """
+    if index_is_stale():
+        reindex_job_posts()
+
+
+@receiver(post_save, sender=JobPost)
+def index_job_post_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_job_post(instance)
+        link_job_post(instance)
+
+
+@receiver(post_delete, sender=JobPost)
+def remove_job_post_on_delete(sender, instance, **kwargs):
+    remove_job_post(instance.pk)
+
+
+# Any change to a record that feeds the candidate ranking invalidates every cached shortlist
+@receiver(post_save, sender=StudentSkill)
+@receiver(post_save, sender=StudentProject)
+@receiver(post_save, sender=StudentInternship)
+@receiver(post_save, sender=StudentResume)
+@receiver(post_save, sender=AcademicDetail)
+@receiver(post_delete, sender=StudentSkill)
+@receiver(post_delete, sender=StudentProject)
+@receiver(post_delete, sender=StudentInternship)
+@receiver(post_delete, sender=StudentResume)
+@receiver(post_delete, sender=AcademicDetail)
+@receiver(post_delete, sender=CustomUser)
+@receiver(students_imported)
+def invalidate_shortlists_on_change(sender, **kwargs):
+    invalidate_shortlists()
+
+
+# The feature snapshot only holds active students
+RANKED_USER_FIELDS = ('is_active', 'is_tpcstaff')
+
+
+@receiver(pre_save, sender=CustomUser)
+def capture_previous_role(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._ranking_previous = None
+    # last_login updates on every login skip the lookup
+    if raw or not instance.pk or (update_fields is not None and not set(update_fields) & set(RANKED_USER_FIELDS)):
+        return
+    instance._ranking_previous = sender.objects.filter(pk=instance.pk).values_list(*RANKED_USER_FIELDS).first()
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_shortlists_on_student_change(sender, instance, created, **kwargs):
+    # New accounts, deactivation and role changes move students in or out of the ranking;
+    # other profile edits don't
+    previous = getattr(instance, '_ranking_previous', None)
+    current = tuple(getattr(instance, field) for field in RANKED_USER_FIELDS)
+    if created or (previous is not None and previous != current):
+        invalidate_shortlists()
+
+
+@receiver(post_save, sender=JobApplication)
+def count_job_application(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        JOB_APPLICATIONS.inc()
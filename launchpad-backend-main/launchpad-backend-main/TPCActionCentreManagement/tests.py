@@ -1,3 +1,97 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.db import IntegrityError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from userManagement.models import CustomUser
+from .models import JobApplication, JobPost
+
+
+def make_job_post(**fields):
+    return JobPost.objects.create(**{  # type: ignore
+        'comapany_name': 'Acme',
+        'job_description': 'Backend work',
+        'offered_position': 'Engineer',
+        'venue': 'Online',
+        'application_deadline': date(2030, 1, 1),
+        'job_type': 'Full time',
+        'eligibility': 'All',
+        'skills_required': 'python',
+        **fields,
+    })
+
+
+class BulkJobApplicationTests(APITestCase):
+    def setUp(self):
+        self.student = CustomUser.objects.create_user('student@example.com', full_name='Student')
+        self.posts = [make_job_post(), make_job_post(), make_job_post()]
+        self.client.force_authenticate(self.student)
+
+    def bulk_apply(self, job_posts, **extra):
+        return self.client.post(reverse('job-application-bulk-create'), {'job_posts': job_posts}, format='json', **extra)
+
+    def post_ids(self, *posts):
+        return [post.id for post in posts]
+
+    def test_applies_to_every_post(self):
+        response = self.bulk_apply(self.post_ids(*self.posts))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['created']), 3)
+        self.assertEqual(response.data['already_applied'], [])
+        self.assertEqual(JobApplication.objects.filter(student=self.student).count(), 3)  # type: ignore
+
+    def test_reapplying_skips_posts_already_applied_to(self):
+        first, second, third = self.posts
+        self.bulk_apply(self.post_ids(first, second))
+
+        response = self.bulk_apply(self.post_ids(first, second, third))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([row['job_post'] for row in response.data['created']], [third.id])
+        self.assertEqual(response.data['already_applied'], sorted(self.post_ids(first, second)))
+        self.assertEqual(JobApplication.objects.filter(student=self.student).count(), 3)  # type: ignore
+
+    def test_repeating_the_same_request_creates_nothing(self):
+        self.bulk_apply(self.post_ids(*self.posts))
+
+        response = self.bulk_apply(self.post_ids(*self.posts))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], [])
+        self.assertEqual(JobApplication.objects.filter(student=self.student).count(), 3)  # type: ignore
+
+    def test_idempotency_key_replays_the_first_response(self):
+        first = self.bulk_apply(self.post_ids(*self.posts), HTTP_IDEMPOTENCY_KEY='retry-1')
+
+        replayed = self.bulk_apply(self.post_ids(*self.posts), HTTP_IDEMPOTENCY_KEY='retry-1')
+
+        self.assertEqual(replayed.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(replayed['Idempotent-Replayed'], 'true')
+        self.assertEqual(replayed.data, first.data)
+
+    def test_duplicate_ids_apply_once(self):
+        post = self.posts[0]
+
+        response = self.bulk_apply([post.id, post.id, str(post.id)])
+
+        self.assertEqual(len(response.data['created']), 1)
+        self.assertEqual(JobApplication.objects.filter(student=self.student, job_post=post).count(), 1)  # type: ignore
+
+    def test_closed_post_rejects_the_whole_request(self):
+        closed = make_job_post(is_active=False)
+
+        response = self.bulk_apply(self.post_ids(self.posts[0], closed))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['job_posts'], [closed.id])
+        self.assertFalse(JobApplication.objects.filter(student=self.student).exists())  # type: ignore
+
+    def test_unique_constraint_rejects_a_second_application(self):
+        post = self.posts[0]
+        JobApplication.objects.create(job_post=post, student=self.student)  # type: ignore
+
+        with self.assertRaises(IntegrityError):
+            JobApplication.objects.create(job_post=post, student=self.student)  # type: ignore
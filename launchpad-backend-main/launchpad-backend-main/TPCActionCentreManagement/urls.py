@@ -4,10 +4,13 @@ from .views import *
 urlpatterns = [
     path('tpc-job-post-create/', JobPostView.as_view(), name='job-post-create'),
     path('tpc-job-post-list/', JobPostView.as_view(), name='job-post-list'),
+    path('tpc-job-post-search/', JobPostSearchView.as_view(), name='job-post-search'),
     path('tpc-job-post-detail/<int:job_post_id>/', JobPostView.as_view(), name='job-post-detail'),
     path('tpc-job-post-update/<int:job_post_id>/', JobPostView.as_view(), name='job-post-update'),
     path('tpc-job-post-delete/<int:job_post_id>/', JobPostView.as_view(), name='job-post-delete'),
+    path('tpc-job-post-shortlist/<int:job_post_id>/', JobShortlistView.as_view(), name='job-post-shortlist'),
     path('tpc-job-application-create/', JobApplicationView.as_view(), name='job-application-create'),
+    path('tpc-job-application-bulk-create/', BulkJobApplicationView.as_view(), name='job-application-bulk-create'),
     path('tpc-job-application-list/', JobApplicationView.as_view(), name='job-application-list'),
     
     path('tpc-notification-create/', TPCNotificationView.as_view(), name='tpc-notification-create'),
@@ -15,4 +18,8 @@ urlpatterns = [
     path('tpc-notification-detail/<int:notification_id>/', TPCNotificationView.as_view(), name='tpc-notification-detail'),
     path('tpc-notification-update/<int:notification_id>/', TPCNotificationView.as_view(), name='tpc-notification-update'),
     path('tpc-notification-delete/<int:notification_id>/', TPCNotificationView.as_view(), name='tpc-notification-delete'),
+    path('tpc-notification-inbox/', NotificationInboxView.as_view(), name='tpc-notification-inbox'),
+    path('tpc-notification-inbox/unread-count/', NotificationUnreadCountView.as_view(), name='tpc-notification-unread-count'),
+    path('tpc-notification-inbox/mark-read/', NotificationMarkReadView.as_view(), name='tpc-notification-mark-read'),
+    path('tpc-events/', TPCEventStreamView.as_view(), name='tpc-events'),
 ]
\ No newline at end of file
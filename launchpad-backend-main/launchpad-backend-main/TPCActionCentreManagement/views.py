@@ -2,23 +2,48 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 from .models import *
 from .serializers import *
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_save
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
+from launchpad.asyncapi import AsyncReadAPIView
+from launchpad.fastread import aserialize_list, serialize_list
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from studentKeyFeatureManagement.models import StudentResume
+from userManagement.authentication import CachedJWTAuthentication
+from userManagement.models import AcademicDetail
+from .idempotency import replay_response, remember_response
+from .conditional import aconditional_list_response, conditional_list_response
+from .events import JOB_POST_CREATED, NOTIFICATION_CREATED, event_stream, publish
+from .inbox import fan_out, forget_notification, mark_read, unread_count
+from .pagination import InboxCursorPagination
+from .search import search_job_posts
+from .ranking import rank_students
 
 # Create your views here.
 
-class JobPostView(APIView):
+class JobPostView(AsyncReadAPIView):
     serializer_class = JobPostSerializer
     # permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         return JobPost.objects.all()  # type: ignore
 
-    def get(self, request):
-        queryset = self.get_queryset()
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+    def get(self, request, job_post_id=None):
+        """List job posts; supports ETag/Last-Modified revalidation and ?since= deltas"""
+        if job_post_id:
+            return Response(self.serializer_class(get_object_or_404(JobPost, id=job_post_id)).data)
+        return conditional_list_response(request, self.get_queryset(), self.serializer_class)
+
+    async def aget(self, request, job_post_id=None):
+        if job_post_id:
+            return Response(self.serializer_class(await aget_object_or_404(JobPost, id=job_post_id)).data)
+        return await aconditional_list_response(request, self.get_queryset(), self.serializer_class)
 
     def post(self, request):
         if not self.request.user.is_tpcstaff:
@@ -29,7 +54,9 @@ class JobPostView(APIView):
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             serializer.save(created_by=self.request.user)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            data = serializer.data
+            transaction.on_commit(lambda: publish(JOB_POST_CREATED, data))
+            return Response(data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def put(self, request, job_post_id):
@@ -56,7 +83,66 @@ class JobPostView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class JobApplicationView(APIView):
+class JobPostSearchView(APIView):
+    serializer_class = JobPostSerializer
+    permission_classes = [IsAuthenticated]
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+    def get(self, request):
+        """Search job posts by company, position, description, skills and eligibility, best matches first"""
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {"error": "Search query 'q' is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            page = int(request.query_params.get('page', 1))
+            page_size = int(request.query_params.get('page_size', self.DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return Response(
+                {"error": "page and page_size must be integers"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        page = max(page, 1)
+        page_size = min(max(page_size, 1), self.MAX_PAGE_SIZE)
+
+        total, job_posts = search_job_posts(query, limit=page_size, offset=(page - 1) * page_size)
+        serializer = self.serializer_class(job_posts, many=True)
+        return Response({
+            "count": total,
+            "page": page,
+            "page_size": page_size,
+            "results": serializer.data
+        })
+
+
+class JobShortlistView(APIView):
+    permission_classes = [IsAuthenticated]
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 1000
+
+    def get(self, request, job_post_id):
+        """Rank eligible students for a job post by skills, CPI, approved internships and resume presence"""
+        if not self.request.user.is_tpcstaff:
+            return Response(
+                {"error": "You are not authorized to view candidate shortlists."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            limit = int(request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), self.MAX_LIMIT)
+        job_post = get_object_or_404(JobPost, id=job_post_id)
+        return Response(rank_students(job_post, limit=limit))
+
+
+class JobApplicationView(AsyncReadAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated]
 
@@ -66,32 +152,150 @@ class JobApplicationView(APIView):
         return JobApplication.objects.filter(student=self.request.user)  # type: ignore
 
     def get(self, request):
-        queryset = self.get_queryset()
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return Response(serialize_list(self.serializer_class, self.get_queryset()))
+
+    async def aget(self, request):
+        return Response(await aserialize_list(self.serializer_class, self.get_queryset()))
 
     def post(self, request):
+        """Apply to a job post; re-applying or retrying with the same Idempotency-Key is a no-op"""
+        replayed = replay_response(request)
+        if replayed is not None:
+            return replayed
+
+        existing = self.get_existing_application(request.data.get('job_post'))
+        if existing is not None:
+            return remember_response(request, Response(self.serializer_class(existing).data, status=status.HTTP_200_OK))
+
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
-            self.perform_create(serializer)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            try:
+                with transaction.atomic():
+                    self.perform_create(serializer)
+            except IntegrityError:
+                # A concurrent request for the same job post won the race
+                existing = self.get_existing_application(request.data.get('job_post'))
+                return remember_response(request, Response(self.serializer_class(existing).data, status=status.HTTP_200_OK))
+            return remember_response(request, Response(serializer.data, status=status.HTTP_201_CREATED))
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    def get_existing_application(self, job_post_id):
+        if not str(job_post_id or '').isdigit():
+            return None
+        return JobApplication.objects.filter(job_post_id=job_post_id, student=self.request.user).first()  # type: ignore
+
     def perform_create(self, serializer):
         serializer.save(student=self.request.user)
 
 
-class TPCNotificationView(APIView):
+class BulkJobApplicationView(APIView):
+    serializer_class = JobApplicationSerializer
+    permission_classes = [IsAuthenticated]
+    MAX_JOB_POSTS = 50
+
+    def post(self, request):
+        """Apply to several job posts in one transaction; posts already applied to are skipped"""
+        if request.user.is_tpcstaff:
+            return Response(
+                {"error": "TPC staff cannot apply to job posts"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        replayed = replay_response(request)
+        if replayed is not None:
+            return replayed
+
+        job_post_ids = request.data.get('job_posts')
+        if not isinstance(job_post_ids, list) or not job_post_ids:
+            return Response(
+                {"error": "job_posts must be a non-empty list of job post ids"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(job_post_ids) > self.MAX_JOB_POSTS:
+            return Response(
+                {"error": f"You can apply to at most {self.MAX_JOB_POSTS} job posts at once"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            job_post_ids = {int(job_post_id) for job_post_id in job_post_ids}
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "job_posts must contain integer ids"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        open_posts = set(JobPost.objects.filter(id__in=job_post_ids, is_active=True).values_list('id', flat=True))  # type: ignore
+        unavailable = sorted(job_post_ids - open_posts)
+        if unavailable:
+            return Response(
+                {"error": "Some job posts do not exist or are closed", "job_posts": unavailable},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        resume_id = request.data.get('resume')
+        if resume_id is not None:
+            try:
+                resume_id = int(resume_id)
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "resume must be an integer id"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        if resume_id is not None and not StudentResume.objects.filter(id=resume_id, related_user=request.user).exists():  # type: ignore
+            return Response(
+                {"error": "You can only apply with your own resume"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        with transaction.atomic():
+            already_applied = set(JobApplication.objects.filter(  # type: ignore
+                student=request.user, job_post_id__in=job_post_ids
+            ).values_list('job_post_id', flat=True))
+            applications = [
+                JobApplication(job_post_id=job_post_id, student=request.user, resume_id=resume_id)
+                for job_post_id in sorted(job_post_ids - already_applied)
+            ]
+            try:
+                with transaction.atomic():
+                    created = JobApplication.objects.bulk_create(applications)  # type: ignore
+            except IntegrityError:
+                # A concurrent request applied to one of these posts since the read above: insert one
+                # at a time and keep only the rows this request inserted, so nothing is counted twice
+                created = []
+                for application in applications:
+                    try:
+                        with transaction.atomic():
+                            JobApplication.objects.bulk_create([application])  # type: ignore
+                    except IntegrityError:
+                        already_applied.add(application.job_post_id)
+                    else:
+                        created.append(application)
+            # bulk_create skips model signals; send them so analytics counters and rollups stay current
+            for application in created:
+                post_save.send(sender=JobApplication, instance=application, created=True, raw=False, using=application._state.db, update_fields=None)
+
+        return remember_response(request, Response({
+            "created": self.serializer_class(created, many=True).data,
+            "already_applied": sorted(already_applied),
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK))
+
+
+class TPCNotificationView(AsyncReadAPIView):
     serializer_class = TPCNotificationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         return TPCNotification.objects.all()  # type: ignore
 
-    def get(self, request):
-        queryset = self.get_queryset()
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+    def get(self, request, notification_id=None):
+        """List notifications; supports ETag/Last-Modified revalidation and ?since= deltas"""
+        if notification_id:
+            return Response(self.serializer_class(get_object_or_404(TPCNotification, id=notification_id)).data)
+        return conditional_list_response(request, self.get_queryset(), self.serializer_class)
+
+    async def aget(self, request, notification_id=None):
+        if notification_id:
+            return Response(self.serializer_class(await aget_object_or_404(TPCNotification, id=notification_id)).data)
+        return await aconditional_list_response(request, self.get_queryset(), self.serializer_class)
 
     def post(self, request):
         if not self.request.user.is_tpcstaff:
@@ -101,8 +305,13 @@ class TPCNotificationView(APIView):
             )
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
-            serializer.save(created_by=self.request.user)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # One transaction: a failed fan-out must not leave a notification nobody received
+            with transaction.atomic():
+                notification = serializer.save(created_by=self.request.user)
+                fan_out(notification)
+                data = serializer.data
+                transaction.on_commit(lambda: publish(NOTIFICATION_CREATED, data))
+            return Response(data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def put(self, request, notification_id):
@@ -125,5 +334,112 @@ class TPCNotificationView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         notification = get_object_or_404(TPCNotification, id=notification_id)
-        notification.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        with transaction.atomic():
+            forget_notification(notification)
+            notification.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class NotificationInboxView(APIView):
+    serializer_class = NotificationRecipientSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Cursor-paginated inbox of the current user, newest first; ?unread=true lists unread only"""
+        queryset = NotificationRecipient.objects.filter(user=request.user).select_related('notification')  # type: ignore
+        if request.query_params.get('unread', '').lower() in ('1', 'true', 'yes'):
+            queryset = queryset.filter(is_read=False)
+        paginator = InboxCursorPagination()
+        try:
+            page = paginator.paginate_queryset(queryset, request, view=self)
+        except NotFound:
+            return Response(
+                {"error": "Invalid cursor"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer = self.serializer_class(page, many=True)
+        return Response({
+            "unread_count": unread_count(request.user.id),
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+            "results": serializer.data
+        })
+
+
+class NotificationUnreadCountView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({"unread_count": unread_count(request.user.id)})
+
+
+class NotificationMarkReadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """Mark inbox entries read: {"ids": [...]} or {"all": true}"""
+        if request.data.get('all') in (True, 'true', '1'):
+            updated = mark_read(request.user.id)
+        else:
+            ids = request.data.get('ids')
+            if not isinstance(ids, list) or not all(str(entry_id).isdigit() for entry_id in ids):
+                return Response(
+                    {"error": "Provide ids as a list of inbox entry ids, or all: true"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            updated = mark_read(request.user.id, [int(entry_id) for entry_id in ids])
+        return Response({"updated": updated, "unread_count": unread_count(request.user.id)})
+
+
+
+def _authenticate_stream(request):
+    """
+    EventSource cannot send an Authorization header, so the access token may also come as ?token=
+    Returns (user, branch, batch); branch/batch are None for TPC staff, who see every event
+    """
+    authenticator = CachedJWTAuthentication()
+    header = authenticator.get_header(request)
+    raw_token = authenticator.get_raw_token(header) if header else None
+    if raw_token is None and request.GET.get('token'):
+        raw_token = request.GET['token'].encode()
+    if raw_token is None:
+        return None, None, None
+    try:
+        # Not get_user: role claims would skip the token version check, and a stream outlives many requests
+        user = authenticator.get_cached_user(authenticator.get_validated_token(raw_token))
+    except (InvalidToken, TokenError, AuthenticationFailed):  # AuthenticationFailed: user inactive or gone, token revoked
+        return None, None, None
+    if user.is_tpcstaff:
+        return user, None, None
+    academic = AcademicDetail.objects.filter(user=user).values('branch', 'batch').first()  # type: ignore
+    if academic is None:
+        return user, '', ''
+    return user, academic['branch'], academic['batch']
+
+
+class TPCEventStreamView(View):
+    """
+    Server-Sent Events feed of new notifications and job posts
+    Must be served by the ASGI application (launchpad.asgi) so idle connections do not hold a worker thread
+    """
+
+    async def get(self, request):
+        user, branch, batch = await sync_to_async(_authenticate_stream)(request)
+        if user is None:
+            return JsonResponse(
+                {"error": "Authentication credentials were not provided or are invalid."},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            last_event_id = None
+        response = StreamingHttpResponse(
+            event_stream(last_event_id=last_event_id, branch=branch, batch=batch),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Stop nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -1,3 +1,22 @@
 from django.contrib import admin
+from .models import *
 
 # Register your models here.
+class TimestampedAdmin(admin.ModelAdmin):
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(AnalyticsCounter)
+class AnalyticsCounterAdmin(TimestampedAdmin):
+    list_display = ('metric', 'key', 'count', 'updated_at')
+    list_filter = ['metric']
+    ordering = ['metric', 'key']
+    search_fields = ['key']
+
+
+@admin.register(JobApplicationRollup)
+class JobApplicationRollupAdmin(TimestampedAdmin):
+    list_display = ('job_post', 'granularity', 'bucket_start', 'count')
+    list_filter = ['granularity']
+    list_select_related = ['job_post']
+    ordering = ['-bucket_start']
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class AnalyticsmanagementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'analyticsManagement'
+
+    def ready(self):
+        from . import signals
+        signals.connect_counter_signals()
+        post_migrate.connect(signals.fill_empty_snapshot, sender=self)
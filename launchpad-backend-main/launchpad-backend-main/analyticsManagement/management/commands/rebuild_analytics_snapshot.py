@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from analyticsManagement.snapshot import rebuild_snapshot
+from analyticsManagement.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the TPC analytics snapshot counters and job application rollups from the source tables"
+
+    def handle(self, *args, **options):
+        counters = rebuild_snapshot()
+        self.stdout.write(self.style.SUCCESS(f"Analytics snapshot rebuilt with {len(counters)} counters"))
+        buckets = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(f"Job application rollups rebuilt with {buckets} buckets"))
@@ -1,3 +1,70 @@
 from django.db import models
 
 # Create your models here.
+
+
+class BaseModel(models.Model):
+    created_at = models.DateTimeField(auto_now_add=True, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True, blank=True, null=True)
+
+    class Meta:
+        abstract = True
+
+
+# One row per (metric, key) bucket of the TPC dashboard, kept current by the signal handlers
+# in analyticsManagement.signals and rebuilt with `manage.py rebuild_analytics_snapshot`
+class AnalyticsCounter(BaseModel):
+    CPI = 'cpi'
+    INTERNSHIP_DOMAIN = 'internship_domain'
+    RESUME_UPLOADS = 'resume_uploads'
+    GITHUB_COMPLETE = 'github_complete'
+    LINKEDIN_COMPLETE = 'linkedin_complete'
+    JOB_APPLICATIONS = 'job_applications'
+
+    METRIC_CHOICES = [
+        (CPI, 'CPI distribution'),
+        (INTERNSHIP_DOMAIN, 'Approved internship domains'),
+        (RESUME_UPLOADS, 'Students by resume count'),
+        (GITHUB_COMPLETE, 'GitHub link completeness'),
+        (LINKEDIN_COMPLETE, 'LinkedIn link completeness'),
+        (JOB_APPLICATIONS, 'Job applications per day'),
+    ]
+
+    metric = models.CharField(max_length=50, choices=METRIC_CHOICES)
+    key = models.CharField(max_length=255, blank=True, default='')
+    count = models.IntegerField(default=0) # type: ignore
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['metric', 'key'], name='unique_analytics_counter'),
+        ]
+
+    def __str__(self):
+        return f"{self.metric}:{self.key} = {self.count}"
+
+
+# Job applications counted per job post and time bucket, written as applications arrive
+class JobApplicationRollup(BaseModel):
+    HOUR = 'hour'
+    DAY = 'day'
+
+    GRANULARITY_CHOICES = [
+        (HOUR, 'Hourly'),
+        (DAY, 'Daily'),
+    ]
+
+    granularity = models.CharField(max_length=10, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    job_post = models.ForeignKey('TPCActionCentreManagement.JobPost', on_delete=models.CASCADE, related_name='application_rollups')
+    count = models.IntegerField(default=0) # type: ignore
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['granularity', 'bucket_start', 'job_post'], name='unique_application_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['job_post', 'granularity', 'bucket_start'], name='rollup_post_bucket_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_post_id} {self.granularity} {self.bucket_start:%Y-%m-%d %H:%M} = {self.count}"
@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from TPCActionCentreManagement.models import JobApplication
+from .models import JobApplicationRollup
+
+TRUNC_FUNCTIONS = {
+    JobApplicationRollup.HOUR: TruncHour,
+    JobApplicationRollup.DAY: TruncDay,
+}
+
+# Window returned when the caller does not pass ?from=
+DEFAULT_WINDOWS = {
+    JobApplicationRollup.HOUR: timedelta(days=2),
+    JobApplicationRollup.DAY: timedelta(days=30),
+}
+
+
+def bucket_start(value, granularity):
+    """
+    Truncate a timestamp to the start of its hourly or daily bucket in the current timezone
+    """
+    value = timezone.localtime(value) if timezone.is_aware(value) else value
+    value = value.replace(minute=0, second=0, microsecond=0)
+    if granularity == JobApplicationRollup.DAY:
+        value = value.replace(hour=0)
+    return value
+
+
+def record_application(job_post_id, created_at, delta):
+    """
+    Add delta to the hourly and daily buckets of one application
+    Decrements never create rows, so a job post being cascade-deleted cannot resurrect its buckets
+    """
+    if created_at is None or not delta:
+        return
+    for granularity in TRUNC_FUNCTIONS:
+        lookup = {'granularity': granularity, 'bucket_start': bucket_start(created_at, granularity), 'job_post_id': job_post_id}
+        updated = JobApplicationRollup.objects.filter(**lookup).update(  # type: ignore
+            count=F('count') + delta, updated_at=timezone.now()
+        )
+        if updated or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                JobApplicationRollup.objects.create(count=delta, **lookup)  # type: ignore
+        except IntegrityError:
+            JobApplicationRollup.objects.filter(**lookup).update(count=F('count') + delta)  # type: ignore
+
+
+@transaction.atomic
+def rebuild_rollups():
+    """
+    Recompute every rollup bucket from the job application table
+    """
+    JobApplicationRollup.objects.all().delete()  # type: ignore
+    total = 0
+    for granularity, trunc in TRUNC_FUNCTIONS.items():
+        rows = JobApplication.objects.filter(created_at__isnull=False) \
+            .annotate(bucket=trunc('created_at')).values('job_post', 'bucket') \
+            .annotate(count=Count('id')).order_by()  # type: ignore
+        buckets = [
+            JobApplicationRollup(granularity=granularity, bucket_start=row['bucket'], job_post_id=row['job_post'], count=row['count'])
+            for row in rows
+        ]
+        JobApplicationRollup.objects.bulk_create(buckets, batch_size=1000)  # type: ignore
+        total += len(buckets)
+    return total
+
+
+def application_trend(granularity, start, end, job_post_id=None):
+    """
+    Application counts per bucket in [start, end), summed across job posts unless one is given
+    """
+    queryset = JobApplicationRollup.objects.filter(  # type: ignore
+        granularity=granularity, bucket_start__gte=bucket_start(start, granularity), bucket_start__lt=end
+    )
+    if job_post_id is not None:
+        queryset = queryset.filter(job_post_id=job_post_id)
+    rows = queryset.values('bucket_start').annotate(total=Sum('count')).order_by('bucket_start')
+    return [{"bucket": row['bucket_start'], "count": row['total']} for row in rows if row['total']]
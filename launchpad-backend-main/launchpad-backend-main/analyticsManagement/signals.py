@@ -0,0 +1,151 @@
+from collections import Counter
+
+from django.db.models import QuerySet
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from userManagement.models import CustomUser, AcademicDetail
+from userManagement.signals import students_imported
+from studentKeyFeatureManagement.models import StudentInternship, StudentResume
+from TPCActionCentreManagement.models import JobApplication, JobPost
+from .models import AnalyticsCounter, JobApplicationRollup
+from .snapshot import bump, cpi_key, date_key, is_link_complete, rebuild_snapshot, release, sync_resume_count
+from .rollups import rebuild_rollups, record_application
+
+
+def _academic_keys(values):
+    if values['cpi'] is None:
+        return []
+    return [(AnalyticsCounter.CPI, cpi_key(values['cpi']))]
+
+
+def _internship_keys(values):
+    if values['approval_status'] != 'Approved':
+        return []
+    return [(AnalyticsCounter.INTERNSHIP_DOMAIN, values['domain'])]
+
+
+def _user_keys(values):
+    keys = []
+    if is_link_complete(values['github_link']):
+        keys.append((AnalyticsCounter.GITHUB_COMPLETE, ''))
+    if is_link_complete(values['linkedin_link']):
+        keys.append((AnalyticsCounter.LINKEDIN_COMPLETE, ''))
+    return keys
+
+
+def _application_keys(values):
+    if values['created_at'] is None:
+        return []
+    return [(AnalyticsCounter.JOB_APPLICATIONS, date_key(values['created_at']))]
+
+
+# Model -> (fields the counters depend on, function mapping those field values to counter buckets)
+TRACKED_MODELS = {
+    AcademicDetail: (('cpi',), _academic_keys),
+    StudentInternship: (('approval_status', 'domain'), _internship_keys),
+    CustomUser: (('github_link', 'linkedin_link'), _user_keys),
+    JobApplication: (('created_at',), _application_keys),
+}
+
+
+def _instance_values(instance, fields):
+    return {field: getattr(instance, field) for field in fields}
+
+
+def capture_previous_values(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Remember the stored values of tracked fields so post_save can move counters between buckets"""
+    if sender not in TRACKED_MODELS or raw:
+        return
+    fields, _ = TRACKED_MODELS[sender]
+    instance._analytics_previous = None
+    # Saves that don't touch a tracked field (e.g. last_login on every login) cost no extra query
+    if update_fields is not None and not set(update_fields) & set(fields):
+        instance._analytics_skip = True
+        return
+    instance._analytics_skip = False
+    if instance.pk:
+        instance._analytics_previous = sender.objects.filter(pk=instance.pk).values(*fields).first()
+
+
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if sender is StudentResume:
+        if created and not raw:
+            sync_resume_count(instance.related_user_id)
+        return
+    if sender is JobApplication and created and not raw:
+        record_application(instance.job_post_id, instance.created_at, 1)
+    if sender not in TRACKED_MODELS or raw or getattr(instance, '_analytics_skip', False):
+        return
+    fields, keys_for = TRACKED_MODELS[sender]
+    previous = getattr(instance, '_analytics_previous', None)
+
+    old_keys = Counter(keys_for(previous)) if previous and not created else Counter()
+    new_keys = Counter(keys_for(_instance_values(instance, fields)))
+    for key in old_keys | new_keys:
+        bump(*key, new_keys[key] - old_keys[key])
+
+
+def _deleted_with_job_post(origin):
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model is JobPost
+
+
+@receiver(pre_delete, sender=JobPost)
+def release_applications_of_job_post(sender, instance, **kwargs):
+    """
+    A job post's applications are cascade-deleted with it; take them off the daily counters in one
+    UPDATE here rather than one per application in post_delete. Its rollup rows cascade away too.
+    """
+    created = JobApplication.objects.filter(job_post=instance, created_at__isnull=False).values_list('created_at', flat=True)  # type: ignore
+    release(AnalyticsCounter.JOB_APPLICATIONS, Counter(date_key(value) for value in created))
+
+
+def update_counters_on_delete(sender, instance, origin=None, **kwargs):
+    if sender is JobApplication and _deleted_with_job_post(origin):
+        return
+    if sender is StudentResume:
+        sync_resume_count(instance.related_user_id)
+        return
+    if sender is JobApplication:
+        record_application(instance.job_post_id, instance.created_at, -1)
+    if sender not in TRACKED_MODELS:
+        return
+    fields, keys_for = TRACKED_MODELS[sender]
+    for key in keys_for(_instance_values(instance, fields)):
+        bump(*key, -1)
+
+
+def fill_empty_snapshot(sender, **kwargs):
+    """
+    post_migrate hook: the signals only apply changes, so on a database that already had data when
+    the counters were introduced, compute them (and the application rollups) from the source tables
+    """
+    if not AnalyticsCounter.objects.exists():  # type: ignore
+        rebuild_snapshot()
+    if not JobApplicationRollup.objects.exists():  # type: ignore
+        rebuild_rollups()
+
+
+def connect_counter_signals():
+    """
+    Connect the counter handlers for the models they track only. A receiver without a sender would
+    hang off every model's delete signals and turn off Django's fast delete project-wide.
+    """
+    for model in TRACKED_MODELS:
+        pre_save.connect(capture_previous_values, sender=model)
+    for model in (*TRACKED_MODELS, StudentResume):
+        post_save.connect(update_counters_on_save, sender=model)
+        post_delete.connect(update_counters_on_delete, sender=model)
+
+
+@receiver(students_imported)
+def update_counters_on_import(sender, users, academic_details, **kwargs):
+    """Bulk imports skip post_save, so fold the new rows into the counters in one pass"""
+    totals = Counter()
+    for user in users:
+        totals.update(_user_keys(_instance_values(user, ('github_link', 'linkedin_link'))))
+    for detail in academic_details:
+        totals.update(_academic_keys(_instance_values(detail, ('cpi',))))
+    for key, delta in totals.items():
+        bump(*key, delta)
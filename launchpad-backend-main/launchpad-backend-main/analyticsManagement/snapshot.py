@@ -0,0 +1,172 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from userManagement.models import CustomUser, AcademicDetail
+from studentKeyFeatureManagement.models import StudentInternship, StudentResume
+from TPCActionCentreManagement.models import JobApplication
+from .models import AnalyticsCounter
+
+# Per-student resume counts, kept so the resume histogram can be moved between buckets exactly
+RESUME_COUNT_BY_USER = 'resume_count_by_user'
+
+DASHBOARD_METRICS = [metric for metric, _ in AnalyticsCounter.METRIC_CHOICES]
+
+
+# --------------------------------------------Counter keys----------------------------------------------- #
+
+def cpi_key(cpi):
+    return repr(float(cpi))
+
+
+def date_key(value):
+    return timezone.localtime(value).date().isoformat() if timezone.is_aware(value) else value.date().isoformat()
+
+
+def is_link_complete(value):
+    return bool(value)
+
+
+# --------------------------------------------Counter writes----------------------------------------------- #
+
+def bump(metric, key, delta):
+    """
+    Atomically add delta to a single counter bucket, creating it on first use
+    """
+    if not delta:
+        return
+    updated = AnalyticsCounter.objects.filter(metric=metric, key=key).update(  # type: ignore
+        count=F('count') + delta, updated_at=timezone.now()
+    )
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            AnalyticsCounter.objects.create(metric=metric, key=key, count=delta)  # type: ignore
+    except IntegrityError:
+        # Another request created the bucket first
+        AnalyticsCounter.objects.filter(metric=metric, key=key).update(count=F('count') + delta)  # type: ignore
+
+
+def release(metric, counts):
+    """
+    Subtract counts ({key: n}) from several buckets of one metric in a single UPDATE
+    Missing buckets are left alone, as with a negative bump
+    """
+    counts = {key: n for key, n in counts.items() if n}
+    if not counts:
+        return
+    AnalyticsCounter.objects.filter(metric=metric, key__in=counts).update(  # type: ignore
+        count=F('count') - Case(*[When(key=key, then=Value(n)) for key, n in counts.items()], output_field=IntegerField()),
+        updated_at=timezone.now(),
+    )
+
+
+def sync_resume_count(user_id):
+    """
+    Move a student between resume-count buckets after their resumes changed
+    """
+    new_count = StudentResume.objects.filter(related_user_id=user_id).count()  # type: ignore
+    row = AnalyticsCounter.objects.filter(metric=RESUME_COUNT_BY_USER, key=str(user_id)).first()  # type: ignore
+    old_count = row.count if row else 0
+    if old_count == new_count:
+        return
+
+    if old_count:
+        bump(AnalyticsCounter.RESUME_UPLOADS, str(old_count), -1)
+    if new_count:
+        bump(AnalyticsCounter.RESUME_UPLOADS, str(new_count), 1)
+    bump(RESUME_COUNT_BY_USER, str(user_id), new_count - old_count)
+
+
+# --------------------------------------------Full recomputation----------------------------------------------- #
+
+def compute_counters():
+    """
+    Recompute every dashboard counter straight from the source tables
+    Returns a {(metric, key): count} mapping
+    """
+    counters = Counter()
+
+    for row in AcademicDetail.objects.values('cpi').annotate(count=Count('id')):  # type: ignore
+        counters[(AnalyticsCounter.CPI, cpi_key(row['cpi']))] = row['count']
+
+    approved = StudentInternship.objects.filter(approval_status='Approved')  # type: ignore
+    for row in approved.values('domain').annotate(count=Count('id')):
+        counters[(AnalyticsCounter.INTERNSHIP_DOMAIN, row['domain'])] = row['count']
+
+    per_user = StudentResume.objects.values('related_user').annotate(total=Count('id'))  # type: ignore
+    for row in per_user:
+        counters[(RESUME_COUNT_BY_USER, str(row['related_user']))] = row['total']
+        counters[(AnalyticsCounter.RESUME_UPLOADS, str(row['total']))] += 1
+
+    counters[(AnalyticsCounter.GITHUB_COMPLETE, '')] = CustomUser.objects.exclude(github_link__isnull=True) \
+        .exclude(github_link='').count()  # type: ignore
+    counters[(AnalyticsCounter.LINKEDIN_COMPLETE, '')] = CustomUser.objects.exclude(linkedin_link__isnull=True) \
+        .exclude(linkedin_link='').count()  # type: ignore
+
+    applications = JobApplication.objects.filter(created_at__isnull=False) \
+        .annotate(date=TruncDate('created_at')).values('date').annotate(count=Count('id'))  # type: ignore
+    for row in applications:
+        counters[(AnalyticsCounter.JOB_APPLICATIONS, row['date'].isoformat())] = row['count']
+
+    return counters
+
+
+@transaction.atomic
+def rebuild_snapshot():
+    """
+    Replace the stored counters with a fresh recomputation
+    """
+    counters = compute_counters()
+    AnalyticsCounter.objects.all().delete()  # type: ignore
+    AnalyticsCounter.objects.bulk_create(  # type: ignore
+        [AnalyticsCounter(metric=metric, key=key, count=count) for (metric, key), count in counters.items() if count],
+        batch_size=1000,
+    )
+    return counters
+
+
+def read_counters():
+    """
+    Load the stored dashboard counters in a single query
+    """
+    rows = AnalyticsCounter.objects.filter(metric__in=DASHBOARD_METRICS, count__gt=0) \
+        .values_list('metric', 'key', 'count')  # type: ignore
+    return Counter({(metric, key): count for metric, key, count in rows})
+
+
+# --------------------------------------------Dashboard payload----------------------------------------------- #
+
+def build_dashboard(counters):
+    """
+    Shape a counter mapping into the TPC analytics response
+    """
+    buckets = {metric: [] for metric in DASHBOARD_METRICS}
+    for (metric, key), count in counters.items():
+        if metric in buckets and count > 0:
+            buckets[metric].append((key, count))
+
+    return {
+        "cpi_distribution": sorted(
+            ({"cpi": float(key), "count": count} for key, count in buckets[AnalyticsCounter.CPI]),
+            key=lambda row: row["cpi"]
+        ),
+        "internship_domains": sorted(
+            ({"domain": key, "count": count} for key, count in buckets[AnalyticsCounter.INTERNSHIP_DOMAIN]),
+            key=lambda row: -row["count"]
+        ),
+        "resume_uploads_stats": sorted(
+            ({"total": int(key), "count": count} for key, count in buckets[AnalyticsCounter.RESUME_UPLOADS]),
+            key=lambda row: row["total"]
+        ),
+        "github_complete": counters.get((AnalyticsCounter.GITHUB_COMPLETE, ''), 0),
+        "linkedin_complete": counters.get((AnalyticsCounter.LINKEDIN_COMPLETE, ''), 0),
+        "job_applications_trend": sorted(
+            ({"date": key, "count": count} for key, count in buckets[AnalyticsCounter.JOB_APPLICATIONS]),
+            key=lambda row: row["date"]
+        ),
+    }
@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import TPCAnalyticsView
+from .views import TPCAnalyticsView, ApplicationTrendView
 
 urlpatterns = [
     path('tpc-analytics/', TPCAnalyticsView.as_view(), name='tpc-analytics'),
+    path('tpc-application-trend/', ApplicationTrendView.as_view(), name='tpc-application-trend'),
 ]
\ No newline at end of file
@@ -4,13 +4,27 @@ from django.shortcuts import render
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from userManagement.models import CustomUser, AcademicDetail
-from studentKeyFeatureManagement.models import StudentInternship
-from studentKeyFeatureManagement.models import StudentResume
-from TPCActionCentreManagement.models import JobApplication
-from django.db.models import Count, Avg, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from .models import JobApplicationRollup
+from .snapshot import build_dashboard, compute_counters, read_counters
+from .rollups import DEFAULT_WINDOWS, application_trend
 import datetime
 
+
+def parse_timestamp(value):
+    """Accept an ISO datetime or a bare date; naive values are read in the current timezone"""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(value)
+        parsed = datetime.datetime.combine(date, datetime.time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
 class TPCAnalyticsView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -19,35 +33,47 @@ class TPCAnalyticsView(APIView):
         if not user.is_tpcstaff:
             return Response({"error": "Access denied"}, status=403)
 
-        # Skill Distribution (if you add skill model later, currently dummy)
-        # skill_data = Skill.objects.values('name').annotate(count=Count('students'))
+        # Counters are maintained incrementally by analyticsManagement.signals, so the dashboard
+        # is a single read of the snapshot table. ?fresh=1 recomputes from the source tables instead.
+        fresh = request.query_params.get('fresh', '').lower() in ('1', 'true', 'yes')
+        counters = compute_counters() if fresh else read_counters()
+
+        return Response(build_dashboard(counters))
 
-        # CPI Distribution
-        cpi_distribution = AcademicDetail.objects.values('cpi').annotate(count=Count('id')).order_by('cpi')  # type: ignore
 
-        # Internship Domains
-        internship_domains = StudentInternship.objects.filter(is_approved=True) \
-            .values('domain').annotate(count=Count('id')).order_by('-count')  # type: ignore
 
-        # Resume Uploads Stats
-        resume_stats = StudentResume.objects.values('student').annotate(total=Count('id')).values('total') \
-            .annotate(count=Count('student')).order_by('total')  # type: ignore
+class ApplicationTrendView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Job applications per hour or day from the rollup table
+        Params: granularity (hour|day), from, to (ISO date or datetime), job_post_id
+        """
+        if not request.user.is_tpcstaff:
+            return Response({"error": "Access denied"}, status=403)
 
-        # GitHub / LinkedIn completeness
-        github_complete = CustomUser.objects.filter(~Q(external_links_github='') & ~Q(external_links_github__isnull=True)).count()  # type: ignore
-        linkedin_complete = CustomUser.objects.filter(~Q(external_links_linkedin='') & ~Q(external_links_linkedin__isnull=True)).count()  # type: ignore
+        granularity = request.query_params.get('granularity', JobApplicationRollup.DAY)
+        if granularity not in DEFAULT_WINDOWS:
+            return Response({"error": "granularity must be 'hour' or 'day'"}, status=400)
 
-        # Job Applications over time
-        applications_trend = JobApplication.objects.extra({'date': "date(created_at)"}) \
-            .values('date').annotate(count=Count('id')).order_by('date')  # type: ignore
+        try:
+            end = parse_timestamp(request.query_params['to']) if request.query_params.get('to') else timezone.now()
+            start = parse_timestamp(request.query_params['from']) if request.query_params.get('from') \
+                else end - DEFAULT_WINDOWS[granularity]
+        except ValueError as e:
+            return Response({"error": f"Invalid date '{e}'. Use ISO format, e.g. 2025-07-01 or 2025-07-01T09:00:00"}, status=400)
+        if start >= end:
+            return Response({"error": "'from' must be earlier than 'to'"}, status=400)
 
-        # Project domains (if project model added, use it here)
+        job_post_id = request.query_params.get('job_post_id')
+        if job_post_id is not None and not job_post_id.isdigit():
+            return Response({"error": "job_post_id must be an integer"}, status=400)
 
         return Response({
-            "cpi_distribution": list(cpi_distribution),
-            "internship_domains": list(internship_domains),
-            "resume_uploads_stats": list(resume_stats),
-            "github_complete": github_complete,
-            "linkedin_complete": linkedin_complete,
-            "job_applications_trend": list(applications_trend),
-        })
\ No newline at end of file
+            "granularity": granularity,
+            "from": start,
+            "to": end,
+            "job_post_id": int(job_post_id) if job_post_id else None,
+            "buckets": application_trend(granularity, start, end, int(job_post_id) if job_post_id else None),
+        })
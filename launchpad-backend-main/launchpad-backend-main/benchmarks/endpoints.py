@@ -0,0 +1,228 @@
+"""
+In-process benchmark suite for the API endpoints
+
+Drives every route through Django's test client against the configured database (seed it first
+with `python manage.py seed_data`) and reports p50/p95/p99 latency, SQL query count and peak
+Python memory per endpoint. Writes are wrapped in a rolled-back transaction so runs are repeatable.
+
+    python benchmarks/endpoints.py                                   # print results
+    python benchmarks/endpoints.py --save-baseline benchmarks/baseline.json
+    python benchmarks/endpoints.py --baseline benchmarks/baseline.json   # exit 1 on regressions
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'launchpad.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+from rest_framework_simplejwt.tokens import AccessToken  # noqa: E402
+
+from launchpad.instrumentation import QueryTimer  # noqa: E402
+from studentKeyFeatureManagement.models import StudentInternship, StudentResume  # noqa: E402
+from TPCActionCentreManagement.models import JobApplication, JobPost  # noqa: E402
+from userManagement.models import CustomUser  # noqa: E402
+from userManagement.seeding import SEED_DOMAIN, SEED_PASSWORD  # noqa: E402
+
+UM = '/api/user-management/'
+AM = '/api/analytics-management/'
+TPC = '/api/tpc-action-centre-management/'
+SKF = '/api/student-key-feature-management/'
+
+# Latency must grow by more than both of these before it counts as a regression
+DEFAULT_TOLERANCE = 0.25
+NOISE_FLOOR_MS = 2.0
+
+
+def load_fixtures():
+    staff = CustomUser.objects.filter(is_tpcstaff=True).order_by('-username').first()  # type: ignore
+    resume = StudentResume.objects.filter(is_default=True, related_user__username__endswith=f'@{SEED_DOMAIN}') \
+        .select_related('related_user').first() or StudentResume.objects.select_related('related_user').first()  # type: ignore
+    if staff is None or resume is None:
+        raise SystemExit("No data to benchmark; run `python manage.py seed_data` first")
+    student = resume.related_user
+    applied = JobApplication.objects.filter(student=student).values_list('job_post_id', flat=True)  # type: ignore
+    return {
+        'staff': staff,
+        'student': student,
+        'resume': resume,
+        'job_post': JobPost.objects.order_by('id').first(),  # type: ignore
+        'open_job_post': JobPost.objects.exclude(id__in=applied).order_by('id').first(),  # type: ignore
+        'internship': StudentInternship.objects.order_by('id').first(),  # type: ignore
+        'seeded_login': student.username.endswith(f'@{SEED_DOMAIN}'),
+    }
+
+
+def benchmark_cases(f):
+    """(name, role, method, path, body) for every route; role None means anonymous"""
+    job_post_id = f['job_post'].id
+    cases = [
+        ('user-login', None, 'post', UM + 'login/', {'email': f['student'].username, 'password': SEED_PASSWORD}),
+        ('student-list', 'staff', 'get', UM + 'get-studentlist/', None),
+        ('student-list-filtered', 'staff', 'get', UM + 'get-studentlist/?branch=CSE&min_cpi=8&search=A', None),
+        ('student-export-csv', 'staff', 'get', UM + 'export-students/?file_type=csv&branch=CSE', None),
+        ('user-detail', 'staff', 'get', UM + f"get-user-detail/{f['student'].id}/", None),
+        ('update-profile', 'student', 'put', UM + 'update-profile/', {'phone_number': '9000000000'}),
+        ('tpc-analytics', 'staff', 'get', AM + 'tpc-analytics/', None),
+        ('tpc-analytics-fresh', 'staff', 'get', AM + 'tpc-analytics/?fresh=1', None),
+        ('tpc-application-trend', 'staff', 'get', AM + 'tpc-application-trend/?granularity=day', None),
+        ('job-post-list', 'student', 'get', TPC + 'tpc-job-post-list/', None),
+        ('job-post-search', 'student', 'get', TPC + 'tpc-job-post-search/?q=python%20engineer', None),
+        ('job-post-shortlist', 'staff', 'get', TPC + f'tpc-job-post-shortlist/{job_post_id}/', None),
+        ('job-application-list-staff', 'staff', 'get', TPC + 'tpc-job-application-list/', None),
+        ('job-application-list', 'student', 'get', TPC + 'tpc-job-application-list/', None),
+        ('tpc-notification-list', 'student', 'get', TPC + 'tpc-notification-list/', None),
+        ('tpc-notification-inbox', 'student', 'get', TPC + 'tpc-notification-inbox/', None),
+        ('tpc-notification-unread-count', 'student', 'get', TPC + 'tpc-notification-inbox/unread-count/', None),
+        ('tpc-notification-mark-read', 'student', 'post', TPC + 'tpc-notification-inbox/mark-read/', {'all': True}),
+        ('student-skills', 'student', 'get', SKF + 'student-skills/', None),
+        ('skill-search', 'staff', 'get', SKF + 'skill-search/?skills=python,react', None),
+        ('student-projects', 'staff', 'get', SKF + f"student-projects/?user_id={f['student'].id}", None),
+        ('student-resume', 'student', 'get', SKF + 'student-resume/', None),
+        ('student-resume-detail', 'student', 'get', SKF + f"student-resume/{f['resume'].id}/", None),
+        ('student-resume-download', 'staff', 'get', SKF + f"student-resume/{f['resume'].id}/download/", None),
+        ('student-internships', 'staff', 'get', SKF + 'student-internships/', None),
+    ]
+    if f['open_job_post']:
+        cases.append(('job-application-create', 'student', 'post', TPC + 'tpc-job-application-create/',
+                      {'job_post': f['open_job_post'].id}))
+    if f['internship']:
+        cases.append(('student-internship-detail', 'staff', 'get', SKF + f"student-internships/{f['internship'].id}/", None))
+    if not f['seeded_login']:
+        cases = [case for case in cases if case[0] != 'user-login']
+    return cases
+
+
+def make_clients(fixtures):
+    clients = {None: APIClient(SERVER_NAME='localhost')}
+    for role in ('staff', 'student'):
+        client = APIClient(SERVER_NAME='localhost')
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(fixtures[role])}')
+        clients[role] = client
+    return clients
+
+
+def call(client, method, path, body):
+    if method == 'get':
+        response = client.get(path)
+    else:
+        # Roll writes back so every iteration sees the same data
+        with transaction.atomic():
+            response = getattr(client, method)(path, body, format='json')
+            transaction.set_rollback(True)
+    if response.streaming:
+        if response.is_async:
+            # Async views stream an async iterator; drain it the way an ASGI server would
+            async_to_sync(_drain)(response.streaming_content)
+        else:
+            b''.join(response.streaming_content)
+    return response
+
+
+async def _drain(chunks):
+    async for _ in chunks:
+        pass
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def run_case(client, method, path, body, repeat):
+    # execute_wrapper rather than CaptureQueriesContext: request_started resets the query log mid-request
+    queries = QueryTimer()
+    with connection.execute_wrapper(queries):
+        response = call(client, method, path, body)
+
+    tracemalloc.start()
+    call(client, method, path, body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call(client, method, path, body)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        'status': response.status_code,
+        'queries': queries.count,
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result['queries'] > before['queries']:
+            regressions.append(f"{name}: queries {before['queries']} -> {result['queries']}")
+        grown = result['p95_ms'] - before['p95_ms']
+        if grown > NOISE_FLOOR_MS and result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95_ms']}ms -> {result['p95_ms']}ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20, help="Timed requests per endpoint")
+    parser.add_argument('--only', action='append', help="Run just these benchmark names (repeatable)")
+    parser.add_argument('--baseline', help="Compare against this JSON baseline and exit 1 on regressions")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="Allowed relative p95 growth")
+    parser.add_argument('--save-baseline', help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    # Measure what production runs: no DEBUG query log, no per-request profiling
+    settings.DEBUG = False
+    settings.REQUEST_PROFILING_SAMPLE_RATE = 0
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'localhost']
+
+    fixtures = load_fixtures()
+    clients = make_clients(fixtures)
+    results = {}
+    for name, role, method, path, body in benchmark_cases(fixtures):
+        if args.only and name not in args.only:
+            continue
+        # Hashing dominates login; a few samples are enough
+        repeat = min(args.repeat, 5) if name == 'user-login' else args.repeat
+        results[name] = run_case(clients[role], method, path, body, repeat)
+        r = results[name]
+        print(f"{name:32} {r['status']:>4} {r['queries']:>4}q  p50 {r['p50_ms']:>8.2f}  p95 {r['p95_ms']:>8.2f}  "
+              f"p99 {r['p99_ms']:>8.2f} ms  peak {r['peak_memory_kb']:>9.1f} KB")
+
+    if args.save_baseline:
+        # Latencies only compare on the same machine and dataset; _meta records what produced them
+        meta = {'repeat': args.repeat, 'students': CustomUser.objects.filter(is_tpcstaff=False).count(),  # type: ignore
+                'job_applications': JobApplication.objects.count()}  # type: ignore
+        with open(args.save_baseline, 'w') as fh:
+            json.dump({'_meta': meta, **results}, fh, indent=2, sort_keys=True)
+            fh.write('\n')
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = compare(results, json.load(fh), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Closed-loop HTTP load generator for the read endpoints
+
+Each of --concurrency clients sends its next request as soon as the previous one finishes,
+for --duration seconds, and the run reports throughput and latency percentiles.
+
+Compare the async and sync GET paths by starting the ASGI app twice:
+
+    ASYNC_READ_VIEWS=1 uvicorn launchpad.asgi:application --port 8000
+    python benchmarks/load_test.py --token <access token> --concurrency 500 --label async
+
+    ASYNC_READ_VIEWS=0 uvicorn launchpad.asgi:application --port 8000
+    python benchmarks/load_test.py --token <access token> --concurrency 500 --label sync
+
+Raise the open file limit (ulimit -n) on both sides before going past ~1000 clients.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = [
+    '/api/tpc-action-centre-management/tpc-job-post-list/',
+    '/api/tpc-action-centre-management/tpc-notification-list/',
+    '/api/student-key-feature-management/student-skills/',
+    '/api/student-key-feature-management/student-projects/',
+]
+
+
+async def fetch(host, port, path, headers):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        request = f'GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n{headers}\r\n'
+        writer.write(request.encode())
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def client(host, port, paths, headers, deadline, latencies, errors, offset):
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            status = await fetch(host, port, path, headers)
+        except OSError:
+            errors.append('connection')
+            continue
+        if status >= 400:
+            errors.append(status)
+        latencies.append(time.perf_counter() - start)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run(args):
+    url = urlsplit(args.url)
+    headers = f'Authorization: Bearer {args.token}\r\n' if args.token else ''
+    latencies, errors = [], []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(
+        client(url.hostname, url.port or 80, args.paths, headers, deadline, latencies, errors, n)
+        for n in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'label': args.label,
+        'concurrency': args.concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'max_ms': round((latencies[-1] if latencies else 0) * 1000, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--token', default='', help='JWT access token sent as a Bearer header')
+    parser.add_argument('--concurrency', type=int, default=500)
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds')
+    parser.add_argument('--path', dest='paths', action='append', help='repeat to load several endpoints')
+    parser.add_argument('--label', default='')
+    parser.add_argument('--output', help='append the JSON result to this file')
+    args = parser.parse_args(argv)
+    args.paths = args.paths or DEFAULT_PATHS
+
+    result = asyncio.run(run(args))
+    line = json.dumps(result)
+    print(line)
+    if args.output:
+        with open(args.output, 'a') as fh:
+            fh.write(line + '\n')
+    return 0 if result['requests'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Login throughput benchmark
+
+--concurrency clients post logins for seeded students in a closed loop for --duration seconds,
+while --readers clients keep polling a cheap read endpoint. Reports logins per second (total and
+per core) and the latency readers saw during the login storm. Seed the database first with
+`python manage.py seed_data`, and disable the login throttle so one address can flood.
+
+Before (hashing on the request thread, sync pipeline):
+    LOGIN_THROTTLE=0 ASYNC_READ_VIEWS=0 LOGIN_HASH_WORKERS=0 uvicorn launchpad.asgi:application --port 8000
+    python benchmarks/login_throughput.py --token <access token> --label inline
+
+After (hashing in the process pool, awaited by the async login view):
+    LOGIN_THROTTLE=0 uvicorn launchpad.asgi:application --port 8000
+    python benchmarks/login_throughput.py --token <access token> --label pool
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from urllib.parse import urlsplit
+
+from load_test import fetch, percentile
+
+SEED_DOMAIN = 'launchpad.test'
+SEED_PASSWORD = 'launchpad-seed'
+LOGIN_PATH = '/api/user-management/login/'
+READ_PATH = '/api/tpc-action-centre-management/tpc-notification-list/'
+
+
+async def post_login(host, port, username):
+    body = json.dumps({'email': username, 'password': SEED_PASSWORD}).encode()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write((
+            f'POST {LOGIN_PATH} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n'
+            f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n'
+        ).encode() + body)
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def login_client(host, port, users, deadline, latencies, rejected, errors, offset, stride):
+    i = offset
+    while time.perf_counter() < deadline:
+        username = f'seed{i % users:06d}@{SEED_DOMAIN}'
+        i += stride
+        start = time.perf_counter()
+        try:
+            status = await post_login(host, port, username)
+        except OSError:
+            errors.append('connection')
+            continue
+        if status in (429, 503):
+            # Throttled or the hashing pool is full: back off like a well-behaved client
+            rejected.append(status)
+            await asyncio.sleep(1)
+            continue
+        if status != 200:
+            errors.append(status)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def read_client(host, port, headers, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            status = await fetch(host, port, READ_PATH, headers)
+        except OSError:
+            errors.append('connection')
+            continue
+        if status >= 400:
+            errors.append(status)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    headers = f'Authorization: Bearer {args.token}\r\n' if args.token else ''
+    # One login first so the hashing pool's workers are up before the clock starts
+    await post_login(host, port, f'seed{0:06d}@{SEED_DOMAIN}')
+    logins, rejected, login_errors, reads, read_errors = [], [], [], [], []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(
+        *(login_client(host, port, args.users, deadline, logins, rejected, login_errors, n, args.concurrency)
+          for n in range(args.concurrency)),
+        *(read_client(host, port, headers, deadline, reads, read_errors) for _ in range(args.readers)),
+    )
+    elapsed = time.perf_counter() - started
+    logins.sort()
+    reads.sort()
+    rate = len(logins) / elapsed
+    return {
+        'label': args.label,
+        'concurrency': args.concurrency,
+        'cores': args.cores,
+        'logins': len(logins),
+        'login_rejected': len(rejected),
+        'login_errors': len(login_errors),
+        'logins_per_sec': round(rate, 2),
+        'logins_per_sec_per_core': round(rate / args.cores, 2),
+        'login_p50_ms': round(percentile(logins, 0.50) * 1000, 1),
+        'login_p99_ms': round(percentile(logins, 0.99) * 1000, 1),
+        'reads': len(reads),
+        'read_errors': len(read_errors),
+        'read_p50_ms': round(percentile(reads, 0.50) * 1000, 1),
+        'read_p99_ms': round(percentile(reads, 0.99) * 1000, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--token', default='', help='JWT access token the readers send')
+    parser.add_argument('--concurrency', type=int, default=50, help='concurrent login clients')
+    parser.add_argument('--readers', type=int, default=5, help='concurrent clients polling a read endpoint')
+    parser.add_argument('--users', type=int, default=1000, help='log in as the first N seeded students')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds')
+    parser.add_argument('--cores', type=int, default=os.cpu_count(), help='cores the server may use')
+    parser.add_argument('--label', default='')
+    parser.add_argument('--output', help='append the JSON result to this file')
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args))
+    line = json.dumps(result)
+    print(line)
+    if args.output:
+        with open(args.output, 'a') as fh:
+            fh.write(line + '\n')
+    return 0 if result['logins'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
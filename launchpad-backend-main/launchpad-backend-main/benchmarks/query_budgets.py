@@ -0,0 +1,317 @@
+"""
+Query-count budget harness for every API route
+
+Discovers every named route in the four app urls.py files plus every admin changelist, seeds a
+throwaway test database at a small and a large size, calls each route at both sizes and fails when
+  * a route has no budget declared in QUERY_BUDGETS,
+  * its query count exceeds the budget, or
+  * its query count grows with the data size (an N+1), unless the budget allows it.
+Each SELECT is also run through EXPLAIN QUERY PLAN at the large size; plans are written to
+--plans and full table scans are listed as warnings.
+
+    python benchmarks/query_budgets.py                      # exit 1 on any failure
+    python benchmarks/query_budgets.py --sizes 10 1000 --plans /tmp/query_plans.json
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from collections import namedtuple
+from importlib import import_module
+
+from endpoints import call, make_clients  # sets up Django
+
+from django.conf import settings
+from django.contrib import admin
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+
+from studentKeyFeatureManagement.models import StudentInternship, StudentProject, StudentResume
+from TPCActionCentreManagement.models import JobPost, TPCNotification
+from userManagement.authentication import issue_tokens
+from userManagement.models import CustomUser
+from userManagement.seeding import SEED_PASSWORD, SEED_STAFF_USERNAME, flush_seed_data, seed_dataset
+
+APP_URLCONFS = (
+    'userManagement.urls',
+    'analyticsManagement.urls',
+    'TPCActionCentreManagement.urls',
+    'studentKeyFeatureManagement.urls',
+)
+
+LOCAL_CACHE = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'query-budgets'}
+
+Budget = namedtuple('Budget', 'max_queries method role data scales skip', defaults=('get', 'staff', None, False, ''))
+
+# The one place per-route budgets live: url name -> Budget(max_queries, method, role, data, scales, skip)
+# role is the caller (staff / student / None for anonymous); scales=True allows growth with data size,
+# in which case max_queries is the budget at the large size
+QUERY_BUDGETS = {
+    # userManagement
+    # login includes the two token-bucket throttles: one UPDATE each once a client's bucket exists,
+    # four each on the first request (miss, read, create, spend), which is what this cold run measures
+    'user-login': Budget(20, 'post', None, {'email': '{student_username}', 'password': SEED_PASSWORD}),
+    'logout': Budget(2, 'post', 'student', {'refresh': 'invalid'}),
+    'token-refresh': Budget(11, 'post', None, {'refresh': '{student_refresh}'}),
+    'student-list': Budget(3),
+    'student-export': Budget(3),
+    'student-import': Budget(2, 'post', skip="needs a multipart roster upload; covered by the import_students command"),
+    'user-detail': Budget(3),
+    'update-profile': Budget(8, 'put', 'student', {'phone_number': '9000000000'}),
+    # analyticsManagement
+    'tpc-analytics': Budget(3),
+    'tpc-application-trend': Budget(3),
+    # TPCActionCentreManagement
+    'job-post-create': Budget(12, 'post', data={
+        'comapany_name': 'Budget Co', 'job_description': 'Python developer', 'offered_position': 'Engineer',
+        'venue': 'Online', 'application_deadline': '2030-01-01', 'job_type': 'Full Time',
+        'eligibility': 'CPI 7 and above', 'skills_required': 'python, django',
+    }),
+    'job-post-list': Budget(3),
+    'job-post-search': Budget(4, data={'q': 'python'}),
+    'job-post-detail': Budget(3),
+    'job-post-update': Budget(14, 'put', data={
+        'comapany_name': 'Budget Co', 'job_description': 'Python developer', 'offered_position': 'Engineer',
+        'venue': 'Online', 'application_deadline': '2030-01-01', 'job_type': 'Full Time',
+        'eligibility': 'CPI 7 and above', 'skills_required': 'python, django',
+    }),
+    'job-post-delete': Budget(13, 'delete'),
+    'job-post-shortlist': Budget(8),
+    'job-application-create': Budget(13, 'post', 'student', {'job_post': '{open_job_post_id}'}),
+    'job-application-bulk-create': Budget(14, 'post', 'student', {'job_posts': ['{open_job_post_id}']}),
+    'job-application-list': Budget(3, role='student'),
+    # Fan-out inserts one batch per ~160 recipients (SQLite's 999-parameter limit)
+    'tpc-notification-create': Budget(14, 'post', data={'title': 'Budget', 'message': 'Fan-out check'}, scales=True),
+    'tpc-notification-list': Budget(3, role='student'),
+    'tpc-notification-detail': Budget(3, role='student'),
+    'tpc-notification-update': Budget(4, 'put', data={'title': 'Budget', 'message': 'Updated'}),
+    'tpc-notification-delete': Budget(8, 'delete'),
+    'tpc-notification-inbox': Budget(4, role='student'),
+    'tpc-notification-unread-count': Budget(2, role='student'),
+    'tpc-notification-mark-read': Budget(4, 'post', 'student', {'all': True}),
+    'tpc-events': Budget(0, skip="never-ending event stream"),
+    # studentKeyFeatureManagement
+    'student-skills': Budget(2, role='student'),
+    'skill-search': Budget(4, data={'skills': 'python,react'}),
+    'student-projects': Budget(2, role='student'),
+    # Re-syncing the student's skills after the delete costs more when there are skills to drop
+    'student-projects-detail': Budget(12, 'delete', 'student', scales=True),
+    'student-resume': Budget(2, role='student'),
+    'student-resume-detail': Budget(3, role='student'),
+    'student-resume-download': Budget(3),
+    'student-internships': Budget(2, role='student'),
+    'student-internship-detail': Budget(3, role='student'),
+}
+
+# Every admin changelist shares one budget; list_display columns on foreign keys need list_select_related
+ADMIN_CHANGELIST_BUDGET = Budget(7, role='admin')
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)(?!.*(USING (COVERING )?INDEX))')
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, params, many))
+        return execute(sql, params, many, context)
+
+
+def discover_routes():
+    """(url name, kwarg names) for every named pattern in the app urlconfs and every admin changelist"""
+    routes = []
+    for urlconf in APP_URLCONFS:
+        for pattern in import_module(urlconf).urlpatterns:
+            if pattern.name:
+                routes.append((pattern.name, sorted(pattern.pattern.converters)))
+    for model in admin.site._registry:
+        routes.append((f'admin:{model._meta.app_label}_{model._meta.model_name}_changelist', []))
+    return routes
+
+
+def budget_for(name):
+    return ADMIN_CHANGELIST_BUDGET if name.startswith('admin:') else QUERY_BUDGETS.get(name)
+
+
+def counts_for(size):
+    return {
+        'users': size, 'skills': size * 5, 'projects': max(1, size // 2), 'internships': max(1, size // 4),
+        'job_posts': max(5, size // 10), 'applications': size * 5, 'notifications': max(1, size // 10),
+        'resume_files': 3,
+    }
+
+
+def load_fixtures():
+    staff = CustomUser.objects.get(username=SEED_STAFF_USERNAME)  # type: ignore
+    resume = StudentResume.objects.select_related('related_user').order_by('id').first()  # type: ignore
+    student = resume.related_user
+    applied = student.job_applications.values_list('job_post_id', flat=True)
+    internship = StudentInternship.objects.filter(student=student).first() or StudentInternship.objects.first()  # type: ignore
+    project = StudentProject.objects.filter(related_user=student).first()  # type: ignore
+    if project is None:
+        project = StudentProject.objects.create(related_user=student, project_title='Budget project')  # type: ignore
+    if internship.student_id != student.id:
+        StudentInternship.objects.filter(pk=internship.pk).update(student=student)  # type: ignore
+    superuser = CustomUser.objects.filter(is_superuser=True).first() or CustomUser.objects.create_superuser(  # type: ignore
+        username='budget-admin@launchpad.test', password=SEED_PASSWORD)
+    if not JobPost.objects.exclude(id__in=applied).exists():  # type: ignore
+        # Small datasets can leave the student applied everywhere; free one post for job-application-create
+        student.job_applications.filter(job_post_id=applied[0]).delete()
+    return {
+        'staff': staff,
+        'student': student,
+        'admin': superuser,
+        'kwargs': {
+            'user_id': student.id,
+            'job_post_id': JobPost.objects.order_by('id').values_list('id', flat=True).first(),  # type: ignore
+            'notification_id': TPCNotification.objects.order_by('id').values_list('id', flat=True).first(),  # type: ignore
+            'resume_id': resume.id,
+            'internship_id': internship.id,
+            'project_id': project.id,
+        },
+        'placeholders': {
+            'student_username': student.username,
+            'student_refresh': str(issue_tokens(student)),
+            'open_job_post_id': JobPost.objects.exclude(id__in=applied).order_by('id').values_list('id', flat=True).first(),  # type: ignore
+        },
+    }
+
+
+def fill(value, placeholders):
+    """Substitute '{name}' strings in budget data with per-dataset ids"""
+    if isinstance(value, dict):
+        return {key: fill(item, placeholders) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill(item, placeholders) for item in value]
+    if isinstance(value, str) and value.startswith('{') and value.endswith('}'):
+        return placeholders[value[1:-1]]
+    return value
+
+
+def explain(queries):
+    plans = []
+    with connection.cursor() as cursor:
+        for sql, params, many in queries:
+            if many or not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            detail = [row[-1] for row in cursor.fetchall()]
+            plans.append({
+                'sql': sql,
+                'plan': detail,
+                'full_scans': sorted({m.group(1) for line in detail if (m := FULL_SCAN.match(line))}),
+            })
+    return plans
+
+
+def measure(routes, with_plans):
+    fixtures = load_fixtures()
+    clients = make_clients(fixtures)
+    clients['admin'] = Client(SERVER_NAME='localhost')
+    clients['admin'].force_login(fixtures['admin'])
+    results = {}
+    for name, kwargs in routes:
+        budget = budget_for(name)
+        if budget is None or budget.skip:
+            continue
+        path = reverse(name, kwargs={key: fixtures['kwargs'][key] for key in kwargs})
+        data = fill(budget.data, fixtures['placeholders'])
+        if budget.method == 'get' and data:
+            path += '?' + '&'.join(f'{key}={value}' for key, value in data.items())
+            data = None
+        cache.clear()
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = call(clients[budget.role], budget.method, path, data)
+        results[name] = {
+            'status': response.status_code,
+            'queries': len(recorder.queries),
+            'sql': [sql for sql, _, _ in recorder.queries],
+            'plans': explain(recorder.queries) if with_plans else [],
+        }
+    return results
+
+
+def run_at_size(size, routes, with_plans):
+    flush_seed_data()
+    seed_dataset(counts_for(size), seed=size)
+    return measure(routes, with_plans)
+
+
+def check(routes, small, large):
+    failures, warnings = [], []
+    for name, _ in routes:
+        budget = budget_for(name)
+        if budget is None:
+            failures.append(f"{name}: no budget declared in QUERY_BUDGETS")
+            continue
+        if budget.skip:
+            continue
+        low, high = small[name], large[name]
+        for result in (low, high):
+            if result['status'] >= 500:
+                failures.append(f"{name}: HTTP {result['status']}")
+        if high['queries'] > budget.max_queries:
+            failures.append(f"{name}: {high['queries']} queries, budget {budget.max_queries}")
+        if high['queries'] > low['queries'] and not budget.scales:
+            failures.append(f"{name}: queries grow with data ({low['queries']} -> {high['queries']})")
+        for plan in high['plans']:
+            if plan['full_scans']:
+                warnings.append(f"{name}: full scan of {', '.join(plan['full_scans'])}: {plan['sql'][:120]}")
+    return failures, warnings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs=2, default=(10, 1000), metavar=('SMALL', 'LARGE'))
+    parser.add_argument('--show', action='append', default=[], help="Print the SQL a route issued at the large size (repeatable)")
+    parser.add_argument('--plans', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'query_plans.json'), help="Where to write the EXPLAIN QUERY PLAN report")
+    args = parser.parse_args(argv)
+
+    setup_test_environment()
+    settings.REQUEST_PROFILING_SAMPLE_RATE = 0
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'localhost']
+    routes = discover_routes()
+    small_size, large_size = args.sizes
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        # Budgets count the app's SQL; without REDIS_URL the shared cache would be SQL too, so run
+        # it in memory as it would be against Redis
+        with tempfile.TemporaryDirectory() as media_root, \
+                override_settings(MEDIA_ROOT=media_root, CACHES={**settings.CACHES, 'default': LOCAL_CACHE}):
+            small = run_at_size(small_size, routes, with_plans=False)
+            large = run_at_size(large_size, routes, with_plans=True)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    with open(args.plans, 'w') as fh:
+        json.dump({name: result['plans'] for name, result in large.items()}, fh, indent=2, sort_keys=True)
+        fh.write('\n')
+    for name, _ in routes:
+        if name in large:
+            print(f"{name:32} {small[name]['status']:>4} {small[name]['queries']:>3}q @{small_size:<6}"
+                  f"{large[name]['queries']:>3}q @{large_size:<6} budget {budget_for(name).max_queries}")
+
+    for name in args.show:
+        print(f"\n{name}:")
+        for sql in large.get(name, {}).get('sql', []):
+            print(f"  {sql[:200]}")
+        print()
+
+    failures, warnings = check(routes, small, large)
+    for warning in warnings:
+        print(f"WARNING {warning}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{len(large)} routes checked, {len(failures)} failures, {len(warnings)} full-scan warnings, plans in {args.plans}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
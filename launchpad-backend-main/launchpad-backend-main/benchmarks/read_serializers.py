@@ -0,0 +1,91 @@
+"""
+Rows per second for list serialization: DRF serializers vs the values_list() read path
+
+For each list serializer, serializes --rows rows (default 10k) of the configured database (seed it
+first with `python manage.py seed_data`) with serializer_class(qs, many=True).data rendered by
+JSONRenderer, and with launchpad.fastread.serialize_list rendered by ORJSONRenderer. Reports the
+best of --repeat runs for serialization alone and serialization plus rendering, including the
+query, and exits 1 if the two paths produce different bytes.
+
+    python benchmarks/read_serializers.py
+    python benchmarks/read_serializers.py --rows 50000 --repeat 3 --only StudentResumeSerializer
+"""
+import argparse
+import json
+import sys
+import time
+
+import endpoints  # noqa: F401  (sets up Django)
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+
+from launchpad.fastread import read_plan, serialize_list
+from launchpad.renderers import ORJSONRenderer
+from studentKeyFeatureManagement.serializers import (
+    StudentInternshipSerializer, StudentProjectSerializer, StudentResumeSerializer, StudentSkillSerializer,
+)
+from TPCActionCentreManagement.serializers import JobApplicationSerializer, JobPostSerializer, TPCNotificationSerializer
+
+SERIALIZERS = (
+    JobPostSerializer, JobApplicationSerializer, TPCNotificationSerializer, StudentSkillSerializer,
+    StudentProjectSerializer, StudentResumeSerializer, StudentInternshipSerializer,
+)
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_case(serializer_class, rows, repeat):
+    queryset = serializer_class.Meta.model.objects.all()[:rows]
+    count = queryset.count()
+    drf_serialize, _ = best_of(repeat, lambda: serializer_class(queryset, many=True).data)
+    fast_serialize, _ = best_of(repeat, lambda: serialize_list(serializer_class, queryset))
+    drf_total, drf_body = best_of(repeat, lambda: JSONRenderer().render(serializer_class(queryset, many=True).data))
+    fast_total, fast_body = best_of(repeat, lambda: ORJSONRenderer().render(serialize_list(serializer_class, queryset)))
+    return {
+        'rows': count,
+        'fast_path': read_plan(serializer_class) is not None,
+        'identical': drf_body == fast_body,
+        'drf_serialize_rows_per_sec': round(count / drf_serialize),
+        'fast_serialize_rows_per_sec': round(count / fast_serialize),
+        'drf_total_rows_per_sec': round(count / drf_total),
+        'fast_total_rows_per_sec': round(count / fast_total),
+        'speedup': round(drf_total / fast_total, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=10000, help="Rows per list")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement; the best one counts")
+    parser.add_argument('--only', action='append', help="Run just these serializer class names (repeatable)")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    settings.DEBUG = False
+    results = {}
+    for serializer_class in SERIALIZERS:
+        name = serializer_class.__name__
+        if args.only and name not in args.only:
+            continue
+        results[name] = r = run_case(serializer_class, args.rows, args.repeat)
+        print(f"{name:30} {r['rows']:>6} rows  serialize {r['drf_serialize_rows_per_sec']:>8} -> "
+              f"{r['fast_serialize_rows_per_sec']:>8}/s  +render {r['drf_total_rows_per_sec']:>8} -> "
+              f"{r['fast_total_rows_per_sec']:>8}/s  x{r['speedup']:<5} {'' if r['identical'] else 'OUTPUT DIFFERS'}")
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(results, fh, indent=2)
+    return 0 if all(r['identical'] for r in results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
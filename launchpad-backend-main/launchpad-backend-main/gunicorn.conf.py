@@ -0,0 +1,7 @@
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    # Drop the exited worker's live gauge files from PROMETHEUS_MULTIPROC_DIR; counters and
+    # histograms it wrote keep contributing to the /metrics totals
+    multiprocess.mark_process_dead(worker.pid)
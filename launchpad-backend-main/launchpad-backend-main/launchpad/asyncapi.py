@@ -0,0 +1,51 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.functional import classproperty
+from rest_framework.views import APIView
+
+
+async def alist(queryset, chunk_size=500):
+    """Evaluate a queryset with the async ORM, streaming rows from the cursor in chunks"""
+    return [obj async for obj in queryset.aiterator(chunk_size=chunk_size)]
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView that answers a method with its `a<method>` coroutine (aget, apost, ...) under ASGI
+    Authentication, permission and throttle checks run in a worker thread (the JWT user lookup is
+    sync ORM), then the handler is awaited so slow I/O does not pin a thread. Methods without a
+    coroutine, and every method when ASYNC_READ_VIEWS is off, go through the regular sync DRF
+    pipeline, so one view class keeps serving the existing URL for all methods.
+    """
+
+    @classproperty
+    def view_is_async(cls):
+        return True
+
+    def use_async_handler(self, request):
+        return hasattr(self, 'a' + request.method.lower()) and getattr(settings, 'ASYNC_READ_VIEWS', True)
+
+    async def dispatch(self, request, *args, **kwargs):
+        if not self.use_async_handler(request):
+            return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = getattr(self, 'a' + request.method.lower())
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncReadAPIView(AsyncAPIView):
+    """AsyncAPIView that only takes the async path for GET (`aget`); writes stay sync"""
+
+    def use_async_handler(self, request):
+        return request.method == 'GET' and super().use_async_handler(request)
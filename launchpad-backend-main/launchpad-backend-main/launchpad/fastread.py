@@ -0,0 +1,169 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import ManyRelatedField, PKOnlyObject, RelatedField
+from rest_framework.settings import api_settings
+
+from .asyncapi import alist
+
+ReadPlan = namedtuple('ReadPlan', 'model fields may_contain_floats')
+
+# DRF field -> model fields whose database values its to_representation would only re-cast
+# (str(), int(), ...) to the type they already have; those columns are copied as they are
+_PASSTHROUGH_FIELDS = (
+    (serializers.CharField, (models.CharField, models.TextField)),
+    (serializers.IntegerField, (models.IntegerField,)),
+    (serializers.BooleanField, (models.BooleanField,)),
+    (serializers.FloatField, (models.FloatField,)),
+)
+
+
+class ReadRows(list):
+    """
+    Serialized rows from serialize_list. may_contain_floats is False when no column can hold a
+    float, which lets ORJSONRenderer skip checking the output for floats it formats differently.
+    """
+    may_contain_floats = True
+
+
+def _identity(value):
+    return value
+
+
+class _ISODateTime:
+    """
+    DateTimeField.to_representation for ISO 8601 output, with the field's timezone looked up once
+    per list (bind) instead of once per value
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def bind(self):
+        field = self.field
+        tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+
+        def convert(value):
+            if tz is not None and value.utcoffset() is not None:
+                try:
+                    value = value.astimezone(tz)
+                except OverflowError:
+                    field.fail('overflow')
+            else:
+                value = field.enforce_timezone(value)
+            value = value.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return convert
+
+
+def _is_iso(field, default_format):
+    output_format = getattr(field, 'format', default_format)
+    return isinstance(output_format, str) and output_format.lower() == ISO_8601
+
+
+def _converter(field, model):
+    """
+    (column for values_list, value -> representation, output is never a float), or None if the
+    field needs the model instance
+    """
+    if isinstance(field, ManyRelatedField) or len(field.source_attrs) != 1:
+        return None
+    try:
+        model_field = model._meta.get_field(field.source_attrs[0])
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.many_to_many or model_field.one_to_many:
+        return None
+    column = model_field.attname
+
+    if isinstance(field, RelatedField):
+        if not field.use_pk_only_optimization():
+            return None
+        if type(field) is serializers.PrimaryKeyRelatedField and field.pk_field is None:
+            return column, _identity, isinstance(model_field.target_field, (models.IntegerField, models.CharField))
+        return column, lambda pk: field.to_representation(PKOnlyObject(pk=pk)), False
+    if isinstance(field, serializers.FileField):
+        attr_class = model_field.attr_class
+        return column, lambda name: field.to_representation(attr_class(None, model_field, name)), True
+    for drf_field, model_fields in _PASSTHROUGH_FIELDS:
+        if type(field).to_representation is drf_field.to_representation and isinstance(model_field, model_fields):
+            return column, _identity, drf_field is not serializers.FloatField
+    internal_type = model_field.get_internal_type()
+    if type(field) is serializers.DateTimeField and internal_type == 'DateTimeField' \
+            and _is_iso(field, api_settings.DATETIME_FORMAT):
+        return column, _ISODateTime(field), True
+    if type(field) is serializers.DateField and internal_type == 'DateField' \
+            and _is_iso(field, api_settings.DATE_FORMAT):
+        return column, lambda value: value.isoformat(), True
+    return column, field.to_representation, False
+
+
+@lru_cache(maxsize=None)
+def read_plan(serializer_class):
+    """
+    Precomputed ReadPlan(model, [(field name, column, converter)], may_contain_floats) for
+    serializing serializer_class from values_list() rows, or None when a field needs the model
+    instance (method fields, dotted sources, many-to-many, custom to_representation) or
+    FAST_READ_SERIALIZERS is off
+    """
+    if not getattr(settings, 'FAST_READ_SERIALIZERS', True):
+        return None
+    if not issubclass(serializer_class, serializers.ModelSerializer) \
+            or serializer_class.to_representation is not serializers.Serializer.to_representation:
+        return None
+    model = serializer_class.Meta.model
+    fields = []
+    float_free = True
+    for name, field in serializer_class().fields.items():
+        if field.write_only:
+            continue
+        converter = _converter(field, model)
+        if converter is None:
+            return None
+        column, convert, never_float = converter
+        fields.append((name, column, convert))
+        float_free = float_free and never_float
+    return ReadPlan(model, fields, not float_free)
+
+
+def _columns(plan):
+    return [column for _, column, _ in plan.fields]
+
+
+def _rows_to_dicts(plan, rows):
+    names = [name for name, _, _ in plan.fields]
+    converters = [convert.bind() if isinstance(convert, _ISODateTime) else convert for _, _, convert in plan.fields]
+    data = ReadRows(
+        {name: None if value is None else convert(value) for name, convert, value in zip(names, converters, row)}
+        for row in rows
+    )
+    data.may_contain_floats = plan.may_contain_floats
+    return data
+
+
+def serialize_list(serializer_class, queryset):
+    """
+    serializer_class(queryset, many=True).data, built from values_list() rows instead of model
+    instances and serializer copies per row. Output is identical; serializers the plan cannot
+    cover go through DRF as before.
+    """
+    plan = read_plan(serializer_class)
+    if plan is None or plan.model is not queryset.model:
+        return serializer_class(queryset, many=True).data
+    return _rows_to_dicts(plan, queryset.values_list(*_columns(plan)))
+
+
+async def aserialize_list(serializer_class, queryset):
+    """serialize_list for async views"""
+    plan = read_plan(serializer_class)
+    if plan is None or plan.model is not queryset.model:
+        return serializer_class(await alist(queryset), many=True).data
+    # Not aiterator(): values_list()'s iterable runs its query as soon as it is created, which
+    # aiterator does on the event loop. One thread hop for the whole fetch is cheaper anyway.
+    rows = await sync_to_async(list)(queryset.values_list(*_columns(plan)))
+    return _rows_to_dicts(plan, rows)
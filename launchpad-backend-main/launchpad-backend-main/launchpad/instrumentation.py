@@ -0,0 +1,221 @@
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+logger = logging.getLogger('launchpad.requests')
+
+DEBUG_ENDPOINT_NAME = 'debug-requests'
+
+_buffer_lock = threading.Lock()
+_buffer = deque(maxlen=getattr(settings, 'REQUEST_PROFILING_BUFFER_SIZE', 500))
+
+
+def recent_requests():
+    with _buffer_lock:
+        return list(_buffer)
+
+
+def _remember(record):
+    with _buffer_lock:
+        _buffer.append(record)
+
+
+class QueryTimer:
+    """Counts queries and sums their wall time; use with track_queries() or as an execute_wrapper"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def record(self, elapsed):
+        self.duration += elapsed
+        self.count += 1
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(time.perf_counter() - start)
+
+
+# Timers of the queries running in this context. A ContextVar rather than execute_wrapper() on the
+# caller's connections: async middleware runs on the event loop, but the view's queries run on
+# sync_to_async threads with connections of their own, and those threads inherit the context.
+_active_timers = ContextVar('query_timers', default=())
+
+
+def _dispatch_to_timers(execute, sql, params, many, context):
+    timers = _active_timers.get()
+    if not timers:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for timer in timers:
+            timer.record(elapsed)
+
+
+def _install_dispatcher(connection, **kwargs):
+    if _dispatch_to_timers not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _dispatch_to_timers)
+
+
+connection_created.connect(_install_dispatcher)
+for _connection in connections.all(initialized_only=True):
+    _install_dispatcher(_connection)
+
+
+@contextmanager
+def track_queries(timer):
+    """Feed timer every query run in this context, including from sync_to_async threads"""
+    token = _active_timers.set(_active_timers.get() + (timer,))
+    try:
+        yield timer
+    finally:
+        _active_timers.reset(token)
+
+
+class RequestProfilingMiddleware:
+    """
+    Records URL name, query count, SQL time, render time, response size and total latency for a
+    sample of requests (REQUEST_PROFILING_SAMPLE_RATE). Sampled requests get a Server-Timing header,
+    a structured log line on the launchpad.requests logger and an entry in the in-memory ring buffer
+    served at /api/_debug/requests. Unsampled requests go straight through.
+    Runs in whichever mode the handler does, so ASGI does not adapt the whole chain around it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'REQUEST_PROFILING_SAMPLE_RATE', 0.0)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # A sync hook would be run through sync_to_async, a thread hop per DRF response
+            self.process_template_response = self._aprocess_template_response
+
+    def _sampled(self):
+        return self.sample_rate and (self.sample_rate >= 1 or random.random() < self.sample_rate)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        timer = QueryTimer()
+        request._profiling = {'render': 0.0}
+        start = time.perf_counter()
+        with track_queries(timer):
+            response = self.get_response(request)
+        return self._record(request, response, timer, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        timer = QueryTimer()
+        request._profiling = {'render': 0.0}
+        start = time.perf_counter()
+        with track_queries(timer):
+            response = await self.get_response(request)
+        return self._record(request, response, timer, time.perf_counter() - start)
+
+    def _record(self, request, response, timer, total):
+        match = getattr(request, 'resolver_match', None)
+        url_name = match.url_name if match else None
+        if url_name == DEBUG_ENDPOINT_NAME:
+            return response
+
+        render = request._profiling['render']
+        response['Server-Timing'] = ', '.join((
+            f'db;dur={timer.duration * 1000:.1f};desc="{timer.count} queries"',
+            f'render;dur={render * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ))
+        record = {
+            'time': time.time(),
+            'method': request.method,
+            'path': request.path,
+            'url_name': url_name,
+            'status': response.status_code,
+            'queries': timer.count,
+            'db_ms': round(timer.duration * 1000, 2),
+            'render_ms': round(render * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+            'response_bytes': None if response.streaming else len(response.content),
+        }
+        _remember(record)
+        logger.info(json.dumps(record))
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF Responses are rendered after the view returns; time the renderer (JSON encoding)
+        profiling = getattr(request, '_profiling', None)
+        if profiling is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                profiling['render'] += time.perf_counter() - start
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    async def _aprocess_template_response(self, request, response):
+        return RequestProfilingMiddleware.process_template_response(self, request, response)
+
+
+class RequestProfileView(APIView):
+    permission_classes = [IsAdminUser]
+    DEFAULT_LIMIT = 100
+
+    def get(self, request):
+        """
+        Most recent sampled requests (newest first) plus per-URL-name aggregates over the buffer
+        Filters: ?url_name=, ?limit=
+        """
+        records = recent_requests()
+        url_name = request.query_params.get('url_name')
+        if url_name:
+            records = [record for record in records if record['url_name'] == url_name]
+
+        summary = {}
+        for record in records:
+            entry = summary.setdefault(record['url_name'], {'requests': 0, 'queries': 0, 'db_ms': 0.0, 'total_ms': []})
+            entry['requests'] += 1
+            entry['queries'] += record['queries']
+            entry['db_ms'] += record['db_ms']
+            entry['total_ms'].append(record['total_ms'])
+        for entry in summary.values():
+            latencies = sorted(entry.pop('total_ms'))
+            entry['avg_queries'] = round(entry.pop('queries') / entry['requests'], 1)
+            entry['avg_db_ms'] = round(entry.pop('db_ms') / entry['requests'], 2)
+            entry['p50_ms'] = latencies[len(latencies) // 2]
+            entry['p95_ms'] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+        try:
+            limit = int(request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+        return Response({
+            "sample_rate": getattr(settings, 'REQUEST_PROFILING_SAMPLE_RATE', 0.0),
+            "buffered": len(records),
+            "summary": summary,
+            "requests": records[::-1][:max(limit, 0)]
+        })
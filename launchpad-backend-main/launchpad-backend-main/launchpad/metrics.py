@@ -0,0 +1,108 @@
+import hmac
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+from .instrumentation import QueryTimer, track_queries
+
+# With PROMETHEUS_MULTIPROC_DIR set (before any worker starts), prometheus_client keeps these
+# values in per-process files in that directory and /metrics sums them across workers.
+HTTP_REQUESTS = Counter(
+    'launchpad_http_requests_total', 'HTTP requests by URL name, method and status code',
+    ['view', 'method', 'status'],
+)
+HTTP_LATENCY = Histogram(
+    'launchpad_http_request_duration_seconds', 'Request latency by URL name and method',
+    ['view', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERIES = Histogram(
+    'launchpad_db_queries_per_request', 'SQL queries issued per request by URL name',
+    ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+UPLOAD_BYTES = Counter(
+    'launchpad_upload_bytes_total', 'Bytes received in uploaded files by URL name',
+    ['view'],
+)
+LOGIN_ATTEMPTS = Counter(
+    'launchpad_login_attempts_total', 'Password logins by outcome (success/failure)',
+    ['outcome'],
+)
+JOB_APPLICATIONS = Counter(
+    'launchpad_job_applications_total', 'Job applications created',
+)
+
+UNMATCHED_VIEW = 'unmatched'
+
+
+class PrometheusMiddleware:
+    """
+    Per-request counters and histograms, labelled by the resolved URL name to keep cardinality bounded
+    Sync and async capable, so ASGI requests do not pay a thread hop to pass through it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with track_queries(timer):
+            response = self.get_response(request)
+        self._observe(request, response, timer, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with track_queries(timer):
+            response = await self.get_response(request)
+        self._observe(request, response, timer, time.perf_counter() - start)
+        return response
+
+    def _observe(self, request, response, timer, duration):
+        match = getattr(request, 'resolver_match', None)
+        view = (match.url_name or match.view_name) if match else UNMATCHED_VIEW
+        HTTP_REQUESTS.labels(view, request.method, str(response.status_code)).inc()
+        HTTP_LATENCY.labels(view, request.method).observe(duration)
+        DB_QUERIES.labels(view).observe(timer.count)
+
+        # Only count files someone already parsed; touching request.FILES here would parse the body
+        files = getattr(request, '_files', None)
+        if files:
+            uploaded = sum(f.size for f in files.values())
+            if uploaded:
+                UPLOAD_BYTES.labels(view).inc(uploaded)
+
+
+def _authorized(request):
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if not token:
+        return False
+    header = request.headers.get('Authorization', '')
+    return header.startswith('Bearer ') and hmac.compare_digest(header[7:], token)
+
+
+def metrics_view(request):
+    """Prometheus text exposition; scrapers authenticate with `Authorization: Bearer <METRICS_TOKEN>`"""
+    if not _authorized(request):
+        return HttpResponse('Forbidden', status=403, content_type='text/plain')
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
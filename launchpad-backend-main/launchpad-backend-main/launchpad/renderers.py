@@ -0,0 +1,41 @@
+import re
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# Numbers orjson writes differently from json.dumps: anything in exponent form (1e16 vs 1e+16) and
+# fractions in [1e-5, 1e-4), which orjson spells out (0.00001 vs 1e-05). Output containing one is
+# re-rendered the old way; a match inside a string only costs that fallback.
+_FLOAT_MISMATCH = re.compile(rb'(?:^|[:,\[])-?(?:\d+(?:\.\d+)?e|0\.0000)')
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson, producing the same bytes as the stock renderer
+    Values orjson does not handle natively (datetimes, Decimals, lazy strings, ...) go through the
+    same encoder_class.default as before. Pretty-printed output (?indent / the browsable API),
+    ASCII-only or non-compact settings, integers wider than 64 bits and floats orjson formats
+    differently are rendered by JSONRenderer itself. Finding those floats means scanning the output;
+    data marked may_contain_floats = False (launchpad.fastread.ReadRows) skips the scan. The one
+    difference: NaN and infinity, which JSONRenderer refuses under STRICT_JSON, come out as null.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.ensure_ascii or not self.compact or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if getattr(data, 'may_contain_floats', True) and _FLOAT_MISMATCH.search(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same strict-javascript-subset escaping as JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
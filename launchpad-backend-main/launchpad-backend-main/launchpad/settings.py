@@ -52,6 +52,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'launchpad.instrumentation.RequestProfilingMiddleware',  # Outermost so it times the whole stack
+    'launchpad.metrics.PrometheusMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # Added just before common for corsheader
@@ -96,8 +98,16 @@ AUTHENTICATION_BACKENDS = (
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'userManagement.authentication.CachedJWTAuthentication',
     ),
+    # orjson encoding with byte-identical output; falls back to JSONRenderer where they would differ
+    'DEFAULT_RENDERER_CLASSES': (
+        'launchpad.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    # Proxies in front of the app that append to X-Forwarded-For; throttles key on the address the
+    # nearest of them saw. 0 uses REMOTE_ADDR, so a client-sent X-Forwarded-For cannot pick its key.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', '0')),
 }
 
 SIMPLE_JWT = {
@@ -105,6 +115,35 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=60),
 }
 
+# CachedJWTAuthentication keeps resolved users this many seconds per worker, keyed by user id and
+# token version. Saving a user drops the entry in the saving worker; other workers see it on expiry.
+JWT_USER_CACHE_TTL = 60
+# Sign is_tpcstaff/is_active into tokens so role checks need no lookup at all. Role and activation
+# changes then reach requests that only check roles when the access token expires (or is refreshed).
+JWT_ROLE_CLAIMS = os.environ.get('JWT_ROLE_CLAIMS', '0') == '1'
+# Refresh-token blacklist checks read an in-process set (userManagement.blacklist), topped up from
+# the database at most this often (seconds); rotation still detects reuse through the database.
+# Run `manage.py prune_tokens` on a schedule to delete expired tokens.
+TOKEN_BLACKLIST_SYNC_INTERVAL = 5
+
+# Login verifies passwords in a pool of this many spawned processes (userManagement.hashing);
+# 0 hashes on the request thread. At most workers * LOGIN_HASH_QUEUE_SIZE logins wait for the pool,
+# beyond that login answers 503. Workers start on the first login.
+LOGIN_HASH_WORKERS = int(os.environ.get('LOGIN_HASH_WORKERS', os.cpu_count() or 1))
+LOGIN_HASH_QUEUE_SIZE = 8
+# Token buckets checked before any hashing: scope -> (burst capacity, tokens refilled per second).
+# Bucket state is a database row updated atomically, so the limits hold across all workers;
+# `manage.py prune_tokens` deletes buckets that have refilled.
+# login_ip is generous because a whole campus can share one NAT address. LOGIN_THROTTLE=0 disables both.
+LOGIN_THROTTLE_BUCKETS = {
+    'login_account': (5, 5 / 60),
+    'login_ip': (300, 5.0),
+} if os.environ.get('LOGIN_THROTTLE', '1') == '1' else {}
+
+# Most roster rows one HTTP import may create; hashing costs about 0.7s of CPU per row and runs
+# on the login pool above. Bigger rosters go through `python manage.py import_students`.
+STUDENT_IMPORT_MAX_ROWS = int(os.environ.get('STUDENT_IMPORT_MAX_ROWS', '200'))
+
 # ✅ Updated Database to SQLite instead of MySQL
 DATABASES = {
     'default': {
@@ -113,6 +152,29 @@ DATABASES = {
     }
 }
 
+# 'default' holds state every worker must agree on: unread badges, idempotency keys and cached
+# shortlists. It is Redis when REDIS_URL is set (needs the `redis` package), otherwise the database
+# cache table; run `python manage.py createcachetable` once per database. Django caps the database
+# cache at 300 keys and then culls a third of them in key order, which would start dropping
+# idempotency replies almost at once, so the cap is raised to CACHE_MAX_ENTRIES. 'local' is a
+# per-process cache for hot entries that tolerate a short TTL (JWT users). Nothing that must
+# survive eviction lives in either.
+REDIS_URL = os.environ.get('REDIS_URL', '')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'launchpad_cache',
+        'OPTIONS': {'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 1_000_000))},
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'launchpad-local',
+    },
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -142,5 +204,45 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Protected file downloads: 'x-accel' (nginx), 'x-sendfile' (Apache/lighttpd) or None to stream from Django
+FILE_DOWNLOAD_OFFLOAD = os.environ.get('FILE_DOWNLOAD_OFFLOAD') or None
+# nginx `internal` location aliased to MEDIA_ROOT, used with x-accel
+FILE_DOWNLOAD_ACCEL_PREFIX = os.environ.get('FILE_DOWNLOAD_ACCEL_PREFIX', '/protected-media/')
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Server-Sent Events (TPCActionCentreManagement.events). LocalBroker only fans out within one
+# worker process; swap in a shared-channel broker when running several ASGI workers.
+EVENT_STREAM_BROKER = os.environ.get('EVENT_STREAM_BROKER', 'TPCActionCentreManagement.events.LocalBroker')
+EVENT_STREAM_HEARTBEAT = 15
+EVENT_STREAM_HISTORY = 1000
+
+# Serve GET on AsyncReadAPIView subclasses, and login, through their async handlers (needs the ASGI
+# app; under WSGI each request pays for an async_to_sync bridge, so turn it off there)
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS', '1') == '1'
+
+# List endpoints serialize from values_list() rows through a per-serializer field plan
+# (launchpad.fastread) instead of building a model instance per row; same output either way
+FAST_READ_SERIALIZERS = os.environ.get('FAST_READ_SERIALIZERS', '1') == '1'
+
+# Per-request profiling (launchpad.instrumentation): fraction of requests that get query/timing
+# instrumentation, a Server-Timing header and an entry in the /api/_debug/requests ring buffer
+REQUEST_PROFILING_SAMPLE_RATE = float(os.environ.get('REQUEST_PROFILING_SAMPLE_RATE', '1.0' if DEBUG else '0'))
+REQUEST_PROFILING_BUFFER_SIZE = 500
+
+# Bearer token Prometheus must send to scrape /metrics; the endpoint answers 403 while unset.
+# For multi-worker deployments also export PROMETHEUS_MULTIPROC_DIR (an empty, shared directory)
+# before starting gunicorn; gunicorn.conf.py cleans up after exited workers.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'launchpad.requests': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
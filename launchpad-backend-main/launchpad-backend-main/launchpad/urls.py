@@ -18,6 +18,8 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf.urls.static import static
 from django.conf import settings
+from .instrumentation import DEBUG_ENDPOINT_NAME, RequestProfileView
+from .metrics import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -26,6 +28,9 @@ urlpatterns = [
     path('api/analytics-management/', include('analyticsManagement.urls')),
     path('api/tpc-action-centre-management/', include('TPCActionCentreManagement.urls')),
     path('api/student-key-feature-management/', include('studentKeyFeatureManagement.urls')),
+
+    path('api/_debug/requests', RequestProfileView.as_view(), name=DEBUG_ENDPOINT_NAME),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 if settings.DEBUG:
@@ -31,4 +31,25 @@ class StudentInternshipAdmin(TimestampedAdmin):
     list_display = ('student', 'organization_name', 'domain', 'internship_duration', 'approval_status', 'created_at')
     ordering = ['-created_at']
     list_filter = ['approval_status']
-    search_fields = ['student']
\ No newline at end of file
+    search_fields = ['student']
+
+@admin.register(Skill)
+class SkillAdmin(TimestampedAdmin):
+    list_display = ('name', 'created_at')
+    ordering = ['name']
+    search_fields = ['name']
+
+
+@admin.register(SkillAlias)
+class SkillAliasAdmin(TimestampedAdmin):
+    list_display = ('alias', 'skill', 'created_at')
+    list_select_related = ['skill']
+    ordering = ['alias']
+    search_fields = ['alias', 'skill__name']
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(TimestampedAdmin):
+    list_display = ('name', 'size', 'ref_count', 'created_at')
+    ordering = ['-created_at']
+    search_fields = ['name']
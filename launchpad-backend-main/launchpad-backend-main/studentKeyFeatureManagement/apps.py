@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class StudentkeyfeaturemanagementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'studentKeyFeatureManagement'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,87 @@
+import os
+
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import StoredBlob, StudentResume, StudentInternship
+from .storage import blob_storage, is_blob
+
+# Model -> file fields stored in the content-addressed blob store
+BLOB_FIELDS = {
+    StudentResume: ('resume_file',),
+    StudentInternship: ('certificate', 'experience_letter'),
+}
+
+
+def incref(name):
+    if not is_blob(name):
+        return
+    updated = StoredBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1)  # type: ignore
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            StoredBlob.objects.create(name=name, size=blob_storage.size(name), ref_count=1)  # type: ignore
+    except IntegrityError:
+        StoredBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1)  # type: ignore
+
+
+def _delete_if_unreferenced(name):
+    if not StoredBlob.objects.filter(name=name).exists():  # type: ignore
+        blob_storage.delete(name)
+
+
+def decref(name):
+    """
+    Drop one reference; the blob file is removed after commit once nothing points at it
+    """
+    if not is_blob(name):
+        return
+    with transaction.atomic():
+        blob = StoredBlob.objects.select_for_update().filter(name=name).first()  # type: ignore
+        if blob is None:
+            return
+        if blob.ref_count > 1:
+            StoredBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') - 1)  # type: ignore
+            return
+        blob.delete()
+    transaction.on_commit(lambda: _delete_if_unreferenced(name))
+
+
+def field_names(instance):
+    return {field: getattr(instance, field).name or '' for field in BLOB_FIELDS[type(instance)]}
+
+
+def migrate_to_blobs(model, delete_originals=False, stdout=None):
+    """
+    Copy legacy files of one model into the blob store and repoint the records
+    Returns (migrated, missing) counts
+    """
+    migrated = missing = 0
+    fields = BLOB_FIELDS[model]
+    for record in model.objects.only('id', *fields).iterator(chunk_size=500):
+        updates = {}
+        for field in fields:
+            name = getattr(record, field).name
+            if not name or is_blob(name):
+                continue
+            if not default_storage.exists(name):
+                missing += 1
+                if stdout:
+                    stdout.write(f"Missing file for {model.__name__} {record.pk}: {name}")
+                continue
+            with default_storage.open(name, 'rb') as legacy_file:
+                updates[field] = blob_storage.save(os.path.basename(name), legacy_file)
+        if not updates:
+            continue
+        with transaction.atomic():
+            # update() skips the save signals, so references are counted here
+            model.objects.filter(pk=record.pk).update(**updates)
+            for field, blob_name in updates.items():
+                incref(blob_name)
+        if delete_originals:
+            for field in updates:
+                default_storage.delete(getattr(record, field).name)
+        migrated += 1
+    return migrated, missing
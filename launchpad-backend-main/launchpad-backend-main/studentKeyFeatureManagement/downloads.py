@@ -0,0 +1,163 @@
+import mimetypes
+import os
+import re
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from .storage import is_blob
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def file_etag(field_file, stat):
+    # Blob names embed the SHA-256 of the content, which is the ideal strong validator
+    if is_blob(field_file.name):
+        return quote_etag(os.path.splitext(os.path.basename(field_file.name))[0])
+    return quote_etag(f'{stat.st_size:x}-{int(stat.st_mtime):x}')
+
+
+def etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    candidates = [candidate.strip() for candidate in header.split(',')]
+    return etag in candidates or f'W/{etag}' in candidates
+
+
+def not_modified(request, etag, last_modified):
+    """Evaluate If-None-Match, falling back to If-Modified-Since as RFC 9110 requires"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return if_modified_since is not None and int(last_modified) <= if_modified_since
+
+
+def parse_range(header, size):
+    """
+    Return (start, end) for a single satisfiable byte range, None to serve the whole file,
+    or False when the range cannot be satisfied
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if match is None:
+        # Absent, malformed or multi-range requests get the full representation
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def iter_range(path, start, end):
+    with open(path, 'rb') as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = handle.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def aiter_range(path, start, end):
+    """
+    iter_range as an async iterator: under ASGI a sync iterator is read into memory in full before
+    the first byte goes out. Reads run in a worker thread so the event loop never waits on disk.
+    """
+    read = sync_to_async(lambda handle, size: handle.read(size), thread_sensitive=False)
+    handle = await sync_to_async(open, thread_sensitive=False)(path, 'rb')
+    try:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await read(handle, min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
+
+
+def offload_response(field_file, path):
+    """
+    Hand the byte transfer to the front proxy when FILE_DOWNLOAD_OFFLOAD is configured
+    The proxy then handles Range itself; the worker only spends time on the permission check
+    """
+    mode = getattr(settings, 'FILE_DOWNLOAD_OFFLOAD', None)
+    if mode == 'x-accel':
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = settings.FILE_DOWNLOAD_ACCEL_PREFIX.rstrip('/') + '/' + field_file.name
+        return response
+    if mode == 'x-sendfile':
+        response = HttpResponse()
+        response['X-Sendfile'] = path
+        return response
+    return None
+
+
+def serve_file(request, field_file, download_name=None, asynchronous=False):
+    """
+    Serve a stored file with ETag/Last-Modified validators and single-range support
+    Pass asynchronous=True from async views so ASGI streams the body instead of buffering it
+    """
+    path = field_file.path
+    stat = os.stat(path)
+    etag = file_etag(field_file, stat)
+    last_modified = stat.st_mtime
+
+    if not_modified(request, etag, last_modified):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    response = offload_response(field_file, path)
+    if response is None:
+        byte_range = parse_range(request.META.get('HTTP_RANGE'), stat.st_size)
+        # A stale If-Range means the client's partial copy is outdated, so send everything
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if byte_range and if_range and if_range.strip() != etag:
+            byte_range = None
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+            return response
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse((aiter_range if asynchronous else iter_range)(path, start, end), status=206)
+            response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+            response['Content-Length'] = str(end - start + 1)
+        elif asynchronous:
+            response = StreamingHttpResponse(aiter_range(path, 0, stat.st_size - 1))
+            response['Content-Length'] = str(stat.st_size)
+        else:
+            # FileResponse lets the WSGI server use sendfile() via wsgi.file_wrapper
+            response = FileResponse(open(path, 'rb'))
+            response['Content-Length'] = str(stat.st_size)
+
+    response['Content-Type'] = content_type
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    if download_name:
+        response['Content-Disposition'] = f'inline; filename="{download_name}"'
+    return response
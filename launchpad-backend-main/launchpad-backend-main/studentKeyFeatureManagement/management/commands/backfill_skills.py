@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from studentKeyFeatureManagement.skills import backfill_skills
+
+
+class Command(BaseCommand):
+    help = "Normalize skills from student skills, projects and job posts and rebuild the skill link tables"
+
+    def handle(self, *args, **options):
+        summary = backfill_skills()
+        for name, count in summary.items():
+            self.stdout.write(f"{name}: {count}")
+        self.stdout.write(self.style.SUCCESS("Skill backfill complete"))
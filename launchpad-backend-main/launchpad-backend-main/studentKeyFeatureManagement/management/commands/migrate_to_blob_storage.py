@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from studentKeyFeatureManagement.blobs import BLOB_FIELDS, migrate_to_blobs
+
+
+class Command(BaseCommand):
+    help = "Move existing resumes and internship documents into the content-addressed blob store"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--delete-originals', action='store_true', help="Remove the legacy files after they are copied")
+
+    def handle(self, *args, **options):
+        for model in BLOB_FIELDS:
+            migrated, missing = migrate_to_blobs(model, delete_originals=options['delete_originals'], stdout=self.stdout)
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {migrated} records migrated, {missing} files missing"))
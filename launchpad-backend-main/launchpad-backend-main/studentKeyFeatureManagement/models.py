@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils.html import MAX_URL_LENGTH
 from userManagement.models import CustomUser
+from .storage import get_blob_storage
 
 # Create your models here.
 
@@ -12,9 +13,27 @@ class BaseModel(models.Model):
         abstract = True
 
 
+# Canonical skill vocabulary shared by student skills, projects and job posts
+class Skill(BaseModel):
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return f"{self.name}"
+
+
+# Alternate spellings resolved to a canonical skill, e.g. "reactjs" -> "react"
+class SkillAlias(BaseModel):
+    alias = models.CharField(max_length=100, unique=True)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+
+    def __str__(self):
+        return f"{self.alias} -> {self.skill}"
+
+
 class StudentSkill(BaseModel):
     related_user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='related_user_skills')
     skill_name = models.CharField(max_length=100)
+    skill = models.ForeignKey(Skill, on_delete=models.SET_NULL, related_name='student_skills', null=True, blank=True)
 
     def __str__(self):
         return f"{self.skill_name}"
@@ -27,6 +46,7 @@ class StudentProject(BaseModel):
     project_github_link = models.URLField(blank=True, null=True)
     project_summary = models.TextField(blank=True, null=True)
     skills_involved = models.CharField(max_length=255, blank=True, null=True)
+    skills = models.ManyToManyField(Skill, related_name='projects', blank=True)
 
     def __str__(self):
         return f"{self.project_title}"
@@ -34,7 +54,7 @@ class StudentProject(BaseModel):
 
 class StudentResume(BaseModel):
     related_user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='related_user_resumes')
-    resume_file = models.FileField(upload_to='resumes/')
+    resume_file = models.FileField(upload_to='resumes/', storage=get_blob_storage)
     is_default = models.BooleanField(default=False) # type: ignore
 
     def __str__(self):
@@ -47,10 +67,35 @@ class StudentInternship(BaseModel):
     domain = models.CharField(max_length=100)
     internship_duration = models.CharField(max_length=100)
     internship_description = models.TextField()
-    certificate = models.FileField(upload_to='internships-certificate/', blank=True, null=True)
-    experience_letter = models.FileField(upload_to='internships-experience-letter/', blank=True, null=True)
+    certificate = models.FileField(upload_to='internships-certificate/', storage=get_blob_storage, blank=True, null=True)
+    experience_letter = models.FileField(upload_to='internships-experience-letter/', storage=get_blob_storage, blank=True, null=True)
     approval_status = models.CharField(max_length=100, default='Pending') # type: ignore
     approved_by = models.ForeignKey(CustomUser, on_delete=models.SET_NULL, related_name='approved_internships', null=True, blank=True, limit_choices_to={'is_tpcstaff': True})
 
     def __str__(self):
-        return f"{self.student} - {self.organization_name}"
\ No newline at end of file
+        return f"{self.student} - {self.organization_name}"
+
+
+# Inverted index of every canonical skill a student has, from StudentSkill rows and project skills
+class UserSkill(BaseModel):
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='indexed_skills')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='indexed_users')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['skill', 'user'], name='unique_user_skill'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.skill}"
+
+
+
+# One row per stored blob, counting the file fields that point at it
+class StoredBlob(BaseModel):
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField(default=0) # type: ignore
+    ref_count = models.IntegerField(default=0) # type: ignore
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
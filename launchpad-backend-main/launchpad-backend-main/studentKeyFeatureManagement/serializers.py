@@ -5,7 +5,8 @@ from .models import *
 class StudentSkillSerializer(serializers.ModelSerializer):
     class Meta:
         model = StudentSkill
-        fields = '__all__'
+        # The canonical skill link is derived from skill_name by studentKeyFeatureManagement.signals
+        exclude = ('skill',)
 
 
 class StudentProjectSerializer(serializers.ModelSerializer):
@@ -0,0 +1,59 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import StudentSkill, StudentProject, StudentResume, StudentInternship
+from .skills import link_student_skill, link_project, refresh_user_skills
+from .blobs import BLOB_FIELDS, field_names, incref, decref
+
+
+@receiver(post_save, sender=StudentSkill)
+def link_student_skill_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    link_student_skill(instance)
+    refresh_user_skills(instance.related_user_id)
+
+
+@receiver(post_save, sender=StudentProject)
+def link_project_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    link_project(instance)
+    refresh_user_skills(instance.related_user_id)
+
+
+@receiver(post_delete, sender=StudentSkill)
+@receiver(post_delete, sender=StudentProject)
+def unindex_skills_on_delete(sender, instance, **kwargs):
+    refresh_user_skills(instance.related_user_id, allow_create=False)
+
+
+# --------------------------------------------Blob reference counting----------------------------------------------- #
+
+@receiver(pre_save, sender=StudentResume)
+@receiver(pre_save, sender=StudentInternship)
+def capture_previous_blobs(sender, instance, raw=False, **kwargs):
+    instance._previous_blobs = {}
+    if instance.pk and not raw:
+        previous = sender.objects.filter(pk=instance.pk).values(*BLOB_FIELDS[sender]).first()
+        instance._previous_blobs = previous or {}
+
+
+@receiver(post_save, sender=StudentResume)
+@receiver(post_save, sender=StudentInternship)
+def count_blob_references_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_blobs', {})
+    for field, name in field_names(instance).items():
+        old_name = previous.get(field) or ''
+        if name != old_name:
+            incref(name)
+            decref(old_name)
+
+
+@receiver(post_delete, sender=StudentResume)
+@receiver(post_delete, sender=StudentInternship)
+def release_blobs_on_delete(sender, instance, **kwargs):
+    for name in field_names(instance).values():
+        decref(name)
@@ -0,0 +1,198 @@
+import re
+
+from django.db import transaction
+from django.db.models import Count
+
+from .models import Skill, SkillAlias, StudentSkill, StudentProject, UserSkill
+
+# Built-in spellings folded onto one canonical name; admins can add more through SkillAlias
+DEFAULT_SKILL_ALIASES = {
+    'reactjs': 'react',
+    'react.js': 'react',
+    'react js': 'react',
+    'nodejs': 'node.js',
+    'node': 'node.js',
+    'node js': 'node.js',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'python3': 'python',
+    'golang': 'go',
+    'cpp': 'c++',
+    'c plus plus': 'c++',
+    'postgres': 'postgresql',
+    'ml': 'machine learning',
+    'dl': 'deep learning',
+    'ai': 'artificial intelligence',
+    'nextjs': 'next.js',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'angularjs': 'angular',
+    'tailwindcss': 'tailwind css',
+    'drf': 'django rest framework',
+}
+
+SKILL_SEPARATORS = re.compile(r'[,;/|\n]+')
+WHITESPACE = re.compile(r'\s+')
+BATCH_SIZE = 1000
+
+
+def split_skills(text):
+    """Split a comma-joined skills string into its raw entries"""
+    if not text:
+        return []
+    return [part for part in SKILL_SEPARATORS.split(text) if part.strip()]
+
+
+def load_aliases():
+    aliases = dict(DEFAULT_SKILL_ALIASES)
+    aliases.update(SkillAlias.objects.values_list('alias', 'skill__name'))  # type: ignore
+    return aliases
+
+
+def normalize_skill(raw, aliases):
+    # Only trailing periods go ('Python.'); a leading one is part of names like '.net'
+    name = WHITESPACE.sub(' ', raw.strip().lower()).rstrip(' .')
+    return aliases.get(name, name)[:100]
+
+
+def resolve_skills(raw_names, aliases=None):
+    """
+    Map raw skill strings to canonical Skill ids, creating unseen skills in bulk
+    Returns {canonical name: skill id}
+    """
+    aliases = load_aliases() if aliases is None else aliases
+    names = {normalize_skill(raw, aliases) for raw in raw_names}
+    names.discard('')
+    if not names:
+        return {}
+    known = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))  # type: ignore
+    missing = names - known.keys()
+    if missing:
+        Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True, batch_size=BATCH_SIZE)  # type: ignore
+        known.update(Skill.objects.filter(name__in=missing).values_list('name', 'id'))  # type: ignore
+    return known
+
+
+def canonical_skill_ids(raw_names):
+    """Look up existing canonical skill ids without creating anything; unknown names map to None"""
+    aliases = load_aliases()
+    names = [normalize_skill(raw, aliases) for raw in raw_names]
+    known = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))  # type: ignore
+    return {name: known.get(name) for name in names if name}
+
+
+# --------------------------------------------Link maintenance----------------------------------------------- #
+
+def link_student_skill(student_skill):
+    skill_ids = resolve_skills([student_skill.skill_name])
+    skill_id = next(iter(skill_ids.values()), None)
+    if student_skill.skill_id != skill_id:
+        # update() rather than save() so the post_save handler is not re-entered
+        StudentSkill.objects.filter(pk=student_skill.pk).update(skill_id=skill_id)  # type: ignore
+        student_skill.skill_id = skill_id
+
+
+def link_project(project):
+    project.skills.set(resolve_skills(split_skills(project.skills_involved)).values())
+
+
+def link_job_post(job_post):
+    job_post.skills.set(resolve_skills(split_skills(job_post.skills_required)).values())
+
+
+def refresh_user_skills(user_id, allow_create=True):
+    """
+    Re-sync a student's row set in the UserSkill inverted index with their skills and projects
+    Deletes pass allow_create=False: they can only remove skills, and the user may itself be mid-delete
+    """
+    current = set(StudentSkill.objects.filter(related_user_id=user_id, skill__isnull=False).values_list('skill_id', flat=True))  # type: ignore
+    current |= set(StudentProject.skills.through.objects.filter(studentproject__related_user_id=user_id).values_list('skill_id', flat=True))
+    indexed = set(UserSkill.objects.filter(user_id=user_id).values_list('skill_id', flat=True))  # type: ignore
+
+    stale = indexed - current
+    if stale:
+        UserSkill.objects.filter(user_id=user_id, skill_id__in=stale).delete()  # type: ignore
+    added = current - indexed
+    if added and allow_create:
+        UserSkill.objects.bulk_create([UserSkill(user_id=user_id, skill_id=skill_id) for skill_id in added], ignore_conflicts=True)  # type: ignore
+
+
+@transaction.atomic
+def backfill_skills():
+    """
+    Resolve every skill string in the three sources and rebuild all link tables and the inverted index
+    Returns a summary dict of row counts
+    """
+    from TPCActionCentreManagement.models import JobPost
+
+    aliases = load_aliases()
+
+    skill_rows = list(StudentSkill.objects.values_list('id', 'related_user_id', 'skill_name'))  # type: ignore
+    project_rows = [
+        (project_id, user_id, split_skills(text))
+        for project_id, user_id, text in StudentProject.objects.values_list('id', 'related_user_id', 'skills_involved')  # type: ignore
+    ]
+    job_rows = [(job_id, split_skills(text)) for job_id, text in JobPost.objects.values_list('id', 'skills_required')]  # type: ignore
+
+    raw_names = [name for _, _, name in skill_rows]
+    raw_names += [name for _, _, names in project_rows for name in names]
+    raw_names += [name for _, names in job_rows for name in names]
+    skill_ids = resolve_skills(raw_names, aliases)
+
+    def ids_for(names):
+        found = (skill_ids.get(normalize_skill(name, aliases)) for name in names)
+        return {skill_id for skill_id in found if skill_id}
+
+    # StudentSkill -> Skill foreign keys
+    student_skills = []
+    user_skill_pairs = set()
+    for pk, user_id, name in skill_rows:
+        skill_id = skill_ids.get(normalize_skill(name, aliases))
+        student_skills.append(StudentSkill(pk=pk, skill_id=skill_id))
+        if skill_id:
+            user_skill_pairs.add((user_id, skill_id))
+    StudentSkill.objects.bulk_update(student_skills, ['skill'], batch_size=BATCH_SIZE)  # type: ignore
+
+    # Project and job post link tables
+    ProjectSkill = StudentProject.skills.through
+    ProjectSkill.objects.all().delete()
+    project_links = []
+    for project_id, user_id, names in project_rows:
+        for skill_id in ids_for(names):
+            project_links.append(ProjectSkill(studentproject_id=project_id, skill_id=skill_id))
+            user_skill_pairs.add((user_id, skill_id))
+    ProjectSkill.objects.bulk_create(project_links, batch_size=BATCH_SIZE)
+
+    JobPostSkill = JobPost.skills.through
+    JobPostSkill.objects.all().delete()
+    job_links = [JobPostSkill(jobpost_id=job_id, skill_id=skill_id) for job_id, names in job_rows for skill_id in ids_for(names)]
+    JobPostSkill.objects.bulk_create(job_links, batch_size=BATCH_SIZE)
+
+    # Inverted index
+    UserSkill.objects.all().delete()  # type: ignore
+    UserSkill.objects.bulk_create(  # type: ignore
+        [UserSkill(user_id=user_id, skill_id=skill_id) for user_id, skill_id in user_skill_pairs], batch_size=BATCH_SIZE
+    )
+
+    return {
+        'skills': len(skill_ids),
+        'student_skills': len(student_skills),
+        'project_links': len(project_links),
+        'job_post_links': len(job_links),
+        'user_skills': len(user_skill_pairs),
+    }
+
+
+def students_with_all_skills(raw_names):
+    """
+    Ids of students having every requested skill, answered from the UserSkill index
+    Returns (canonical names, queryset of user ids); any unknown skill means no student can match
+    """
+    resolved = canonical_skill_ids(raw_names)
+    if not resolved or None in resolved.values():
+        return list(resolved), UserSkill.objects.none().values_list('user_id', flat=True)  # type: ignore
+    skill_ids = set(resolved.values())
+    user_ids = UserSkill.objects.filter(skill_id__in=skill_ids).values('user_id') \
+        .annotate(matched=Count('skill_id')).filter(matched=len(skill_ids)).values_list('user_id', flat=True)  # type: ignore
+    return list(resolved), user_ids
@@ -0,0 +1,66 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+BLOB_PREFIX = 'blobs'
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores every upload once under blobs/<aa>/<bb>/<sha256><ext>
+    The digest is computed while the upload streams to a temp file, so identical files share one blob
+    and the two-level shard keeps each directory small. Deleting is left to the reference counting
+    in studentKeyFeatureManagement.blobs, since one blob may back several records.
+    """
+
+    def blob_name(self, digest, original_name):
+        extension = os.path.splitext(original_name)[1].lower()
+        return '/'.join([BLOB_PREFIX, digest[:2], digest[2:4], f'{digest}{extension}'])
+
+    def get_available_name(self, name, max_length=None):
+        # Names are derived from content, so an existing blob with this name is the same file
+        return name
+
+    def _save(self, name, content):
+        tmp_dir = self.path(os.path.join(BLOB_PREFIX, 'tmp'))
+        os.makedirs(tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        handle, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(handle, 'wb') as tmp_file:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks(HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                    tmp_file.write(chunk)
+
+            name = self.blob_name(digest.hexdigest(), name)
+            final_path = self.path(name)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(tmp_path, self.file_permissions_mode)
+                os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return name
+
+
+def is_blob(name):
+    return bool(name) and name.startswith(BLOB_PREFIX + '/')
+
+
+blob_storage = ContentAddressedStorage()
+
+
+def get_blob_storage():
+    return blob_storage
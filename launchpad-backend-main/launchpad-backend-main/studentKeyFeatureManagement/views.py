@@ -2,55 +2,84 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
+from launchpad.asyncapi import AsyncReadAPIView
+from launchpad.fastread import aserialize_list, serialize_list
 from .models import *
 from .serializers import *
+from .skills import split_skills, students_with_all_skills
+from .downloads import serve_file
+import os
 
 # Create your views here.
 
-class SkillView(APIView):
+class SkillView(AsyncReadAPIView):
     serializer_class = StudentSkillSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         # Only used internally, not by DRF generics
+        if self.request.user.is_tpcstaff:
+            user_id = self.request.query_params.get('user_id')
+            if user_id:
+                return StudentSkill.objects.filter(related_user__id=user_id) # type: ignore
+            return StudentSkill.objects.all() # type: ignore
         return StudentSkill.objects.filter(related_user=self.request.user)  # type: ignore
 
     def get(self, request):
         """Get skills: students see their own, TPC staff can filter by user id"""
-        if request.user.is_tpcstaff:
-            user_id = request.query_params.get('user_id')
-            if user_id:
-                queryset = StudentSkill.objects.filter(related_user__id=user_id) # type: ignore
-            else:
-                queryset = StudentSkill.objects.all() # type: ignore
-        else:
-            queryset = StudentSkill.objects.filter(related_user=request.user) # type: ignore
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return Response(serialize_list(self.serializer_class, self.get_queryset()))
+
+    async def aget(self, request):
+        return Response(await aserialize_list(self.serializer_class, self.get_queryset()))
 
     def perform_create(self, serializer):
         serializer.save(related_user=self.request.user)
 
-class ProjectView(APIView):
+class SkillSearchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Find students who have every listed skill, e.g. ?skills=react,python"""
+        if not request.user.is_tpcstaff:
+            return Response(
+                {"error": "Only TPC staff can search students by skill"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        raw_skills = split_skills(request.query_params.get('skills', ''))
+        if not raw_skills:
+            return Response(
+                {"error": "skills query parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        skills, user_ids = students_with_all_skills(raw_skills)
+        students = CustomUser.objects.filter(id__in=user_ids).order_by('id') \
+            .values('id', 'username', 'full_name')  # type: ignore
+        students = list(students)
+        return Response({
+            "skills": skills,
+            "count": len(students),
+            "students": students
+        })
+
+class ProjectView(AsyncReadAPIView):
     serializer_class = StudentProjectSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
+        if self.request.user.is_tpcstaff:
+            user_id = self.request.query_params.get('user_id')
+            if user_id:
+                return StudentProject.objects.filter(related_user__id=user_id) # type: ignore
+            return StudentProject.objects.all() # type: ignore
         return StudentProject.objects.filter(related_user=self.request.user)  # type: ignore
 
     def get(self, request):
         """Get projects: students see their own, TPC staff can filter by user id"""
-        if request.user.is_tpcstaff:
-            user_id = request.query_params.get('user_id')
-            if user_id:
-                queryset = StudentProject.objects.filter(related_user__id=user_id) # type: ignore
-            else:
-                queryset = StudentProject.objects.all() # type: ignore
-        else:
-            queryset = StudentProject.objects.filter(related_user=request.user) # type: ignore
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return Response(serialize_list(self.serializer_class, self.get_queryset()))
+
+    async def aget(self, request):
+        return Response(await aserialize_list(self.serializer_class, self.get_queryset()))
 
     def post(self, request):
         """Create new project - only students can create"""
@@ -84,7 +113,7 @@ class ProjectView(APIView):
     def perform_create(self, serializer):
         serializer.save(related_user=self.request.user)
 
-class StudentResumeView(APIView):
+class StudentResumeView(AsyncReadAPIView):
     serializer_class = StudentResumeSerializer
     permission_classes = [IsAuthenticated]
     MAX_RESUMES_PER_USER = 4
@@ -95,13 +124,17 @@ class StudentResumeView(APIView):
         else:
             return StudentResume.objects.filter(related_user=self.request.user)  # type: ignore
 
+    @staticmethod
+    def can_view(user, resume):
+        return user.is_tpcstaff or resume.related_user_id == user.id
+
     def get(self, request, resume_id=None):
         """Get resumes - TPC staff see default resumes, students see only their own"""
         if resume_id:
             # Get specific resume
             resume = get_object_or_404(StudentResume, id=resume_id)
             # Students can only view their own resumes
-            if not request.user.is_tpcstaff and resume.related_user != request.user:
+            if not self.can_view(request.user, resume):
                 return Response(
                     {"error": "You can only view your own resumes"}, 
                     status=status.HTTP_403_FORBIDDEN
@@ -110,9 +143,18 @@ class StudentResumeView(APIView):
             return Response(serializer.data)
         else:
             # Get all resumes (filtered by user role)
-            queryset = self.get_queryset()
-            serializer = self.serializer_class(queryset, many=True)
-            return Response(serializer.data)
+            return Response(serialize_list(self.serializer_class, self.get_queryset()))
+
+    async def aget(self, request, resume_id=None):
+        if resume_id:
+            resume = await aget_object_or_404(StudentResume, id=resume_id)
+            if not self.can_view(request.user, resume):
+                return Response(
+                    {"error": "You can only view your own resumes"}, 
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            return Response(self.serializer_class(resume).data)
+        return Response(await aserialize_list(self.serializer_class, self.get_queryset()))
 
     def post(self, request):
         """Create new resume - check 4-resume limit for students"""
@@ -185,7 +227,31 @@ class StudentResumeView(APIView):
         resume.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-class StudentInternshipView(APIView):
+class StudentResumeDownloadView(AsyncReadAPIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, resume_id):
+        """Download a resume file - same access rules as viewing it; supports Range and conditional requests"""
+        return self.download(request, get_object_or_404(StudentResume, id=resume_id), asynchronous=False)
+
+    async def aget(self, request, resume_id):
+        return self.download(request, await aget_object_or_404(StudentResume, id=resume_id), asynchronous=True)
+
+    def download(self, request, resume, asynchronous):
+        if not StudentResumeView.can_view(request.user, resume):
+            return Response(
+                {"error": "You can only view your own resumes"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if not resume.resume_file or not resume.resume_file.storage.exists(resume.resume_file.name):
+            return Response(
+                {"error": "Resume file not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        extension = os.path.splitext(resume.resume_file.name)[1]
+        return serve_file(request, resume.resume_file, download_name=f"resume-{resume.id}{extension}", asynchronous=asynchronous)
+
+class StudentInternshipView(AsyncReadAPIView):
     serializer_class = StudentInternshipSerializer
     permission_classes = [IsAuthenticated]
 
@@ -212,9 +278,19 @@ class StudentInternshipView(APIView):
             return Response(serializer.data)
         else:
             # Get all internships (filtered by user role)
-            queryset = self.get_queryset()
-            serializer = self.serializer_class(queryset, many=True)
-            return Response(serializer.data)
+            return Response(serialize_list(self.serializer_class, self.get_queryset()))
+
+    async def aget(self, request, internship_id=None):
+        if internship_id:
+            internship = await aget_object_or_404(StudentInternship, id=internship_id)
+            # Compare ids: following internship.student would be a sync query
+            if not request.user.is_tpcstaff and internship.student_id != request.user.id:
+                return Response(
+                    {"error": "You can only view your own internships"}, 
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            return Response(self.serializer_class(internship).data)
+        return Response(await aserialize_list(self.serializer_class, self.get_queryset()))
 
     def post(self, request):
         """Create new internship - only students can create"""
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db.models import F
+from .authentication import forget_user
 from .models import *
 
 # Register your models here.
@@ -12,6 +14,27 @@ class CustomUserAdmin(TimestampedAdmin):
     list_filter = ['is_active', 'is_verified', 'is_staff', 'is_tpcstaff', 'is_superuser']
     ordering = ['-created_at']
     search_fields = ['username']
+    readonly_fields = TimestampedAdmin.readonly_fields + ('token_version',)
+    actions = ['deactivate_users']
+    # Changing any of these revokes the user's issued tokens
+    TOKEN_REVOKING_FIELDS = {'is_active', 'is_tpcstaff', 'is_staff', 'is_superuser', 'password'}
+
+    def save_model(self, request, obj, form, change):
+        if change and self.TOKEN_REVOKING_FIELDS & set(form.changed_data):
+            forget_user(obj)
+            obj.token_version += 1
+        super().save_model(request, obj, form, change)
+
+    @admin.action(description="Deactivate selected users and revoke their tokens")
+    def deactivate_users(self, request, queryset):
+        users = list(queryset)
+        queryset.update(is_active=False, token_version=F('token_version') + 1)
+        for user in users:
+            forget_user(user)
+        # update() sends no post_save, so drop the deactivated students from cached shortlists here
+        from TPCActionCentreManagement.ranking import invalidate_shortlists
+        invalidate_shortlists()
+        self.message_user(request, f"Deactivated {len(users)} user(s)")
 
 
 @admin.register(AcademicDetail)
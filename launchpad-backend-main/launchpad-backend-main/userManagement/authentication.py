@@ -0,0 +1,94 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+USER_CACHE_PREFIX = 'jwt-user'
+# Per-process on purpose: a shared cache would cost a round trip per request, like the SELECT it saves
+cache = caches['local']
+TOKEN_VERSION_CLAIM = 'token_version'
+# Signed into tokens when JWT_ROLE_CLAIMS is on
+ROLE_CLAIMS = ('is_tpcstaff', 'is_active')
+
+
+def user_cache_key(user_id, token_version):
+    return f'{USER_CACHE_PREFIX}:{user_id}:{token_version}'
+
+
+def forget_user(user, token_version=None):
+    """Drop this process's cached copy of a user (other workers' copies expire after JWT_USER_CACHE_TTL)"""
+    cache.delete(user_cache_key(user.pk, user.token_version if token_version is None else token_version))
+
+
+def issue_tokens(user):
+    """
+    Refresh token for user carrying its token version, plus the role flags when JWT_ROLE_CLAIMS is on
+    Access tokens derived from it (refresh.access_token) copy the claims
+    """
+    refresh = RefreshToken.for_user(user)
+    refresh[TOKEN_VERSION_CLAIM] = user.token_version
+    if getattr(settings, 'JWT_ROLE_CLAIMS', False):
+        for claim in ROLE_CLAIMS:
+            refresh[claim] = getattr(user, claim)
+    return refresh
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    request.user built from signed claims: id/pk and the role flags answer without a lookup,
+    any other attribute loads the real user (through the cache) on first use
+    """
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, claims, load_user):
+        super().__init__(load_user)
+        for name, value in claims.items():
+            object.__setattr__(self, name, value)
+
+    def __bool__(self):
+        return True
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the user from the cache, keyed by user id and token version,
+    instead of a SELECT per request. Entries live JWT_USER_CACHE_TTL seconds; saving a user drops
+    the entry (userManagement.signals). Tokens whose version is older than the user's are rejected,
+    so bumping CustomUser.token_version revokes every token issued before it.
+    """
+
+    def get_user(self, validated_token):
+        if getattr(settings, 'JWT_ROLE_CLAIMS', False) and all(claim in validated_token for claim in ROLE_CLAIMS):
+            return self.get_claims_user(validated_token)
+        return self.get_cached_user(validated_token)
+
+    def get_cached_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        token_version = validated_token.get(TOKEN_VERSION_CLAIM, 0)
+        key = user_cache_key(user_id, token_version)
+
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            if user.token_version != token_version:
+                raise AuthenticationFailed("Token has been revoked", code='token_revoked')
+            cache.set(key, user, getattr(settings, 'JWT_USER_CACHE_TTL', 60))
+        return user
+
+    def get_claims_user(self, validated_token):
+        # A full entry already in the cache is as cheap as the claims and checks the token version
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = cache.get(user_cache_key(user_id, validated_token.get(TOKEN_VERSION_CLAIM, 0)))
+        if user is not None:
+            return user
+        if not validated_token['is_active']:
+            raise AuthenticationFailed("User is inactive", code='user_inactive')
+        claims = {'id': user_id, 'pk': user_id, **{claim: validated_token[claim] for claim in ROLE_CLAIMS}}
+        return ClaimsUser(claims, lambda: self.get_cached_user(validated_token))
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+class BlacklistFilter:
+    """
+    In-process set of blacklisted refresh-token jtis, so checking a valid token costs no query
+    Loaded from the token_blacklist tables on first use, then topped up with rows added since the
+    last sync at most every TOKEN_BLACKLIST_SYNC_INTERVAL seconds. Tokens blacklisted by this
+    process are added immediately; another worker's additions show up after the next sync.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jtis = set()
+        self._last_id = None
+        self._synced_at = 0.0
+
+    def sync(self, force=False):
+        interval = getattr(settings, 'TOKEN_BLACKLIST_SYNC_INTERVAL', 5)
+        if not force and time.monotonic() - self._synced_at < interval:
+            return
+        with self._lock:
+            if not force and time.monotonic() - self._synced_at < interval:
+                return
+            if self._last_id is None:
+                # Expired tokens fail signature verification anyway; only live ones need remembering
+                rows = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())  # type: ignore
+                self._jtis = set()
+                self._last_id = 0
+            else:
+                rows = BlacklistedToken.objects.filter(id__gt=self._last_id)  # type: ignore
+            for row_id, jti in rows.order_by('id').values_list('id', 'token__jti').iterator():
+                self._jtis.add(jti)
+                self._last_id = max(self._last_id, row_id)
+            self._synced_at = time.monotonic()
+
+    def add(self, jti):
+        self._jtis.add(jti)
+
+    def reset(self):
+        with self._lock:
+            self._last_id = None
+            self._synced_at = 0.0
+
+    def __contains__(self, jti):
+        self.sync()
+        return jti in self._jtis
+
+    def __len__(self):
+        return len(self._jtis)
+
+
+blacklist_filter = BlacklistFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    RefreshToken whose blacklist check goes through blacklist_filter instead of a query per use
+    A stale filter can let an already-blacklisted token through verify(), which is why rotation
+    relies on blacklist() reporting whether the token was already blacklisted.
+    """
+
+    def check_blacklist(self):
+        if self.payload[api_settings.JTI_CLAIM] in blacklist_filter:
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        """
+        Blacklist this token in the database and the local filter
+        Returns (BlacklistedToken, created); created is False if it was blacklisted before
+        """
+        jti = self.payload[api_settings.JTI_CLAIM]
+        outstanding, _ = OutstandingToken.objects.get_or_create(  # type: ignore
+            jti=jti,
+            defaults={
+                'user_id': self.payload.get(api_settings.USER_ID_CLAIM),
+                'created_at': self.current_time,
+                'token': str(self),
+                'expires_at': datetime_from_epoch(self.payload['exp']),
+            },
+        )
+        result = BlacklistedToken.objects.get_or_create(token=outstanding)  # type: ignore
+        transaction.on_commit(lambda: blacklist_filter.add(jti))
+        return result
+
+
+def prune_expired_tokens(batch_size=1000, now=None):
+    """
+    Delete expired outstanding tokens and their blacklist entries, batch_size at a time
+    Returns (outstanding deleted, blacklisted deleted)
+    """
+    now = now or timezone.now()
+    outstanding_deleted = blacklisted_deleted = 0
+    while True:
+        ids = list(OutstandingToken.objects.filter(expires_at__lte=now).order_by('id').values_list('id', flat=True)[:batch_size])  # type: ignore
+        if not ids:
+            break
+        _, deleted = OutstandingToken.objects.filter(id__in=ids).delete()  # type: ignore
+        outstanding_deleted += deleted.get(OutstandingToken._meta.label, 0)
+        blacklisted_deleted += deleted.get(BlacklistedToken._meta.label, 0)
+    return outstanding_deleted, blacklisted_deleted
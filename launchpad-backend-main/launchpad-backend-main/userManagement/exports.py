@@ -0,0 +1,90 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Output column -> ORM path, read with .values() so no model instances are built per row
+EXPORT_COLUMNS = {
+    'id': 'id',
+    'email': 'username',
+    'full_name': 'full_name',
+    'phone_number': 'phone_number',
+    'father_name': 'father_name',
+    'dob': 'dob',
+    'gender': 'gender',
+    'alternate_email': 'alternate_email',
+    'github_link': 'github_link',
+    'linkedin_link': 'linkedin_link',
+    'is_verified': 'is_verified',
+    'roll_number': 'academic_details__roll_number',
+    'degree': 'academic_details__degree',
+    'branch': 'academic_details__branch',
+    'semester': 'academic_details__semester',
+    'batch': 'academic_details__batch',
+    'cpi': 'academic_details__cpi',
+    'matriculation_school_name': 'education_details__matriculation_school_name',
+    'matriculation_board': 'education_details__matriculation_board',
+    'matriculation_year': 'education_details__matriculation_year',
+    'matriculation_percentage': 'education_details__matriculation_percentage',
+    'intermediate_school_name': 'education_details__intermediate_school_name',
+    'intermediate_board': 'education_details__intermediate_board',
+    'intermediate_year': 'education_details__intermediate_year',
+    'intermediate_percentage': 'education_details__intermediate_percentage',
+    'diploma_details': 'education_details__diploma_details',
+}
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class Echo:
+    """File-like object whose write() hands the line back, so csv.writer can feed a generator"""
+
+    def write(self, value):
+        return value
+
+
+def iter_export_rows(queryset):
+    """
+    Yield one dict per student, fetched from the database EXPORT_CHUNK_SIZE rows at a time
+    """
+    rows = queryset.order_by('id').values_list(*EXPORT_COLUMNS.values()).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    columns = list(EXPORT_COLUMNS)
+    for row in rows:
+        yield dict(zip(columns, row))
+
+
+def stream_csv(queryset):
+    writer = csv.writer(Echo())
+    yield writer.writerow(list(EXPORT_COLUMNS))
+    for row in iter_export_rows(queryset):
+        yield writer.writerow(['' if value is None else value for value in row.values()])
+
+
+def stream_ndjson(queryset):
+    for row in iter_export_rows(queryset):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+# --------------------------------------------Async streams----------------------------------------------- #
+# Under ASGI a sync generator given to StreamingHttpResponse is collected with sync_to_async(list)
+# before the first byte goes out; these feed it an async iterator instead.
+
+async def aiter_export_rows(queryset):
+    """iter_export_rows over the async ORM"""
+    # values(), not values_list(): the latter's iterable runs its query as soon as it is created,
+    # which aiterator() does on the event loop
+    rows = queryset.order_by('id').values(*EXPORT_COLUMNS.values()).aiterator(chunk_size=EXPORT_CHUNK_SIZE)
+    async for row in rows:
+        yield {column: row[path] for column, path in EXPORT_COLUMNS.items()}
+
+
+async def astream_csv(queryset):
+    writer = csv.writer(Echo())
+    yield writer.writerow(list(EXPORT_COLUMNS))
+    async for row in aiter_export_rows(queryset):
+        yield writer.writerow(['' if value is None else value for value in row.values()])
+
+
+async def astream_ndjson(queryset):
+    async for row in aiter_export_rows(queryset):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
@@ -0,0 +1,67 @@
+import math
+
+from django.db.models import Q
+from rest_framework import serializers
+
+
+# Exact-match query params mapped onto the academic detail columns they filter
+ACADEMIC_FILTER_FIELDS = {
+    'branch': 'academic_details__branch',
+    'batch': 'academic_details__batch',
+    'semester': 'academic_details__semester',
+    'degree': 'academic_details__degree',
+}
+
+TRUE_VALUES = ('true', '1', 'yes')
+FALSE_VALUES = ('false', '0', 'no')
+
+
+def _parse_cpi(params, key):
+    value = params.get(key)
+    if value in (None, ''):
+        return None
+    try:
+        cpi = float(value)
+    except ValueError:
+        cpi = math.nan
+    # float() also accepts 'nan' and 'inf'; NaN would slip past the min > max check into the query
+    if not math.isfinite(cpi):
+        raise serializers.ValidationError({key: f"'{value}' is not a valid number"})
+    return cpi
+
+
+def filter_students(queryset, params):
+    """
+    Narrow a CustomUser queryset with the roster query params so the filtering runs in SQL
+    Supported: branch, batch, semester, degree, min_cpi, max_cpi, is_verified, search (name/email prefix)
+    Raises ValidationError for malformed values
+    """
+    for param, lookup in ACADEMIC_FILTER_FIELDS.items():
+        value = params.get(param)
+        if value:
+            queryset = queryset.filter(**{lookup: value})
+
+    min_cpi = _parse_cpi(params, 'min_cpi')
+    max_cpi = _parse_cpi(params, 'max_cpi')
+    if min_cpi is not None and max_cpi is not None and min_cpi > max_cpi:
+        raise serializers.ValidationError({'min_cpi': "min_cpi cannot be greater than max_cpi"})
+    if min_cpi is not None:
+        queryset = queryset.filter(academic_details__cpi__gte=min_cpi)
+    if max_cpi is not None:
+        queryset = queryset.filter(academic_details__cpi__lte=max_cpi)
+
+    is_verified = params.get('is_verified')
+    if is_verified:
+        if is_verified.lower() in TRUE_VALUES:
+            queryset = queryset.filter(is_verified=True)
+        elif is_verified.lower() in FALSE_VALUES:
+            queryset = queryset.filter(is_verified=False)
+        else:
+            raise serializers.ValidationError({'is_verified': "Expected true or false"})
+
+    # Prefix match keeps the lookup index-friendly, unlike a contains scan
+    search = params.get('search', '').strip()
+    if search:
+        queryset = queryset.filter(Q(full_name__istartswith=search) | Q(username__istartswith=search))
+
+    return queryset
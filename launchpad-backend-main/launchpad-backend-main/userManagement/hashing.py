@@ -0,0 +1,140 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+
+# Verified when the account does not exist, so unknown and known usernames take as long to reject
+_DUMMY_ENCODED = None
+
+_pool = None
+_pool_lock = threading.Lock()
+_slots = None
+
+
+class HashingBusy(Exception):
+    """More logins are waiting for the hashing pool than LOGIN_HASH_QUEUE_SIZE allows"""
+
+
+def _init_worker(settings_module):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+
+
+def _verify(password, encoded):
+    """
+    Runs in a pool process: (password matches, re-hashed password if the hasher settings changed)
+    """
+    if not check_password(password, encoded):
+        return False, None
+    try:
+        must_update = identify_hasher(encoded).must_update(encoded)
+    except ValueError:
+        must_update = False
+    return True, make_password(password) if must_update else None
+
+
+def spawn_pool(workers):
+    """Process pool whose workers are fresh interpreters with Django set up"""
+    # spawn, not fork: forking a threaded server can copy a held lock into the child
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context('spawn'),
+        initializer=_init_worker, initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'launchpad.settings'),),
+    )
+
+
+def _get_pool():
+    global _pool, _slots
+    workers = getattr(settings, 'LOGIN_HASH_WORKERS', os.cpu_count())
+    if not workers:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = spawn_pool(workers)
+            _slots = threading.BoundedSemaphore(workers * getattr(settings, 'LOGIN_HASH_QUEUE_SIZE', 8))
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _dummy_encoded():
+    global _DUMMY_ENCODED
+    if _DUMMY_ENCODED is None:
+        _DUMMY_ENCODED = make_password('launchpad-dummy-password')
+    return _DUMMY_ENCODED
+
+
+def _submit(password, encoded):
+    pool = _get_pool()
+    if pool is None:
+        return None, None
+    slots = _slots
+    if not slots.acquire(blocking=False):
+        raise HashingBusy()
+    try:
+        future = pool.submit(_verify, password, encoded)
+    except BrokenProcessPool:
+        slots.release()
+        _discard_pool(pool)
+        return None, None
+    future.add_done_callback(lambda _: slots.release())
+    return pool, future
+
+
+def verify_password(password, encoded):
+    """
+    Check password against an encoded hash in the hashing pool, blocking the calling thread
+    Hashes inline when LOGIN_HASH_WORKERS is 0. Returns (matches, new encoded hash or None).
+    """
+    encoded = encoded or _dummy_encoded()
+    pool, future = _submit(password, encoded)
+    if future is None:
+        return _verify(password, encoded)
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        return _verify(password, encoded)
+
+
+async def averify_password(password, encoded):
+    """verify_password for async views: awaits the pool without holding a thread"""
+    encoded = encoded or _dummy_encoded()
+    pool, future = _submit(password, encoded)
+    if future is None:
+        return await sync_to_async(_verify, thread_sensitive=False)(password, encoded)
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        return await sync_to_async(_verify, thread_sensitive=False)(password, encoded)
+
+
+def hash_passwords(passwords, pool=None):
+    """
+    make_password for each password, spread over pool (default: the login hashing pool)
+    PBKDF2 is CPU bound, so threads would serialize on the GIL. Hashes inline when there is no pool.
+    """
+    shared = pool is None
+    pool = _get_pool() if shared else pool
+    if pool is None or len(passwords) < 2:
+        return [make_password(password) for password in passwords]
+    try:
+        return list(pool.map(make_password, passwords, chunksize=max(1, len(passwords) // 32)))
+    except BrokenProcessPool:
+        if not shared:
+            raise
+        _discard_pool(pool)
+        return [make_password(password) for password in passwords]
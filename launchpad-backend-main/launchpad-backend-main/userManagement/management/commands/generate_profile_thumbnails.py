@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from userManagement.models import CustomUser
+from userManagement.thumbnails import generate_thumbnails
+
+
+class Command(BaseCommand):
+    help = "Generate profile picture thumbnails for users that don't have them yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Regenerate thumbnails for every user with a picture")
+
+    def handle(self, *args, **options):
+        users = CustomUser.objects.exclude(profile_picture='').exclude(profile_picture__isnull=True)  # type: ignore
+        if not options['force']:
+            users = users.filter(profile_picture_thumbnails={})
+        generated = failed = 0
+        for user_id in users.values_list('id', flat=True).iterator():
+            try:
+                if generate_thumbnails(user_id):
+                    generated += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"User {user_id}: {e}")
+        self.stdout.write(self.style.SUCCESS(f"Generated thumbnails for {generated} users, {failed} failed"))
@@ -0,0 +1,37 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from userManagement.onboarding import DEFAULT_CHUNK_SIZE, import_students, read_roster
+
+
+class Command(BaseCommand):
+    help = "Bulk onboard students with academic and education details from a CSV or XLSX roster"
+
+    def add_arguments(self, parser):
+        parser.add_argument('roster', help="Path to a .csv or .xlsx file")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows inserted per transaction")
+        parser.add_argument('--workers', type=int, default=None, help="Password hashing processes (default: the shared LOGIN_HASH_WORKERS pool; 1 hashes inline)")
+        parser.add_argument('--dry-run', action='store_true', help="Validate the roster without creating anything")
+
+    def handle(self, *args, **options):
+        path = options['roster']
+        if not os.path.exists(path):
+            raise CommandError(f"Roster file '{path}' does not exist")
+
+        with open(path, 'rb') as roster:
+            try:
+                result = import_students(
+                    list(read_roster(roster, path)),
+                    chunk_size=options['chunk_size'], workers=options['workers'], dry_run=options['dry_run'],
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+
+        for error in result['errors']:
+            details = '; '.join(f"{column}: {message}" for column, message in error['errors'].items())
+            self.stderr.write(f"Row {error['row']} ({error['email'] or 'no email'}): {details}")
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f"{result['valid']} rows valid, {len(result['errors'])} rows with errors"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Created {result['created']} students, {len(result['errors'])} rows with errors"))
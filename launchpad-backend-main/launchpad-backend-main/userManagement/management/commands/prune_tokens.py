@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from userManagement.blacklist import prune_expired_tokens
+from userManagement.throttling import prune_throttle_buckets
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired outstanding and blacklisted JWT refresh tokens in batches, and login throttle "
+        "buckets that have refilled. "
+        "Schedule it (e.g. daily from cron); REFRESH_TOKEN_LIFETIME is long, so the tables grow otherwise."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Tokens deleted per statement batch")
+
+    def handle(self, *args, **options):
+        outstanding, blacklisted = prune_expired_tokens(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {outstanding} expired outstanding tokens and {blacklisted} blacklist entries"
+        ))
+        self.stdout.write(self.style.SUCCESS(f"Deleted {prune_throttle_buckets()} refilled throttle buckets"))
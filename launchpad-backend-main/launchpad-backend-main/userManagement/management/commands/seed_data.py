@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from userManagement.models import CustomUser
+from userManagement.seeding import DEFAULT_COUNTS, SEED_DOMAIN, flush_seed_data, scaled_counts, seed_dataset
+
+
+class Command(BaseCommand):
+    help = "Generate a reproducible benchmark dataset of students, skills, resumes, job posts and applications"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0, help="Multiplier on the default counts (1.0 = 20k students)")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed; the same seed and counts give the same data")
+        parser.add_argument('--flush', action='store_true', help="Delete previously seeded data first")
+        parser.add_argument('--allow-production', action='store_true', help="Seed even though DEBUG is off")
+        for name in DEFAULT_COUNTS:
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, dest=name, help=f"Override the number of {name.replace('_', ' ')}")
+
+    def handle(self, *args, **options):
+        # Seeded students share one published password; keep them out of real databases
+        if not settings.DEBUG and not options['allow_production']:
+            raise CommandError("Refusing to seed with DEBUG off; pass --allow-production if this database is disposable")
+        if options['flush']:
+            deleted = flush_seed_data()
+            self.stdout.write(f"Deleted {deleted} seeded rows")
+        elif CustomUser.objects.filter(username__endswith=f'@{SEED_DOMAIN}').exists():  # type: ignore
+            raise CommandError("Seed data already exists; rerun with --flush to replace it")
+
+        counts = scaled_counts(options['scale'], **{name: options[name] for name in DEFAULT_COUNTS})
+        seed_dataset(counts, seed=options['seed'], log=self.stdout.write)
+        self.stdout.write(self.style.SUCCESS(
+            "Seeded " + ', '.join(f"{count} {name.replace('_', ' ')}" for name, count in counts.items())
+        ))
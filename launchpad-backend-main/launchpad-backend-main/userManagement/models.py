@@ -34,10 +34,12 @@ class CustomUserManager(BaseUserManager):
 # Base user model that holds common fields for both user types
 class CustomUser(AbstractBaseUser, PermissionsMixin):
     username = models.EmailField(unique=True)
-    full_name = models.CharField(max_length=30)
+    full_name = models.CharField(max_length=30, db_index=True)
     phone_number = models.CharField(max_length=15, blank=True, null= True)
     father_name = models.CharField(max_length=30, blank=True, null= True)
     profile_picture = models.ImageField(upload_to='profile_picture/', null=True, blank=True)
+    # {size: {format: storage name}} written by userManagement.thumbnails
+    profile_picture_thumbnails = models.JSONField(default=dict, blank=True)
     dob = models.DateTimeField(blank= True, null= True)
     gender = models.CharField(max_length=10, choices=[('male', 'Male'), ('female', 'Female'), ('other', 'Other')])
     github_link = models.URLField(blank=True, null=True)
@@ -47,6 +49,8 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     is_staff = models.BooleanField(default=False)    # type: ignore
     is_verified = models.BooleanField(default=False) # type: ignore
     is_tpcstaff = models.BooleanField(default=False) # type: ignore
+    # Stamped into issued JWTs; bumping it revokes every token issued before (userManagement.authentication)
+    token_version = models.PositiveIntegerField(default=0) # type: ignore
     created_at = models.DateTimeField(auto_now_add=True, blank=True, null=True)
     updated_at = models.DateTimeField(auto_now=True, blank=True, null=True)
 
@@ -54,6 +58,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
 
     objects = CustomUserManager()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The version the auth cache may hold this user under; a bump must drop that entry too
+        instance.stored_token_version = instance.__dict__.get('token_version')
+        return instance
+
     def __str__(self):
         return self.username
 
@@ -67,6 +78,14 @@ class AcademicDetail(BaseModel):
     batch = models.CharField(max_length=100)
     cpi = models.FloatField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['branch', 'batch', 'cpi'], name='academic_branch_batch_cpi_idx'),
+            models.Index(fields=['batch', 'semester'], name='academic_batch_semester_idx'),
+            models.Index(fields=['degree', 'branch'], name='academic_degree_branch_idx'),
+            models.Index(fields=['cpi'], name='academic_cpi_idx'),
+        ]
+
     def __str__(self):
         return f"{self.roll_number}"
 
@@ -87,4 +106,18 @@ class EducationDetail(BaseModel):
     diploma_details = models.CharField(max_length=255, blank=True, null=True)
 
     def __str__(self):
-        return f"{self.user}"
\ No newline at end of file
+        return f"{self.user}"
+
+# Login throttle token bucket (userManagement.throttling), one row per scope and hashed client key
+class ThrottleBucket(models.Model):
+    key = models.CharField(max_length=100, unique=True)
+    tokens = models.FloatField()
+    stamp = models.FloatField()  # time.time() of the last refill
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['stamp'], name='throttle_bucket_stamp_idx'),
+        ]
+
+    def __str__(self):
+        return self.key
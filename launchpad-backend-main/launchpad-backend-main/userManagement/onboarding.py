@@ -0,0 +1,239 @@
+import csv
+import io
+import os
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from .hashing import hash_passwords, spawn_pool
+from .models import CustomUser, AcademicDetail, EducationDetail
+from .signals import students_imported
+
+REQUIRED_COLUMNS = ('email', 'full_name', 'password', 'roll_number', 'degree', 'branch', 'semester', 'batch', 'cpi')
+PROFILE_COLUMNS = ('phone_number', 'father_name', 'gender', 'github_link', 'linkedin_link', 'alternate_email')
+EDUCATION_COLUMNS = (
+    'matriculation_school_name', 'matriculation_board', 'matriculation_year', 'matriculation_percentage',
+    'intermediate_school_name', 'intermediate_board', 'intermediate_year', 'intermediate_percentage',
+)
+GENDERS = ('male', 'female', 'other')
+DEFAULT_CHUNK_SIZE = 500
+
+
+# --------------------------------------------Reading----------------------------------------------- #
+
+def read_roster(file, filename):
+    """
+    Yield one {column: value} dict per data row of a CSV or XLSX roster
+    Header names are lower-cased and stripped; values are stripped strings
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.csv':
+        text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        rows = csv.reader(text)
+    elif extension == '.xlsx':
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("XLSX import needs openpyxl installed; upload a CSV instead")
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+    else:
+        raise ValueError("Roster must be a .csv or .xlsx file")
+
+    header = None
+    for row in rows:
+        values = ['' if value is None else str(value).strip() for value in row]
+        if header is None:
+            header = [value.lower() for value in values]
+            missing = [column for column in REQUIRED_COLUMNS if column not in header]
+            if missing:
+                raise ValueError(f"Roster is missing required columns: {', '.join(missing)}")
+            continue
+        if any(values):
+            yield dict(zip(header, values))
+
+
+# --------------------------------------------Validation----------------------------------------------- #
+
+def _number(value, cast, errors, column, low=None, high=None):
+    try:
+        number = cast(float(value)) if cast is int else cast(value)
+    except (TypeError, ValueError):
+        errors[column] = f"'{value}' is not a valid number"
+        return None
+    if (low is not None and number < low) or (high is not None and number > high):
+        errors[column] = f"must be between {low} and {high}"
+    return number
+
+
+def clean_row(row):
+    """Return (cleaned row, {column: error}) for one roster row"""
+    errors = {}
+    cleaned = {}
+    for column in REQUIRED_COLUMNS:
+        if not row.get(column):
+            errors[column] = "This field is required"
+    email = row.get('email', '').lower()
+    if email:
+        try:
+            validate_email(email)
+        except ValidationError:
+            errors['email'] = "Enter a valid email address"
+    cleaned['email'] = email
+    for column in ('full_name', 'password', 'roll_number', 'degree', 'branch', 'semester', 'batch'):
+        cleaned[column] = row.get(column, '')
+    if row.get('cpi'):
+        cleaned['cpi'] = _number(row['cpi'], float, errors, 'cpi', 0, 10)
+
+    for column in PROFILE_COLUMNS:
+        cleaned[column] = row.get(column) or None
+    if cleaned['gender']:
+        cleaned['gender'] = cleaned['gender'].lower()
+        if cleaned['gender'] not in GENDERS:
+            errors['gender'] = f"must be one of {', '.join(GENDERS)}"
+    else:
+        cleaned['gender'] = ''
+
+    # Education details are optional as a group, but all-or-nothing when given
+    if any(row.get(column) for column in EDUCATION_COLUMNS):
+        for column in EDUCATION_COLUMNS:
+            if not row.get(column):
+                errors[column] = "Required when education details are given"
+            elif column.endswith('_year'):
+                cleaned[column] = _number(row[column], int, errors, column, 1950, 2100)
+            elif column.endswith('_percentage'):
+                cleaned[column] = _number(row[column], float, errors, column, 0, 100)
+            else:
+                cleaned[column] = row[column]
+        cleaned['diploma_details'] = row.get('diploma_details') or None
+        cleaned['has_education'] = True
+    else:
+        cleaned['has_education'] = False
+    return cleaned, errors
+
+
+def validate_roster(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Validate every row before anything is written
+    Returns (valid rows with their line numbers, list of {'row', 'email', 'errors'})
+    """
+    valid, errors = [], []
+    seen_emails, seen_rolls = set(), set()
+    for line, row in enumerate(rows, start=2):
+        cleaned, row_errors = clean_row(row)
+        if cleaned['email'] in seen_emails:
+            row_errors['email'] = "Duplicate email in roster"
+        if cleaned['roll_number'] in seen_rolls:
+            row_errors['roll_number'] = "Duplicate roll number in roster"
+        seen_emails.add(cleaned['email'])
+        seen_rolls.add(cleaned['roll_number'])
+        if row_errors:
+            errors.append({'row': line, 'email': cleaned['email'], 'errors': row_errors})
+        else:
+            valid.append((line, cleaned))
+
+    # Conflicts with existing accounts, checked one chunk per query
+    remaining = []
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start:start + chunk_size]
+        # Roster emails are lower-cased; accounts created elsewhere may not be
+        taken_emails = set(
+            CustomUser.objects.annotate(username_lower=Lower('username'))  # type: ignore
+            .filter(username_lower__in=[row['email'] for _, row in chunk]).values_list('username_lower', flat=True)
+        )
+        taken_rolls = set(AcademicDetail.objects.filter(roll_number__in=[row['roll_number'] for _, row in chunk]).values_list('roll_number', flat=True))  # type: ignore
+        for line, row in chunk:
+            row_errors = {}
+            if row['email'] in taken_emails:
+                row_errors['email'] = "A user with this email already exists"
+            if row['roll_number'] in taken_rolls:
+                row_errors['roll_number'] = "A student with this roll number already exists"
+            if row_errors:
+                errors.append({'row': line, 'email': row['email'], 'errors': row_errors})
+            else:
+                remaining.append((line, row))
+    errors.sort(key=lambda error: error['row'])
+    return remaining, errors
+
+
+# --------------------------------------------Import----------------------------------------------- #
+
+def _insert_chunk(rows, hashes):
+    """Insert users with their academic and education details; returns (users, academic details)"""
+    users = CustomUser.objects.bulk_create([  # type: ignore
+        CustomUser(
+            username=row['email'], password=password, full_name=row['full_name'],
+            **{column: row[column] for column in PROFILE_COLUMNS}
+        )
+        for row, password in zip(rows, hashes)
+    ])
+    # Not every backend returns primary keys from bulk inserts, so resolve them by email
+    ids = dict(CustomUser.objects.filter(username__in=[row['email'] for row in rows]).values_list('username', 'id'))  # type: ignore
+    for user in users:
+        user.pk = ids[user.username]
+
+    academic_details = AcademicDetail.objects.bulk_create([  # type: ignore
+        AcademicDetail(
+            user_id=ids[row['email']], roll_number=row['roll_number'], degree=row['degree'], branch=row['branch'],
+            semester=row['semester'], batch=row['batch'], cpi=row['cpi']
+        )
+        for row in rows
+    ])
+    EducationDetail.objects.bulk_create([  # type: ignore
+        EducationDetail(user_id=ids[row['email']], diploma_details=row['diploma_details'], **{column: row[column] for column in EDUCATION_COLUMNS})
+        for row in rows if row['has_education']
+    ])
+    return users, academic_details
+
+
+def import_students(rows, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, dry_run=False):
+    """
+    Validate a whole roster, then create users in chunked transactions
+    A chunk that hits a database conflict is retried row by row, so one bad row never sinks the batch
+    Returns {'created': int, 'valid': int, 'errors': [...]}
+    """
+    valid, errors = validate_roster(rows, chunk_size)
+    if dry_run or not valid:
+        return {'created': 0, 'valid': len(valid), 'errors': errors}
+
+    # workers=None shares the long-lived login hashing pool; the import_students command may ask
+    # for a pool of its own
+    pool = spawn_pool(workers) if workers and workers > 1 else None
+    try:
+        created = _import_chunks(valid, chunk_size, pool, errors, inline=workers == 1)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    errors.sort(key=lambda error: error['row'])
+    return {'created': created, 'valid': len(valid), 'errors': errors}
+
+
+def _import_chunks(valid, chunk_size, pool, errors, inline=False):
+    created = 0
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start:start + chunk_size]
+        rows_only = [row for _, row in chunk]
+        passwords = [row['password'] for row in rows_only]
+        hashes = [make_password(password) for password in passwords] if inline else hash_passwords(passwords, pool)
+        created_users, created_details = [], []
+        try:
+            with transaction.atomic():
+                created_users, created_details = _insert_chunk(rows_only, hashes)
+        except IntegrityError:
+            for (line, row), password in zip(chunk, hashes):
+                try:
+                    with transaction.atomic():
+                        users, details = _insert_chunk([row], [password])
+                    created_users += users
+                    created_details += details
+                except IntegrityError as e:
+                    errors.append({'row': line, 'email': row['email'], 'errors': {'database': str(e)}})
+        # Announce each committed chunk, so derived data stays consistent even if a later chunk is interrupted
+        if created_users:
+            students_imported.send(sender=CustomUser, users=created_users, academic_details=created_details)
+        created += len(created_users)
+    return created
@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+
+# Keyset pagination over the primary key, so every page is a single indexed range scan
+# and the cursor stays stable while new students are being onboarded.
+class StudentCursorPagination(CursorPagination):
+    ordering = 'id'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
@@ -0,0 +1,267 @@
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AcademicDetail, CustomUser, EducationDetail
+
+# Every seeded account lives under this domain, so --flush can find and remove exactly them
+SEED_DOMAIN = 'launchpad.test'
+SEED_STAFF_USERNAME = f'seed-staff@{SEED_DOMAIN}'
+SEED_PASSWORD = 'launchpad-seed'
+BATCH_SIZE = 2000
+
+# Roughly the shape of one placement season at full scale (--scale 1.0)
+DEFAULT_COUNTS = {
+    'users': 20000,
+    'skills': 100000,
+    'projects': 10000,
+    'internships': 5000,
+    'job_posts': 2000,
+    'applications': 200000,
+    'notifications': 200,
+    'resume_files': 50,
+}
+
+FIRST_NAMES = ['Aarav', 'Aditi', 'Arjun', 'Diya', 'Ishaan', 'Kavya', 'Meera', 'Nikhil', 'Priya', 'Rahul',
+               'Riya', 'Rohan', 'Saanvi', 'Sahil', 'Sneha', 'Tanvi', 'Varun', 'Vihaan', 'Yash', 'Zara']
+LAST_NAMES = ['Agarwal', 'Bose', 'Chopra', 'Das', 'Gupta', 'Iyer', 'Jain', 'Kumar', 'Mehta', 'Nair',
+              'Patel', 'Rao', 'Reddy', 'Shah', 'Sharma', 'Singh', 'Verma']
+BRANCHES = ['CSE', 'ECE', 'ME', 'EE', 'CE', 'IT']
+DEGREES = ['BTech', 'BTech', 'BTech', 'MTech', 'MCA']
+BATCHES = ['2025', '2026', '2027', '2028']
+BOARDS = ['CBSE', 'ICSE', 'State Board']
+# Includes alias spellings on purpose so skill normalization has work to do
+SKILLS = ['python', 'py', 'django', 'drf', 'react', 'reactjs', 'javascript', 'js', 'typescript', 'node.js', 'nodejs',
+          'java', 'c++', 'cpp', 'go', 'golang', 'sql', 'postgresql', 'postgres', 'docker', 'kubernetes', 'aws',
+          'machine learning', 'ml', 'deep learning', 'pandas', 'numpy', 'tailwind css', 'next.js', 'vue', 'git',
+          'linux', 'rust', 'flutter', 'android', 'figma', 'spring boot', 'redis', 'graphql', 'tensorflow']
+DOMAINS = ['web development', 'machine learning', 'data science', 'embedded systems', 'cloud', 'android development',
+           'finance', 'product management', 'devops', 'cybersecurity']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech', 'Hooli',
+             'Pied Piper', 'Soylent Systems', 'Tyrell Analytics', 'Cyberdyne', 'Vandelay Imports']
+POSITIONS = ['Software Engineer', 'Backend Developer', 'Frontend Developer', 'Data Analyst', 'ML Engineer',
+             'SDE Intern', 'DevOps Engineer', 'Product Analyst', 'Embedded Engineer', 'QA Engineer']
+
+
+def scaled_counts(scale=1.0, **overrides):
+    counts = {name: max(1, int(value * scale)) for name, value in DEFAULT_COUNTS.items()}
+    counts['resume_files'] = DEFAULT_COUNTS['resume_files']
+    counts.update({name: value for name, value in overrides.items() if value is not None})
+    return counts
+
+
+def _batches(items, size=BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _dummy_pdf(index):
+    body = f'Seed resume {index}'.encode()
+    return (b'%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n'
+            b'2 0 obj<</Type/Pages/Count 0/Kids[]>>endobj\n% ' + body + b'\n%%EOF\n')
+
+
+def flush_seed_data():
+    """Remove every seeded account (and, through cascades, their records) and the job posts seeded staff made"""
+    from TPCActionCentreManagement.models import JobPost, TPCNotification
+
+    seeded = CustomUser.objects.filter(username__endswith=f'@{SEED_DOMAIN}')  # type: ignore
+    JobPost.objects.filter(created_by__in=seeded).delete()  # type: ignore
+    TPCNotification.objects.filter(created_by__in=seeded).delete()  # type: ignore
+    return seeded.delete()[0]
+
+
+def _create_students(rng, count, password_hash):
+    users, academics, educations = [], [], []
+    for n in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        users.append(CustomUser(
+            username=f'seed{n:06d}@{SEED_DOMAIN}',
+            full_name=f'{first} {last}',
+            password=password_hash,
+            gender=rng.choice(['male', 'female', 'other']),
+            phone_number=f'9{rng.randrange(10 ** 9):09d}',
+            github_link=f'https://github.com/seed{n}' if rng.random() < 0.6 else None,
+            linkedin_link=f'https://linkedin.com/in/seed{n}' if rng.random() < 0.5 else None,
+            is_verified=rng.random() < 0.8,
+        ))
+    for batch in _batches(users):
+        CustomUser.objects.bulk_create(batch)  # type: ignore
+
+    for n, user in enumerate(users):
+        batch_year = rng.choice(BATCHES)
+        academics.append(AcademicDetail(
+            user=user,
+            roll_number=f'SEED{n:06d}',
+            degree=rng.choice(DEGREES),
+            branch=rng.choice(BRANCHES),
+            semester=str(rng.randint(1, 8)),
+            batch=batch_year,
+            cpi=round(min(10.0, max(4.0, rng.gauss(7.5, 1.1))), 2),
+        ))
+        passing_year = int(batch_year) - 4
+        educations.append(EducationDetail(
+            user=user,
+            matriculation_school_name=f'{rng.choice(LAST_NAMES)} Public School',
+            matriculation_board=rng.choice(BOARDS),
+            matriculation_year=passing_year - 2,
+            matriculation_percentage=round(rng.uniform(60, 99), 1),
+            intermediate_school_name=f'{rng.choice(LAST_NAMES)} Senior Secondary School',
+            intermediate_board=rng.choice(BOARDS),
+            intermediate_year=passing_year,
+            intermediate_percentage=round(rng.uniform(60, 99), 1),
+        ))
+    for batch in _batches(academics):
+        AcademicDetail.objects.bulk_create(batch)  # type: ignore
+    for batch in _batches(educations):
+        EducationDetail.objects.bulk_create(batch)  # type: ignore
+    return users
+
+
+def _create_student_records(rng, users, counts):
+    from studentKeyFeatureManagement.models import StoredBlob, StudentInternship, StudentProject, StudentResume, StudentSkill
+    from studentKeyFeatureManagement.storage import blob_storage
+
+    skills = [StudentSkill(related_user=rng.choice(users), skill_name=rng.choice(SKILLS)) for _ in range(counts['skills'])]
+    for batch in _batches(skills):
+        StudentSkill.objects.bulk_create(batch)  # type: ignore
+
+    projects = [
+        StudentProject(
+            related_user=rng.choice(users),
+            project_title=f'{rng.choice(DOMAINS).title()} Project {n}',
+            project_github_link=f'https://github.com/seed/project-{n}',
+            project_summary='Seeded project used for benchmarking.',
+            skills_involved=', '.join(rng.sample(SKILLS, 3)),
+        )
+        for n in range(counts['projects'])
+    ]
+    for batch in _batches(projects):
+        StudentProject.objects.bulk_create(batch)  # type: ignore
+
+    internships = [
+        StudentInternship(
+            student=rng.choice(users),
+            organization_name=rng.choice(COMPANIES),
+            domain=rng.choice(DOMAINS),
+            internship_duration=f'{rng.choice([2, 3, 6])} months',
+            internship_description='Seeded internship used for benchmarking.',
+            approval_status=rng.choice(['Pending', 'Approved', 'Approved', 'Rejected']),
+        )
+        for _ in range(counts['internships'])
+    ]
+    for batch in _batches(internships):
+        StudentInternship.objects.bulk_create(batch)  # type: ignore
+
+    # A small pool of dummy PDFs shared by every resume, exactly as the blob store would dedupe them
+    blob_names = [blob_storage.save(f'seed-resume-{n}.pdf', ContentFile(_dummy_pdf(n))) for n in range(counts['resume_files'])]
+    resumes = [StudentResume(related_user=user, resume_file=rng.choice(blob_names), is_default=True) for user in users]
+    for batch in _batches(resumes):
+        StudentResume.objects.bulk_create(batch)  # type: ignore
+
+    refs = {}
+    for resume in resumes:
+        refs[resume.resume_file.name] = refs.get(resume.resume_file.name, 0) + 1
+    for name, ref_count in refs.items():
+        StoredBlob.objects.get_or_create(name=name, defaults={'size': blob_storage.size(name)})  # type: ignore
+        StoredBlob.objects.filter(name=name).update(ref_count=F('ref_count') + ref_count)  # type: ignore
+    return resumes
+
+
+def _create_placements(rng, users, resumes, counts, staff):
+    from TPCActionCentreManagement.models import JobApplication, JobPost, TPCNotification
+
+    today = date.today()
+    job_posts = []
+    for n in range(counts['job_posts']):
+        branches = rng.sample(BRANCHES, rng.randint(1, 3))
+        job_posts.append(JobPost(
+            comapany_name=rng.choice(COMPANIES),
+            job_description=f'{rng.choice(DOMAINS).title()} role working with ' + ', '.join(rng.sample(SKILLS, 4)) + '.',
+            offered_position=rng.choice(POSITIONS),
+            venue=rng.choice(['Online', 'Campus', 'Bengaluru', 'Hyderabad', 'Pune']),
+            application_deadline=today + timedelta(days=rng.randint(-30, 60)),
+            job_type=rng.choice(['Full Time', 'Internship', 'Internship + PPO']),
+            eligibility=f"CPI {rng.choice(['6.0', '6.5', '7.0', '7.5', '8.0'])} and above, {' / '.join(branches)}",
+            skills_required=', '.join(rng.sample(SKILLS, rng.randint(2, 5))),
+            created_by=staff,
+        ))
+    for batch in _batches(job_posts):
+        JobPost.objects.bulk_create(batch)  # type: ignore
+
+    resume_by_user = {resume.related_user_id: resume for resume in resumes}
+    pairs = set()
+    target = min(counts['applications'], len(users) * len(job_posts))
+    while len(pairs) < target:
+        pairs.add((rng.randrange(len(job_posts)), rng.randrange(len(users))))
+    pairs = sorted(pairs, key=lambda pair: rng.random())
+
+    now = timezone.now()
+    for day, batch in enumerate(_batches(pairs)):
+        applications = JobApplication.objects.bulk_create([  # type: ignore
+            JobApplication(job_post=job_posts[post], student=users[user], resume=resume_by_user.get(users[user].pk))
+            for post, user in batch
+        ])
+        # bulk_create stamps auto_now_add with "now"; spread batches over the last 90 days for the trend views
+        created_at = now - timedelta(days=day % 90, hours=rng.randint(0, 23))
+        JobApplication.objects.filter(pk__in=[application.pk for application in applications]) \
+            .update(created_at=created_at, updated_at=created_at)  # type: ignore
+
+    TPCNotification.objects.bulk_create([  # type: ignore
+        TPCNotification(
+            title=f'{rng.choice(COMPANIES)} drive update {n}',
+            message='Seeded notification used for benchmarking.',
+            target_branch=rng.choice(BRANCHES + ['', '', '']),
+            created_by=staff,
+        )
+        for n in range(counts['notifications'])
+    ])
+    return job_posts
+
+
+def rebuild_derived_data():
+    """Recompute everything signals would have maintained had the rows not been bulk inserted"""
+    from analyticsManagement.rollups import rebuild_rollups
+    from analyticsManagement.snapshot import rebuild_snapshot
+    from studentKeyFeatureManagement.skills import backfill_skills
+    from TPCActionCentreManagement.ranking import invalidate_shortlists
+    from TPCActionCentreManagement.search import reindex_job_posts
+
+    backfill_skills()
+    reindex_job_posts()
+    rebuild_snapshot()
+    rebuild_rollups()
+    invalidate_shortlists()
+
+
+def seed_dataset(counts, seed=0, log=None):
+    """
+    Generate a deterministic dataset (same seed and counts give the same rows) with bulk inserts
+    Returns the created row counts
+    """
+    log = log or (lambda message: None)
+    rng = random.Random(seed)
+    # One hash for every seeded account; hashing 20k passwords separately would take minutes
+    password_hash = make_password(SEED_PASSWORD, salt='launchpadseed')
+
+    with transaction.atomic():
+        staff, _ = CustomUser.objects.get_or_create(  # type: ignore
+            username=SEED_STAFF_USERNAME,
+            # Staff can read every student's data; nobody logs in with the shared seed password as staff
+            defaults={'full_name': 'Seed TPC Staff', 'password': make_password(None), 'is_tpcstaff': True, 'is_verified': True},
+        )
+        log(f"Creating {counts['users']} students")
+        users = _create_students(rng, counts['users'], password_hash)
+        log(f"Creating {counts['skills']} skills, {counts['projects']} projects, {counts['internships']} internships and resumes")
+        resumes = _create_student_records(rng, users, counts)
+        log(f"Creating {counts['job_posts']} job posts and {counts['applications']} applications")
+        _create_placements(rng, users, resumes, counts, staff)
+
+    log("Rebuilding skill links, search index and analytics")
+    rebuild_derived_data()
+    return counts
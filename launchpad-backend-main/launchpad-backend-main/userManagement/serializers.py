@@ -1,15 +1,17 @@
 from .models import *
 from rest_framework import serializers
+from .thumbnails import thumbnail_urls
 
 # Serializer for CustomUser
 class CustomUserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
     profile_picture = serializers.SerializerMethodField()
+    profile_picture_thumbnails = serializers.SerializerMethodField()
 
     class Meta:
         model = CustomUser
         fields = (
-            'username', 'full_name', 'password', 'phone_number', 'father_name', 'profile_picture', 'dob', 'gender', 'alternate_email', 
+            'username', 'full_name', 'password', 'phone_number', 'father_name', 'profile_picture', 'profile_picture_thumbnails', 'dob', 'gender', 'alternate_email', 
             'github_link', 'linkedin_link', 'is_verified', 'is_superuser', 'is_staff', 'is_tpcstaff', 'created_at', 'updated_at'
         )
 
@@ -18,6 +20,9 @@ class CustomUserSerializer(serializers.ModelSerializer):
             return obj.profile_picture.url
         return None
 
+    def get_profile_picture_thumbnails(self, obj):
+        return thumbnail_urls(obj)
+
     def create(self, validated_data):
         password = validated_data.pop('password')
         user = CustomUser.objects.create_user(**validated_data)
@@ -60,11 +65,12 @@ class UserDetailSerializer(serializers.ModelSerializer):
     academic_details = serializers.SerializerMethodField()
     education_details = serializers.SerializerMethodField()
     profile_picture = serializers.SerializerMethodField()
+    profile_picture_thumbnails = serializers.SerializerMethodField()
 
     class Meta:
         model = CustomUser
         fields = (
-            'id', 'username', 'full_name', 'phone_number', 'father_name', 'dob', 'gender', 'profile_picture', 'alternate_email', 
+            'id', 'username', 'full_name', 'phone_number', 'father_name', 'dob', 'gender', 'profile_picture', 'profile_picture_thumbnails', 'alternate_email', 
             'github_link', 'linkedin_link', 'is_verified', 'is_superuser', 'is_staff', 'is_tpcstaff', 'created_at', 'updated_at',
             'academic_details', 'education_details'
         )
@@ -74,6 +80,9 @@ class UserDetailSerializer(serializers.ModelSerializer):
             return obj.profile_picture.url
         return None
 
+    def get_profile_picture_thumbnails(self, obj):
+        return thumbnail_urls(obj)
+
     def get_academic_details(self, obj):
         try:
             academic_detail = obj.academic_details
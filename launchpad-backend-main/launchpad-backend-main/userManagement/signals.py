@@ -0,0 +1,33 @@
+from django.contrib.auth.signals import user_logged_in, user_login_failed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from launchpad.metrics import LOGIN_ATTEMPTS
+from .authentication import forget_user
+from .models import CustomUser
+
+# Sent after a bulk student import, whose bulk_create() inserts bypass post_save
+# Arguments: users (list of CustomUser), academic_details (list of AcademicDetail)
+students_imported = Signal()
+
+
+@receiver(user_logged_in)
+def count_login_success(sender, request, user, **kwargs):
+    LOGIN_ATTEMPTS.labels('success').inc()
+
+
+@receiver(user_login_failed)
+def count_login_failure(sender, credentials, request=None, **kwargs):
+    LOGIN_ATTEMPTS.labels('failure').inc()
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def forget_cached_user(sender, instance, **kwargs):
+    """Profile updates, deactivation and role changes must not be served from the auth cache"""
+    forget_user(instance)
+    # After a token_version bump the entry still cached is the one under the previous version
+    stored = getattr(instance, 'stored_token_version', None)
+    if stored is not None and stored != instance.token_version:
+        forget_user(instance, stored)
+    instance.stored_token_version = instance.token_version
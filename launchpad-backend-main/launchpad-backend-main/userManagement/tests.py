@@ -1,3 +1,140 @@
-from django.test import TestCase
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from .authentication import issue_tokens
+from .blacklist import blacklist_filter
+from .models import CustomUser
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class TokenRefreshTests(APITestCase):
+    def setUp(self):
+        # The filter is per process and would otherwise keep jtis from earlier tests
+        blacklist_filter.reset()
+        self.user = CustomUser.objects.create_user('student@example.com', password='secret', full_name='Student')
+
+    def refresh(self, token):
+        return self.client.post(reverse('token-refresh'), {'refresh': token}, format='json')
+
+    def test_rotation_issues_a_new_pair(self):
+        token = str(issue_tokens(self.user))
+
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.data['refresh'], token)
+        self.assertIn('access', response.data)
+
+    def test_reused_refresh_token_is_refused(self):
+        token = str(issue_tokens(self.user))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.refresh(token).status_code, status.HTTP_200_OK)
+
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['error'], "Invalid refresh token")
+
+    def test_reuse_is_refused_even_when_the_filter_is_stale(self):
+        # The commit hook that tells the filter never runs here, like a rotation in another worker
+        token = str(issue_tokens(self.user))
+        self.assertEqual(self.refresh(token).status_code, status.HTTP_200_OK)
+
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['error'], "Token is blacklisted")
+
+    def test_rotated_token_keeps_working(self):
+        token = str(issue_tokens(self.user))
+        rotated = self.refresh(token).data['refresh']
+
+        response = self.refresh(rotated)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class TokenVersionTests(APITestCase):
+    def setUp(self):
+        blacklist_filter.reset()
+        self.user = CustomUser.objects.create_user('student@example.com', password='secret', full_name='Student')
+        self.refresh_token = issue_tokens(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.refresh_token.access_token}')
+
+    def get_detail(self):
+        return self.client.get(reverse('user-detail', args=[self.user.id]))
+
+    def test_bump_revokes_a_cached_access_token(self):
+        # The first request puts the user in the auth cache
+        self.assertEqual(self.get_detail().status_code, status.HTTP_200_OK)
+
+        self.user.token_version += 1
+        self.user.save()
+
+        self.assertEqual(self.get_detail().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_bump_revokes_refresh_tokens(self):
+        self.user.token_version += 1
+        self.user.save()
+
+        response = self.client.post(reverse('token-refresh'), {'refresh': str(self.refresh_token)}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_tokens_issued_after_the_bump_work(self):
+        self.user.token_version += 1
+        self.user.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {issue_tokens(self.user).access_token}')
+
+        self.assertEqual(self.get_detail().status_code, status.HTTP_200_OK)
+
+    def test_profile_update_drops_the_cached_user(self):
+        self.assertEqual(self.get_detail().status_code, status.HTTP_200_OK)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.get_detail().status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'], LOGIN_HASH_WORKERS=0)
+class LoginThrottleTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user('student@example.com', password='secret', full_name='Student')
+
+    def login(self, email='student@example.com', password='wrong', **extra):
+        return self.client.post(reverse('user-login'), {'email': email, 'password': password}, format='json', **extra)
+
+    def test_sixth_attempt_on_an_account_is_throttled(self):
+        for _ in range(5):
+            self.assertEqual(self.login().status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.login(password='secret')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreater(int(response['Retry-After']), 0)
+
+    def test_account_bucket_ignores_email_case(self):
+        for email in ('student@example.com', 'Student@example.com', 'STUDENT@example.com', 'student@example.com', ' student@example.com'):
+            self.login(email=email)
+
+        self.assertEqual(self.login().status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_other_accounts_are_not_throttled(self):
+        for _ in range(5):
+            self.login()
+
+        self.assertEqual(self.login(email='other@example.com').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(LOGIN_THROTTLE_BUCKETS={'login_ip': (2, 1 / 60)})
+    def test_forwarded_for_does_not_pick_a_new_ip_bucket(self):
+        # No trusted proxies by default, so the header must not change the client's identity
+        for i in range(2):
+            self.login(email=f'user{i}@example.com', HTTP_X_FORWARDED_FOR=f'10.0.0.{i}')
+
+        response = self.login(email='user2@example.com', HTTP_X_FORWARDED_FOR='10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
@@ -0,0 +1,86 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.functions import Greatest, Least
+from django.db.models.lookups import GreaterThanOrEqual
+from rest_framework.throttling import BaseThrottle
+
+from .models import ThrottleBucket
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket per client key: up to `capacity` requests in a burst, refilled at `refill_rate`
+    tokens per second. Buckets are configured in settings.LOGIN_THROTTLE_BUCKETS[scope] as
+    (capacity, refill_rate); a scope missing from it is not throttled. Bucket state is a
+    ThrottleBucket row, so every worker spends from the same bucket.
+    """
+    scope = None
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self.retry_after = None
+        bucket = getattr(settings, 'LOGIN_THROTTLE_BUCKETS', {}).get(self.scope)
+        ident = self.get_cache_key(request, view)
+        if bucket is None or ident is None:
+            return True
+        capacity, refill_rate = bucket
+        # Hashed: idents are client-chosen and unbounded in length
+        key = f'{self.scope}:{hashlib.sha256(ident.encode()).hexdigest()}'
+
+        now = time.time()
+        available = Least(
+            Value(float(capacity)),
+            F('tokens') + Greatest(Value(now) - F('stamp'), Value(0.0)) * Value(float(refill_rate)),
+        )
+        # Refill and take a token in one conditional UPDATE; the database applies it atomically, so
+        # concurrent workers can never spend the same token twice
+        buckets = ThrottleBucket.objects.filter(key=key)  # type: ignore
+        spend = buckets.filter(GreaterThanOrEqual(available, 1))
+        if spend.update(tokens=available - 1, stamp=now):
+            return True
+
+        row = buckets.values_list('tokens', 'stamp').first()
+        if row is None:
+            # First request from this client: start a full bucket (a concurrent request may beat us
+            # to it, hence ignore_conflicts) and spend from it
+            ThrottleBucket.objects.bulk_create([ThrottleBucket(key=key, tokens=capacity, stamp=now)], ignore_conflicts=True)  # type: ignore
+            if spend.update(tokens=available - 1, stamp=now):
+                return True
+            row = buckets.values_list('tokens', 'stamp').first()
+        tokens = min(capacity, row[0] + max(0.0, now - row[1]) * refill_rate)
+        self.retry_after = max(0.0, (1 - tokens) / refill_rate)
+        return False
+
+    def wait(self):
+        return self.retry_after
+
+
+class LoginIPThrottle(TokenBucketThrottle):
+    scope = 'login_ip'
+
+    def get_cache_key(self, request, view):
+        # REMOTE_ADDR unless REST_FRAMEWORK['NUM_PROXIES'] says how many X-Forwarded-For hops to trust
+        return self.get_ident(request)
+
+
+class LoginAccountThrottle(TokenBucketThrottle):
+    scope = 'login_account'
+
+    def get_cache_key(self, request, view):
+        username = request.data.get('email') if hasattr(request.data, 'get') else None
+        if not username or not isinstance(username, str):
+            return None
+        return username.strip().lower()
+
+
+def prune_throttle_buckets():
+    """Delete buckets that have refilled completely; a missing bucket counts as full. Returns rows deleted."""
+    buckets = getattr(settings, 'LOGIN_THROTTLE_BUCKETS', {}).values()
+    longest_refill = max((capacity / refill_rate for capacity, refill_rate in buckets), default=0)
+    deleted, _ = ThrottleBucket.objects.filter(stamp__lt=time.time() - longest_refill).delete()  # type: ignore
+    return deleted
@@ -0,0 +1,125 @@
+import hashlib
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+
+from .models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+# Longest edge in pixels for each exposed size
+THUMBNAIL_SIZES = {
+    'small': 64,
+    'medium': 160,
+    'large': 400,
+}
+THUMBNAIL_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+THUMBNAIL_DIR = 'profile_picture/thumbs'
+
+# Pillow releases the GIL while decoding and resampling, so a small thread pool keeps this off the request
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='thumbnails')
+
+
+def _thumbnail_name(user_id, source_name, size, extension):
+    # The source name is part of the path, so a new upload never collides with cached thumbnails
+    source_key = hashlib.sha1(source_name.encode()).hexdigest()[:12]
+    return f'{THUMBNAIL_DIR}/{user_id}/{source_key}-{size}.{extension}'
+
+
+def render_thumbnails(source_file):
+    """
+    Yield (size, extension, bytes) for every size and format of an image
+    EXIF orientation is applied to the pixels and the metadata itself is dropped
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source_file) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        for size, edge in THUMBNAIL_SIZES.items():
+            thumbnail = image.copy()
+            thumbnail.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            for extension, (pil_format, options) in THUMBNAIL_FORMATS.items():
+                buffer = io.BytesIO()
+                # No exif= argument, so nothing from the original metadata is written
+                thumbnail.save(buffer, pil_format, **options)
+                yield size, extension, buffer.getvalue()
+
+
+def delete_thumbnails(thumbnails):
+    for formats in (thumbnails or {}).values():
+        for name in formats.values():
+            default_storage.delete(name)
+
+
+def generate_thumbnails(user_id):
+    """
+    Build every thumbnail for a user's current picture and record their names
+    Returns the thumbnail mapping, or None when the user has no picture
+    """
+    user = CustomUser.objects.filter(pk=user_id).only('id', 'profile_picture', 'profile_picture_thumbnails').first()  # type: ignore
+    if user is None or not user.profile_picture:
+        return None
+    source_name = user.profile_picture.name
+
+    thumbnails = {}
+    with user.profile_picture.open('rb') as source_file:
+        for size, extension, data in render_thumbnails(source_file):
+            name = _thumbnail_name(user.pk, source_name, size, extension)
+            if default_storage.exists(name):
+                default_storage.delete(name)
+            thumbnails.setdefault(size, {})[extension] = default_storage.save(name, ContentFile(data))
+
+    # Only record them if the picture was not replaced while we were rendering
+    updated = CustomUser.objects.filter(pk=user.pk, profile_picture=source_name).update(profile_picture_thumbnails=thumbnails)  # type: ignore
+    if not updated:
+        delete_thumbnails(thumbnails)
+        return None
+    # Drop thumbnails of the previous picture
+    current = {name for formats in thumbnails.values() for name in formats.values()}
+    for formats in (user.profile_picture_thumbnails or {}).values():
+        for name in formats.values():
+            if name not in current:
+                default_storage.delete(name)
+    return thumbnails
+
+
+def _generate_in_background(user_id):
+    close_old_connections()
+    try:
+        generate_thumbnails(user_id)
+    except Exception:
+        logger.exception("Thumbnail generation failed for user %s", user_id)
+    finally:
+        close_old_connections()
+
+
+def schedule_thumbnails(user):
+    """Queue thumbnail generation for after the current transaction commits"""
+    user_id = user.pk
+    transaction.on_commit(lambda: _executor.submit(_generate_in_background, user_id))
+
+
+def thumbnail_urls(user):
+    """Map each size to its WebP and JPEG URLs; None until thumbnails exist"""
+    thumbnails = user.profile_picture_thumbnails
+    if not thumbnails or not user.profile_picture:
+        return None
+    return {
+        size: {extension: default_storage.url(name) for extension, name in formats.items()}
+        for size, formats in thumbnails.items()
+    }
@@ -1,19 +1,40 @@
 from .models import CustomUser
 from rest_framework import status
 from rest_framework.views import APIView
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
-from django.contrib.auth import authenticate, login
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import login
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_login_failed
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from .authentication import CachedJWTAuthentication, issue_tokens
+from .blacklist import FilteredRefreshToken
+from .hashing import HashingBusy, averify_password, verify_password
+from .throttling import LoginAccountThrottle, LoginIPThrottle
 from .serializers import CustomUserSerializer, UserDetailSerializer, UserUpdateSerializer
+from .pagination import StudentCursorPagination
+from launchpad.asyncapi import AsyncAPIView, AsyncReadAPIView
+from .filters import filter_students
+from .exports import astream_csv, astream_ndjson, stream_csv, stream_ndjson
+from .onboarding import import_students, read_roster
+from .thumbnails import schedule_thumbnails
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 
 # Create your views here.
 
 
 # --------------------------------------------User login api View----------------------------------------------- #
 
-class UserLoginView(APIView):
+class UserLoginView(AsyncAPIView):
+    # Token buckets reject floods before any password hashing happens
+    throttle_classes = [LoginIPThrottle, LoginAccountThrottle]
+
     def post(self, request):
         username = request.data.get('email')
         password = request.data.get('password')
@@ -21,13 +42,60 @@ class UserLoginView(APIView):
         if not username or not password:
             return Response({"error": "email and password are required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        user = authenticate(request, username=username, password=password)
+        user = self.find_user(username)
+        try:
+            # PBKDF2 runs in the hashing pool (userManagement.hashing), not on this worker
+            matches, rehashed = verify_password(password, user.password if user else None)
+        except HashingBusy:
+            return self.busy_response()
+        return self.login_response(request, username, user if matches else None, rehashed)
+
+    async def apost(self, request):
+        username = request.data.get('email')
+        password = request.data.get('password')
+
+        if not username or not password:
+            return Response({"error": "email and password are required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        user = await sync_to_async(self.find_user)(username)
+        try:
+            matches, rehashed = await averify_password(password, user.password if user else None)
+        except HashingBusy:
+            return self.busy_response()
+        return await sync_to_async(self.login_response)(request, username, user if matches else None, rehashed)
+
+    @staticmethod
+    def find_user(username):
+        try:
+            return CustomUser._default_manager.get_by_natural_key(username)
+        except CustomUser.DoesNotExist:
+            return None
+
+    @staticmethod
+    def busy_response():
+        response = Response({
+            "error": "Too many logins in progress",
+            "detail": "Please try again in a few seconds"
+        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        response['Retry-After'] = '1'
+        return response
+
+    def login_response(self, request, username, user, rehashed):
+        # Same outcome as authenticate() with ModelBackend: inactive accounts fail like a wrong password
+        if user is not None and not ModelBackend().user_can_authenticate(user):
+            user = None
+        if user is None:
+            user_login_failed.send(sender=__name__, credentials={'username': username}, request=request)
+        elif rehashed:
+            # The password hasher settings changed since this hash was made
+            user.password = rehashed
+            user.save(update_fields=['password'])
 
         if user:
             if not user.is_active:
                 return Response({"error": "Your account is not active. Contact admin for activation."}, status=status.HTTP_403_FORBIDDEN)
 
-            refresh = RefreshToken.for_user(user)
+            refresh = issue_tokens(user)
             login(request, user)
             
             # Handle profile_picture safely
@@ -83,7 +151,7 @@ class LogoutView(APIView):
             
             # Validate and blacklist the token
             try:
-                token = RefreshToken(refresh_token)
+                token = FilteredRefreshToken(refresh_token)
                 token.blacklist()
                 
                 return Response({
@@ -106,54 +174,51 @@ class LogoutView(APIView):
 
 #--------------------------------------------Token Refresh View----------------------------------------------- #
 
-# class TokenRefreshView(APIView):
-#     def post(self, request):
-#         """
-#         Get a new access token using refresh token
-#         """
-#         try:
-#             refresh_token = request.data.get("refresh")
-            
-#             # Validate that refresh token is provided
-#             if not refresh_token:
-#                 return Response({
-#                     "error": "Refresh token is required",
-#                     "detail": "Please provide a valid refresh token in the request body"
-#                 }, status=status.HTTP_400_BAD_REQUEST)
-            
-#             # Validate and generate new access token
-#             try:
-#                 token = RefreshToken(refresh_token)
-                
-#                 # Check if token is blacklisted
-#                 if token.blacklist():
-#                     return Response({
-#                         "error": "Token is blacklisted",
-#                         "detail": "This refresh token has been invalidated"
-#                     }, status=status.HTTP_401_UNAUTHORIZED)
-                
-#                 # Generate new access token
-#                 new_access_token = token.access_token
-                
-#                 return Response({
-#                     "message": "New access token generated successfully",
-#                     "access": str(new_access_token),
-#                     "refresh": str(token),  # Return the same refresh token
-#                     "token_type": "Bearer",
-#                     "expires_in": 3600  # 1 hour in seconds
-#                 }, status=status.HTTP_200_OK)
-                
-#             except Exception as token_error:
-#                 return Response({
-#                     "error": "Invalid refresh token",
-#                     "detail": "The provided refresh token is invalid or expired"
-#                 }, status=status.HTTP_401_UNAUTHORIZED)
-                
-#         except Exception as e:
-#             return Response({
-#                 "error": "An error occurred during token refresh",
-#                 "detail": str(e)
-#             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+class TokenRefreshView(APIView):
+    def post(self, request):
+        """
+        Exchange a refresh token for a new access/refresh pair; the old refresh token is blacklisted
+        """
+        refresh_token = request.data.get("refresh")
+
+        # Validate that refresh token is provided
+        if not refresh_token:
+            return Response({
+                "error": "Refresh token is required",
+                "detail": "Please provide a valid refresh token in the request body"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # Signature, expiry and the in-memory blacklist filter; no query for a valid token
+            token = FilteredRefreshToken(refresh_token)
+            # Through the auth cache: rejects inactive users and tokens revoked by a token_version bump
+            user = CachedJWTAuthentication().get_cached_user(token)
+        except (TokenError, AuthenticationFailed, InvalidToken):
+            return Response({
+                "error": "Invalid refresh token",
+                "detail": "The provided refresh token is invalid, expired or revoked"
+            }, status=status.HTTP_401_UNAUTHORIZED)
+
+        with transaction.atomic():
+            _, created = token.blacklist()
+            if not created:
+                # Already rotated or logged out (possibly in another worker): refuse to reuse it
+                transaction.set_rollback(True)
+                return Response({
+                    "error": "Token is blacklisted",
+                    "detail": "This refresh token has been invalidated"
+                }, status=status.HTTP_401_UNAUTHORIZED)
+            # A fresh pair also picks up the user's current token version and role claims
+            refresh = issue_tokens(user)
+
+        access = refresh.access_token
+        return Response({
+            "message": "New access token generated successfully",
+            "access": str(access),
+            "refresh": str(refresh),
+            "token_type": "Bearer",
+            "expires_in": int(access.lifetime.total_seconds())
+        }, status=status.HTTP_200_OK)
 
 
 #--------------------------------------------Non TPC Staff List View----------------------------------------------- #
@@ -163,7 +228,9 @@ class StudentListView(APIView):
 
     def get(self, request):
         """
-        Get list of all users whose is_tpcstaff is False
+        Get cursor-paginated list of users whose is_tpcstaff is False
+        Use ?page_size= to size the page and follow the returned next/previous links
+        Filters: branch, batch, semester, degree, min_cpi, max_cpi, is_verified, search
         """
 
         if not request.user.is_tpcstaff:
@@ -173,18 +240,37 @@ class StudentListView(APIView):
             }, status=status.HTTP_403_FORBIDDEN)
 
         try:
-            # Filter users where is_tpcstaff is False
-            students = CustomUser.objects.filter(is_tpcstaff=False)
-            
-            # Serialize the queryset with academic and educational details
-            serializer = UserDetailSerializer(students, many=True)
+            # Filter users where is_tpcstaff is False, joining both one-to-one details in the same query
+            students = CustomUser.objects.filter(is_tpcstaff=False).select_related(
+                'academic_details', 'education_details'
+            )
+            students = filter_students(students, request.query_params)
+
+            # Fetch a single keyset page instead of the whole table
+            paginator = StudentCursorPagination()
+            page = paginator.paginate_queryset(students, request, view=self)
+
+            # Serialize the page with academic and educational details
+            serializer = UserDetailSerializer(page, many=True)
             
             return Response({
                 "message": "Non TPC staff users retrieved successfully",
                 "count": len(serializer.data),
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
                 "users": serializer.data
             }, status=status.HTTP_200_OK)
-            
+
+        except ValidationError as e:
+            return Response({
+                "error": "Invalid filter parameters",
+                "detail": e.detail
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except NotFound:
+            return Response({
+                "error": "Invalid cursor",
+                "detail": "The provided cursor is malformed or no longer valid"
+            }, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({
                 "error": "An error occurred while retrieving users",
@@ -192,9 +278,111 @@ class StudentListView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+#--------------------------------------------Student Export View----------------------------------------------- #
+
+class StudentExportView(AsyncReadAPIView):
+    permission_classes = [IsAuthenticated]
+
+    # file_type -> (sync stream, async stream, content type, extension)
+    EXPORT_FORMATS = {
+        'csv': (stream_csv, astream_csv, 'text/csv', 'csv'),
+        'ndjson': (stream_ndjson, astream_ndjson, 'application/x-ndjson', 'ndjson'),
+    }
+
+    def get(self, request):
+        """
+        Stream the student roster with academic and educational details as CSV or NDJSON
+        Accepts ?file_type=csv|ndjson plus the same filters as the student list
+        """
+        return self.export(request, asynchronous=False)
+
+    async def aget(self, request):
+        # An async iterator, so ASGI sends rows as they are read instead of buffering the whole export
+        return self.export(request, asynchronous=True)
+
+    def export(self, request, asynchronous):
+        if not request.user.is_tpcstaff:
+            return Response({
+                "error": "You are not authorized to access this resource",
+                "detail": "Only TPC staff users can access this resource"
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        file_type = request.query_params.get('file_type', 'csv').lower()
+        if file_type not in self.EXPORT_FORMATS:
+            return Response({
+                "error": "Invalid file type",
+                "detail": f"file_type must be one of: {', '.join(self.EXPORT_FORMATS)}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            students = filter_students(CustomUser.objects.filter(is_tpcstaff=False), request.query_params)
+        except ValidationError as e:
+            return Response({
+                "error": "Invalid filter parameters",
+                "detail": e.detail
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        stream, astream, content_type, extension = self.EXPORT_FORMATS[file_type]
+        response = StreamingHttpResponse((astream if asynchronous else stream)(students), content_type=content_type)
+        filename = f"students-{timezone.now():%Y%m%d-%H%M%S}.{extension}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+#--------------------------------------------Student Import View----------------------------------------------- #
+
+class StudentImportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Bulk onboard students from an uploaded CSV/XLSX roster (multipart field 'file')
+        All rows are validated first; valid rows are created and invalid ones reported per row
+        Pass dry_run=true to validate without creating anything; imports are capped at
+        STUDENT_IMPORT_MAX_ROWS rows, larger rosters go through the import_students command
+        """
+
+        if not request.user.is_tpcstaff:
+            return Response({
+                "error": "You are not authorized to access this resource",
+                "detail": "Only TPC staff users can import students"
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        roster = request.FILES.get('file')
+        if roster is None:
+            return Response({
+                "error": "Roster file is required",
+                "detail": "Upload a .csv or .xlsx file in the 'file' field"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = str(request.data.get('dry_run', '')).lower() in ('true', '1', 'yes')
+        try:
+            rows = list(read_roster(roster, roster.name))
+            if not dry_run and len(rows) > settings.STUDENT_IMPORT_MAX_ROWS:
+                return Response({
+                    "error": "Roster too large",
+                    "detail": f"At most {settings.STUDENT_IMPORT_MAX_ROWS} rows can be imported per request; "
+                              f"split the file or run `python manage.py import_students` for bigger rosters"
+                }, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            result = import_students(rows, dry_run=dry_run)
+        except ValueError as e:
+            return Response({
+                "error": "Invalid roster file",
+                "detail": str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "message": "Roster validated" if dry_run else "Students imported",
+            "created": result['created'],
+            "valid": result['valid'],
+            "error_count": len(result['errors']),
+            "errors": result['errors']
+        }, status=status.HTTP_200_OK if dry_run or not result['created'] else status.HTTP_201_CREATED)
+
+
 #--------------------------------------------User Detail View----------------------------------------------- #
 
-class UserDetailView(APIView):
+class UserDetailView(AsyncReadAPIView):
     def get(self, request, user_id):
         """
         Get user by ID with complete data including academic and educational details
@@ -209,7 +397,7 @@ class UserDetailView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             # Get user by ID
-            user = CustomUser.objects.get(id=user_id)
+            user = CustomUser.objects.select_related('academic_details', 'education_details').get(id=user_id)  # type: ignore
             
             # Serialize the user with complete details
             serializer = UserDetailSerializer(user)
@@ -230,6 +418,35 @@ class UserDetailView(APIView):
                 "detail": str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    async def aget(self, request, user_id):
+        """
+        Async ORM variant of get; the one-to-one details are joined up front because
+        lazy relation access is not allowed from async code
+        """
+
+        try:
+            user = await CustomUser.objects.select_related(
+                'academic_details', 'education_details'
+            ).aget(id=user_id)
+
+            serializer = UserDetailSerializer(user)
+
+            return Response({
+                "message": "User details retrieved successfully",
+                "user": serializer.data
+            }, status=status.HTTP_200_OK)
+
+        except ObjectDoesNotExist:
+            return Response({
+                "error": f"User with ID '{user_id}' does not exist",
+                "detail": "The requested user was not found in the database"
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response({
+                "error": "An error occurred while retrieving user details",
+                "detail": str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 
 #--------------------------------------------User Update View----------------------------------------------- #
 
@@ -243,8 +460,8 @@ class UserUpdateView(APIView):
         """
         
         try:
-            # Get the current authenticated user
-            user = request.user
+            # request.user may be a cached copy; save the current row so stale fields aren't written back
+            user = CustomUser.objects.get(id=request.user.id)  # type: ignore
             
             # Serialize the user data for update
             serializer = UserUpdateSerializer(user, data=request.data, partial=True)
@@ -252,6 +469,10 @@ class UserUpdateView(APIView):
             if serializer.is_valid():
                 # Save the updated user
                 serializer.save()
+
+                # Resize a newly uploaded picture off the request thread
+                if 'profile_picture' in serializer.validated_data and user.profile_picture:
+                    schedule_thumbnails(user)
                 
                 # Return the updated user data
                 updated_user = CustomUser.objects.get(id=user.id)